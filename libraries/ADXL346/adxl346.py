@@ -22,6 +22,7 @@ Copyright 2022 - 2023 quectel
 
 import utime
 from machine import I2C,Pin
+from usr.regmap import RegMap, s16le
 
 # register address
 REG_DEVID			= 0x00	# Device ID
@@ -84,54 +85,29 @@ class CustomError(Exception):
         return self.errorinfo
 
 
-class Adxl346(object):
+class Adxl346(RegMap):
+    READ_DELAY = 1
+
     def __init__(self,i2c,dev_addr=0x53):
-        self._i2c = i2c
+        super().__init__(i2c, dev_addr, 6)
         self._dev_addr = dev_addr
 
-        if self._read_data(REG_DEVID,1)[0] != 0xE6:
+        if self.read_u8(REG_DEVID) != 0xE6:
             raise CustomError("device id err.")
-        self._write_data(REG_DATA_FORMAT, 0x08)     # High level interrupt output, 13 bit resolution, right aligned output data, 2g range
-        self._write_data(REG_BW_RATE,BW_SEL_100)    # 100Hz
-        self._write_data(REG_POWER_CTL,0x08)        # Measurement mode
-        self._write_data(REG_INT_ENABLE,0x00)       # Interrupt not enabled
-        self._write_data(REG_OFSX, 0x00)
-        self._write_data(REG_OFSY, 0x00)
-        self._write_data(REG_OFSZ, 0x00)
-
-    def _read_data(self, regaddr, datalen):
-        '''
-        i2c read data
-        :param regaddr: register address
-        :param datalen: read data length
-        :return: data
-        '''
-        r_data = bytearray(datalen)
-        reg_addres = bytearray([regaddr])
-        self._i2c.read(self._dev_addr, reg_addres, 1, r_data, datalen, 1)
-        ret_data = list(r_data)
-        return ret_data
-
-    def _write_data(self, regaddr, data):
-        '''
-        i2c write data
-        :param regaddr: register address
-        :param datalen: data to write
-        '''
-        addr = bytearray([regaddr])
-        w_data = bytearray([data])
-        self._i2c.write(self._dev_addr, addr, len(addr), w_data, len(w_data))
+        self.write_u8(REG_DATA_FORMAT, 0x08)     # High level interrupt output, 13 bit resolution, right aligned output data, 2g range
+        self.write_u8(REG_BW_RATE,BW_SEL_100)    # 100Hz
+        self.write_u8(REG_POWER_CTL,0x08)        # Measurement mode
+        self.write_u8(REG_INT_ENABLE,0x00)       # Interrupt not enabled
+        self.write_u8(REG_OFSX, 0x00)
+        self.write_u8(REG_OFSY, 0x00)
+        self.write_u8(REG_OFSZ, 0x00)
 
     def set_range(self,range=range_2g):
         '''
         Configure sensor range,REG_DATA_FORMAT 0-1bit
         :param range: acceleration range, default 2g
         '''
-        value = self._read_data(REG_DATA_FORMAT, 1)[0]
-        value &= 0xF0
-        value |= range
-        value |= 0x08
-        self._write_data(REG_DATA_FORMAT, value)
+        self.update_bits(REG_DATA_FORMAT, 0x0F, range | 0x08)
 
     @property
     def _resolution(self):
@@ -139,31 +115,23 @@ class Adxl346(object):
         Obtain the range of the accelerometer.
         :return: range_2_G, range_4_G, range_8_G,, range_16_G.
         """
-        range = self._read_data(REG_DATA_FORMAT, 1)[0]
-        range &= 0x03
-        return range
+        return self.read_field(REG_DATA_FORMAT, 0x03)
 
     def read_acceleration(self):
         """
         read acceleration
         @return x y and z axis acceleration values, in g
         """
-        data = self._read_data(REG_DATAX0,6)
         accel_range = self._resolution
+        data = self.read_regs(REG_DATAX0, 6)
+        if data is None:
+            raise CustomError("read acceleration failed.")
 
         mult = 0.004
 
-        x = data[0] | (data[1] << 8)
-        if (x & (1 << 16 - 1)):
-            x = x - (1 << 16)
-
-        y = data[2] | (data[3] << 8)
-        if (y & (1 << 16 - 1)):
-            y = y - (1 << 16)
-
-        z = data[4] | (data[5] << 8)
-        if (z & (1 << 16 - 1)):
-            z = z - (1 << 16)
+        x = s16le(data, 0)
+        y = s16le(data, 2)
+        z = s16le(data, 4)
 
         x = x * mult
         y = y * mult
@@ -197,9 +165,7 @@ class Adxl346(object):
         Clear an interrupt enable
         @param int_code: value to write into the interrupt enable register
         '''
-        r_data = self._read_data(REG_INT_ENABLE, 1)[0]
-        w_data = r_data & ~int_code
-        self._write_data(REG_INT_ENABLE,w_data)
+        self.clear_bits(REG_INT_ENABLE, int_code)
 
     def int_enable(self,int_code,tap_thr=0x30, dur=0x20,tap_axis=0x07 ,laten=0x15,window=0xff,ff_thr=0x06,
                    ff_time=0x15,act_thr=0x03,act_axis=0xf0,inact_thr=0x03,inact_axis=0x0f,inact_time=3):
@@ -209,64 +175,62 @@ class Adxl346(object):
         @return:  -1:fail  0:success
         '''
         self.clear_int(int_code)    # Clear this bit before enabling, follow the datasheet
-        r_data = self._read_data(REG_INT_ENABLE, 1)[0]
-        w_data = r_data | int_code
         if int_code == SING_TAP_INT:
-            self._write_data(REG_THRESH_TAP, tap_thr)  # default 0x30
-            self._write_data(REG_DUR,dur)          # default 0x20，>0x10
-            self._write_data(REG_TAP_AXES, tap_axis)  # default 0x07
+            self.write_u8(REG_THRESH_TAP, tap_thr)  # default 0x30
+            self.write_u8(REG_DUR,dur)          # default 0x20，>0x10
+            self.write_u8(REG_TAP_AXES, tap_axis)  # default 0x07
             # print('single_tap set suceess! ')
         elif int_code == DOUB_TAP_INT:
-            self._write_data(REG_THRESH_TAP, tap_thr)  # default 0x30
-            self._write_data(REG_DUR, dur)         # default 0x20，>0x10
-            self._write_data(REG_TAP_AXES, tap_axis)  # default 0x07
-            self._write_data(REG_Latent,laten)       # default 0x15
-            self._write_data(REG_Window,window)       # default 0xff
+            self.write_u8(REG_THRESH_TAP, tap_thr)  # default 0x30
+            self.write_u8(REG_DUR, dur)         # default 0x20，>0x10
+            self.write_u8(REG_TAP_AXES, tap_axis)  # default 0x07
+            self.write_u8(REG_Latent,laten)       # default 0x15
+            self.write_u8(REG_Window,window)       # default 0xff
             # print('double_tap set suceess! ')
         elif int_code == FF_INT:
-            self._write_data(REG_THRESH_FF, ff_thr)  # default 0x06
-            self._write_data(REG_TIME_FF, ff_time)    # default 0x15, 0x14 to 0x46
+            self.write_u8(REG_THRESH_FF, ff_thr)  # default 0x06
+            self.write_u8(REG_TIME_FF, ff_time)    # default 0x15, 0x14 to 0x46
             # print('ff set suceess! ')
         elif int_code ==ACT_INT:
-            self._write_data(REG_THRESH_ACT, act_thr)  # default 0x03
-            self._write_data(REG_ACT_INACT_CTL, act_axis)  # Default setting for xyz three-axis AC coupling
+            self.write_u8(REG_THRESH_ACT, act_thr)  # default 0x03
+            self.write_u8(REG_ACT_INACT_CTL, act_axis)  # Default setting for xyz three-axis AC coupling
             # print('act_int set suceess! ')
         elif int_code == INACT_INT:
-            self._write_data(REG_THRESH_INACT, inact_thr)  # default 0x03
-            self._write_data(REG_ACT_INACT_CTL, inact_axis)  # Default setting for xyz three-axis AC coupling
-            self._write_data(REG_TIME_INACT, inact_time)  # default 0x03
+            self.write_u8(REG_THRESH_INACT, inact_thr)  # default 0x03
+            self.write_u8(REG_ACT_INACT_CTL, inact_axis)  # Default setting for xyz three-axis AC coupling
+            self.write_u8(REG_TIME_INACT, inact_time)  # default 0x03
             # print('inact_int set suceess! ')
         else:
             # print('int enable failed.check int_code.')
             return -1
-        if self._write_data(REG_INT_ENABLE,w_data):
+        if self.set_bits(REG_INT_ENABLE, int_code):
             raise CustomError("int enable failed.")
         return 0
 
     def process_single_tap(self):
         while 1:
-            r_data = self._read_data(REG_INT_SOURCE,1)[0]
+            r_data = self.read_u8(REG_INT_SOURCE) or 0   # a failed read counts as no flag, keep polling
             if r_data & SING_TAP_INT:
                 return 1
             utime.sleep_ms(20)
 
     def process_double_tap(self):
         while 1:
-            r_data = self._read_data(REG_INT_SOURCE,1)[0]
+            r_data = self.read_u8(REG_INT_SOURCE) or 0
             if r_data & DOUB_TAP_INT:
                 return 1
             utime.sleep_ms(20)
 
     def process_act(self):
         while 1:
-            r_data = self._read_data(REG_INT_SOURCE,1)[0]
+            r_data = self.read_u8(REG_INT_SOURCE) or 0
             if r_data & ACT_INT:
                 return 1
             utime.sleep_ms(20)
 
     def process_inact(self):
         while 1:
-            r_data = self._read_data(REG_INT_SOURCE,1)[0]
+            r_data = self.read_u8(REG_INT_SOURCE) or 0
             # print(r_data)
             if r_data & INACT_INT:
                 return 1
@@ -274,7 +238,7 @@ class Adxl346(object):
 
     def process_ff(self):
         while 1:
-            r_data = self._read_data(REG_INT_SOURCE,1)[0]
+            r_data = self.read_u8(REG_INT_SOURCE) or 0
             if r_data & FF_INT:
                 return 1
             utime.sleep_ms(20)
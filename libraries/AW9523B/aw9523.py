@@ -42,6 +42,8 @@ from queue import Queue
 from machine import ExtInt
 from usr.logging import Logger
 from usr.common import create_thread
+from usr.regmap import RegCache
+from usr.busmgr import share, HIGH
 
 log = Logger(__name__)
 
@@ -56,6 +58,9 @@ _AW9523_REG_LEDMODE = (0x12)  # Register for configuring  current
 _AW9523_REG_INPUT0 = (0x00)  # Register for reading input values
 _AW9523_REG_OUTPUT0 = (0x02)  # Register for writing output values
 _AW9523_REG_CONFIG0 = (0x04)  # Register for configuring direction
+# Registers the chip never changes by itself, eligible for the shadow cache
+_AW9523_CACHED = (_AW9523_REG_OUTPUT0, _AW9523_REG_OUTPUT0 + 1, _AW9523_REG_CONFIG0, _AW9523_REG_CONFIG0 + 1,
+                  _AW9523_REG_INTENABLE0, _AW9523_REG_INTENABLE0 + 1, _AW9523_REG_GCR)
 
 
 class Port():
@@ -68,19 +73,33 @@ class Port():
             return reg + self._port
 
     def _flip_property_bit(self, reg, condition, bit):
-        if condition:
-            setattr(self, reg, getattr(self, reg) | bit)
-        else:
-            setattr(self, reg, getattr(self, reg) & ~bit)
+        # 读-改-写期间持有总线,其他线程修改同一寄存器的其他位不会丢失
+        with self._aw._i2c:
+            old = getattr(self, reg)
+            new = old | bit if condition else old & ~bit
+            # 开启缓存时值未变化则不写入
+            if new != old or self._aw._shadow is None:
+                setattr(self, reg, new)
 
     def _read(self, reg):
-        r_data = bytearray(1)
-        self._aw._i2c.read(self._aw._address, bytearray([self._which_reg(reg)]), 1, r_data, 1, 0)
-        return list(r_data)[0]
+        aw = self._aw
+        if aw._shadow is not None:
+            val = aw._shadow.get(self._which_reg(reg))
+        else:
+            val = aw._read_reg(self._which_reg(reg))
+        return 0 if val is None else val
 
     def _write(self, reg, val):
         val &= 0xff
-        self._aw._i2c.write(self._aw._address, bytearray([self._which_reg(reg)]), 1, bytearray([val]), 1)
+        aw = self._aw
+        addr = self._which_reg(reg)
+        with aw._i2c:
+            ret = aw._i2c.write(aw._address, bytearray([addr]), 1, bytearray([val]), 1)
+            if aw._shadow is not None:
+                if ret == 0:
+                    aw._shadow.store(addr, val)
+                else:
+                    aw._shadow.invalidate(addr)
 
     @property
     def mode(self):
@@ -120,15 +139,21 @@ class AW9523:
     #                 [0x20 + pin - 8 for pin in range(8, 12)] +
     #                 [0x2C + pin - 12 for pin in range(12, 16)])
 
-    def __init__(self, i2c_bus, int_pin=1, int_mode=0, int_callback=None, address=_AW9523_DEFAULT_ADDR_KEY):
-        self._i2c = i2c_bus
+    def __init__(self, i2c_bus, int_pin=1, int_mode=0, int_callback=None, address=_AW9523_DEFAULT_ADDR_KEY, cache=False):
+        """
+        cache: True时开启寄存器影子缓存,方向、输出、中断使能寄存器的读-改-写不再读取芯片
+        i2c_bus: busmgr句柄或busmgr创建的i2c对象(自行创建的对象用busmgr.share(i2c, port=...)包装),按busmgr共享句柄访问,中断线程与其他线程的传输不会交错
+        """
+        self._i2c = share(i2c_bus, 'aw9523')
         self._int_pin = int_pin
         self._int_mode = int_mode
         self._address = address
         self._int_callback = int_callback
         self.__ext_thread_id = None
         self.__ext_queue = Queue()
+        self._int_buf = bytearray(1)    # 中断线程专用,不与主线程共用read_buf
         self._ret = 0x001F   # 接收电平状态
+        self._shadow = RegCache(self._read_reg, _AW9523_CACHED) if cache else None
 
         if self._address == _AW9523_DEFAULT_ADDR_KEY:
             self._extint = ExtInt(self._int_pin, ExtInt.IRQ_RISING_FALLING, ExtInt.PULL_PU, self.__extfun)
@@ -157,10 +182,12 @@ class AW9523:
             # 读取两组电平，判断触发了中断的io,中断信号前后电平对比
             # status_0 = self._read(_AW9523_REG_INPUT0)
             # status_1 = self._read(_AW9523_REG_INPUT0 + 1)
-            self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INPUT0, 0xff)), 1, self.read_buf, 1, 20)
-            status_0 = self.read_buf[0]
-            self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INPUT0 + 1, 0xff)), 1, self.read_buf, 1, 20)
-            status_1 = self.read_buf[0]
+            # 中断服务优先获得总线,两组电平在一次加锁内读出
+            with self._i2c.batch(HIGH):
+                self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INPUT0, 0xff)), 1, self._int_buf, 1, 20)
+                status_0 = self._int_buf[0]
+                self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INPUT0 + 1, 0xff)), 1, self._int_buf, 1, 20)
+                status_1 = self._int_buf[0]
             status = (status_1 << 8) | status_0
             # log.debug('### io level {} ###'.format(bin(status)))
 
@@ -186,11 +213,15 @@ class AW9523:
                 #判断是否该IO是否中断使能
                 # flag_0 = self._read(_AW9523_REG_INTENABLE0)
                 # flag_1 = self._read(_AW9523_REG_INTENABLE0 + 1)
-                self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INTENABLE0, 0xff)), 1, self.read_buf, 1, 20)
-                flag_0 = self.read_buf[0]
-                self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INTENABLE0 + 1, 0xff)), 1, self.read_buf, 1, 20)
-                flag_1 = self.read_buf[0]
-                flag = (flag_1 << 8) | flag_0
+                if self._shadow is not None:
+                    flag = self.interrupt_enable
+                else:
+                    with self._i2c.batch(HIGH):
+                        self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INTENABLE0, 0xff)), 1, self._int_buf, 1, 20)
+                        flag_0 = self._int_buf[0]
+                        self._i2c.read(_AW9523_DEFAULT_ADDR_KEY, bytearray((_AW9523_REG_INTENABLE0 + 1, 0xff)), 1, self._int_buf, 1, 20)
+                        flag_1 = self._int_buf[0]
+                    flag = (flag_1 << 8) | flag_0
                 if flag & (1 << byte) == 0:
                     list_push = [byte, pin_level]
                     self._int_callback(list_push)
@@ -203,9 +234,34 @@ class AW9523:
         self._i2c.read(self._address, bytearray([addr]), 1, r_data, 1, 20)
         return list(r_data)[0]
 
+    def _read_reg(self, addr):
+        # 中断线程也会调用,不共用缓冲
+        r_data = bytearray(1)
+        if self._i2c.read(self._address, bytearray([addr]), 1, r_data, 1, 0) != 0:
+            return None
+        return r_data[0]
+
     def _write(self, addr, *vals):
         # log.debug("write vals:", vals)
-        self._i2c.write(self._address, bytearray([addr]), 1, bytearray(list(vals)), len(list(vals)))
+        with self._i2c:
+            ret = self._i2c.write(self._address, bytearray([addr]), 1, bytearray(list(vals)), len(list(vals)))
+            if self._shadow is not None:
+                if addr == _AW9523_REG_SOFTRESET:
+                    # 软复位后寄存器恢复默认值
+                    self._shadow.invalidate()
+                for i in range(len(vals)):
+                    if ret == 0:
+                        self._shadow.store(addr + i, vals[i])
+                    else:
+                        self._shadow.invalidate(addr + i)
+
+    def resync(self):
+        """
+        从芯片重新读取影子缓存(芯片复位或被其他途径改写后调用),未开启缓存时直接返回0
+        """
+        if self._shadow is None:
+            return 0
+        return self._shadow.resync()
 
     def reset(self):
         self._write(_AW9523_REG_SOFTRESET, 0x00)  # 对该寄存器写 00H 复位 reset
@@ -21,6 +21,7 @@ Copyright 2022 - 2022 quectel
 '''
 from machine import I2C
 import utime as time
+from usr.regmap import RegMap, u16le
 
 # I2C Address
 HDC2080_ADDRESS =                       0x40    # 1000000 
@@ -46,70 +47,57 @@ class CustomError(Exception):
         return self.errorinfo
 
 
-class Hdc2080(object):
+_RESULT_DELAY = 50  # i2c.read delay(ms) used when reading measurement results
+
+
+class Hdc2080(RegMap):
     '''
     HDC2080 class
     '''
     def __init__(self,i2c,addr=HDC2080_ADDRESS):
-        self._i2c = i2c
+        super().__init__(i2c, addr, 4)
         self._i2c_addr = addr
 
         time.sleep_ms(15)
-        manu_id = (self._read_data(HDC2080_MANUID_H,1)[0] << 8) | self._read_data(HDC2080_MANUID_L,1)[0]
+        manu_id = self.read_u16(HDC2080_MANUID_L)
         # print(manu_id)
         if manu_id != 0x5449:
             raise CustomError("HDC2080 manu id err.")
 
-        self._write_data(HDC2080_MEASURE_CONF,[0x00])
+        self.write_u8(HDC2080_MEASURE_CONF, 0x00)
         time.sleep_ms(15)
         print("sensor init complete.")
 
-    def _write_data(self, reg, data):
-        self._i2c.write(self._i2c_addr,
-                           bytearray([reg]), len([reg]),
-                           bytearray(data), len(data))
-
-    def _read_data(self,reg, length):
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self._i2c.read(self._i2c_addr,
-                          bytearray([reg]), len([reg]),
-                          r_data, length,
-                          0)
-        return list(r_data)
-
-    def _read_data_delay(self,reg, length):
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self._i2c.read(self._i2c_addr,
-                          bytearray([reg]), len([reg]),
-                          r_data, length,
-                          50)
-        return list(r_data)
-
     def reset(self):
-        self._write_data(HDC2080_RESET, [0x80])
+        self.write_u8(HDC2080_RESET, 0x80)
+
+    def _read_result(self, reg, n):
+        data = self.read_regs(reg, n, _RESULT_DELAY)
+        if data is None:
+            raise CustomError("HDC2080 read err.")
+        return data
 
     def read_temperature(self):
-        tem_h = self._read_data_delay(HDC2080_TEMPERATURE_H, 1)[0]
-        tem_l = self._read_data_delay(HDC2080_TEMPERATURE_L, 1)[0]
-        tem_data = (tem_h << 8) | tem_l
+        tem_data = u16le(self._read_result(HDC2080_TEMPERATURE_L, 2))
         tem = (tem_data / 65536) * 165 - 40.5
         return tem
 
     def read_humidity(self):
-        hum_h = self._read_data_delay(HDC2080_HUMIDITY_H,1)[0]
-        hum_l = self._read_data_delay(HDC2080_HUMIDITY_L,1)[0]
-        hum_data = (hum_h << 8) | hum_l
+        hum_data = u16le(self._read_result(HDC2080_HUMIDITY_L, 2))
         hum = (hum_data / 65536) * 100
         return hum
 
     def read(self):
-        self._write_data(HDC2080_MEASURE_CONF,[0x01]) #MEAS_TRIG bit
+        self.write_u8(HDC2080_MEASURE_CONF, 0x01) #MEAS_TRIG bit
         while 1:
-            drdy = self._read_data(HDC2080_DRDYANDINT,1)[0] & 0x80 #data ready
+            drdy = self.read_u8(HDC2080_DRDYANDINT)
+            if drdy is None:
+                raise CustomError("HDC2080 read err.")
+            drdy &= 0x80 #data ready
             if drdy:
-                tem = self.read_temperature()
-                hum = self.read_humidity()
+                # temperature and humidity registers are adjacent, read them in one burst
+                data = self._read_result(HDC2080_TEMPERATURE_L, 4)
+                tem = (u16le(data, 0) / 65536) * 165 - 40.5
+                hum = (u16le(data, 2) / 65536) * 100
                 return (hum,tem)
 
@@ -255,15 +255,13 @@ cyan = 0x867d           # 青色
 
 from machine import LCD
 from machine import Pin
+from usr.LCD import fill_rect
+from usr.LCDTile import TileRenderer, FillItem, TextItem
 
 
 def fill(lcd, x_s, y_s, x_e, y_e, color):
-    tmp = color.to_bytes(2, 'little')
-    count = (x_e - x_s + 1) * (y_e - y_s + 1)
-
-    color_buf = tmp * count
-
-    lcd.lcd_write(color_buf, x_s, y_s, x_e, y_e)
+    # 800x1280整屏需要2MB,按4KB条带重复发送同一块纯色缓冲
+    fill_rect(lcd, x_s, y_s, x_e, y_e, color)
 
 
 # gpio1 = Pin(Pin.GPIO27, Pin.OUT, Pin.PULL_PU, 1)
@@ -283,6 +281,19 @@ def show():
     fill(mipilcd,0,800,800,960,cyan)
     fill(mipilcd,0,960,800,1120,blue)
     fill(mipilcd,0,1120,800,1280,purple)
+
+def show_tiles(frames=100):
+    # 整帧2MB无法缓存,按64x64分块渲染,每帧只发送内容变化的块,内存只需一块8KB的块缓冲
+    tiles = TileRenderer(mipilcd, 800, 1280)
+    colors = (white, red, orange, yellow, green, cyan, blue, purple)
+    for i in range(8):
+        tiles.add(FillItem(0, i * 160, 799, i * 160 + 159, colors[i]))
+    bar = tiles.add(FillItem(0, 600, 0, 639, black))
+    label = tiles.add(TextItem(16, 16, '', black, white, 24))
+    for n in range(frames):
+        bar.set(0, 600, n * 8 % 800, 639, black)
+        label.set_text('frame {} tiles {}'.format(n, tiles.tiles_sent))
+        tiles.render()
 # mipilcd.lcd_clear(red)
 
 while 1:
@@ -295,4 +306,6 @@ while 1:
     utime.sleep(2)
     show()
     utime.sleep(2)
+    show_tiles()
+    utime.sleep(2)
 
@@ -12,7 +12,464 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from usr import LCDPublic
+_STRIPE_SIZE = 4096     # 单次lcd_write的最大字节数,用于刷新帧缓冲和填充
+_MAX_DIRTY = 8          # 脏矩形的最大数量,超过后与代价最小的矩形合并
+_stripes = {}           # 按长度缓存的条带缓冲区,避免每次刷新重新分配
+_stripe_colors = {}     # 条带缓冲区当前填充的纯色,内容不是纯色时不在表中
+
+
+def _fill16(mv, color, size):
+    '''
+    用RGB565颜色填充memoryview的前size字节,按倍增方式复制,不产生临时对象
+    '''
+    mv[0] = color & 0xff
+    mv[1] = color >> 8
+    n = 2
+    while n < size:
+        m = min(n, size - n)
+        mv[n:n + m] = mv[0:m]
+        n += m
+
+
+def _stripe(size, color=None):
+    '''
+    获取长度为size的可复用条带缓冲区
+    :param color: 不为None时保证缓冲区已填充为该颜色,颜色未变化时不会重新填充
+    '''
+    buf = _stripes.get(size)
+    if buf is None:
+        if len(_stripes) >= 4:
+            _stripes.clear()
+            _stripe_colors.clear()
+        buf = bytearray(size)
+        _stripes[size] = buf
+    if color is None:
+        _stripe_colors.pop(size, None)
+    elif _stripe_colors.get(size) != color:
+        _fill16(memoryview(buf), color, size)
+        _stripe_colors[size] = color
+    return buf
+
+
+def fill_rect(lcd, x_s, y_s, x_e, y_e, color, stripe_size=_STRIPE_SIZE):
+    '''
+    按行带填充矩形,Peripheral_LCD和MIPI屏(JD9365、ST7701等)共用
+    纯色条带只填充一次,之后逐个行带重复发送,内存占用不超过stripe_size(单行超过时为一行)
+    :param lcd: machine.LCD对象
+    :param x_s: 起始x坐标
+    :param y_s: 起始y坐标
+    :param x_e: 结束x坐标
+    :param y_e: 结束y坐标
+    :param color: color
+    :param stripe_size: 单次lcd_write的最大字节数
+    '''
+    n = (x_e - x_s + 1) * 2
+    rows = min(max(1, stripe_size // n), y_e - y_s + 1)
+    buf = _stripe(n * rows, color)
+    y = y_s
+    while y + rows - 1 <= y_e:
+        lcd.lcd_write(buf, x_s, y, x_e, y + rows - 1)
+        y += rows
+    if y <= y_e:
+        lcd.lcd_write(_stripe(n * (y_e - y + 1), color), x_s, y, x_e, y_e)
+
+
+_STR_BYTES = len('移') == 3  # 固件未开启unicode时str按UTF-8字节存储,一个汉字占3个元素
+_TEXT_FONTS = {             # 字高 -> (ASCII字体宽高, 汉字字体宽高)
+    16: ((8, 16), (16, 16)),
+    24: ((16, 24), (24, 24)),
+}
+_GLYPH_BUDGET = 16 * 1024  # 字形缓存默认内存预算(字节)
+_luts = {}                 # (fc, bc) -> 16项半字节展开表,每项为4个像素共8字节
+_ramps = {}                # (fc, bc) -> 16级过渡色表,每项为1个像素共2字节
+
+
+def _load_ascii_8x16():
+    from usr.font_ascii_8x16 import ascii_8x16_dict
+    return ascii_8x16_dict
+
+
+def _load_ascii_16x24():
+    from usr.font_ascii_16x24 import ascii_16x24_dict
+    return ascii_16x24_dict
+
+
+def _load_hanzi_16x16():
+    from usr.font_hanzi_16x16 import hanzi_16x16_dict
+    return hanzi_16x16_dict
+
+
+def _load_hanzi_16x24():
+    from usr.font_hanzi_16x24 import hanzi_16x24_dict
+    return hanzi_16x24_dict
+
+
+def _load_hanzi_24x24():
+    from usr.font_hanzi_24x24 import hanzi_24x24_dict
+    return hanzi_24x24_dict
+
+
+# 内置字库按尺寸拆分为独立模块,首次使用时才导入,不使用文字的产品不必在启动时构造字库
+_FONT_LOADERS = {
+    ('ascii', 8, 16): _load_ascii_8x16,
+    ('ascii', 16, 24): _load_ascii_16x24,
+    ('hanzi', 16, 16): _load_hanzi_16x16,
+    ('hanzi', 16, 24): _load_hanzi_16x24,
+    ('hanzi', 24, 24): _load_hanzi_24x24,
+}
+_builtin_fonts = {}
+
+
+def _builtin_font(key):
+    '''
+    获取内置字库,第一次使用时导入对应的字库模块,没有该尺寸时返回None
+    '''
+    font = _builtin_fonts.get(key)
+    if font is None:
+        loader = _FONT_LOADERS.get(key)
+        if loader is None:
+            return None
+        font = loader()
+        _builtin_fonts[key] = font
+    return font
+
+
+def preload_fonts(keys=None):
+    '''
+    预先导入内置字库,可在空闲时调用以避免首次显示文字时的加载延时
+    :param keys: [('ascii', 8, 16), ('hanzi', 16, 16), ...],为None时导入全部内置字库
+    '''
+    if keys is None:
+        keys = list(_FONT_LOADERS)
+    for key in keys:
+        _builtin_font(tuple(key))
+
+
+def _chars(text):
+    '''
+    按字符拆分字符串,兼容按UTF-8字节存储str的固件
+    '''
+    if not _STR_BYTES:
+        return text
+    chars = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = ord(text[i])
+        if c < 0x80:
+            k = 1
+        elif c < 0xE0:
+            k = 2
+        elif c < 0xF0:
+            k = 3
+        else:
+            k = 4
+        chars.append(text[i:i + k])
+        i += k
+    return chars
+
+
+def _text_width(text, size):
+    '''
+    文字的像素宽度,ASCII与汉字的字宽见_TEXT_FONTS,size为ShowText的字高
+    '''
+    aw = _TEXT_FONTS[size][0][0]
+    hw = _TEXT_FONTS[size][1][0]
+    w = 0
+    for ch in _chars(text):
+        w += aw if len(ch) == 1 and ord(ch) < 0x80 else hw
+    return w
+
+
+def _nibble_lut(fc, bc):
+    '''
+    获取(前景色, 背景色)对应的半字节展开表,每4个点阵位对应8字节RGB565数据
+    '''
+    key = (fc, bc)
+    lut = _luts.get(key)
+    if lut is None:
+        if len(_luts) >= 8:
+            _luts.clear()
+        f = fc.to_bytes(2, 'little')
+        b = bc.to_bytes(2, 'little')
+        lut = bytearray(128)
+        for n in range(16):
+            for j in range(4):
+                o = n * 8 + j * 2
+                lut[o:o + 2] = f if (n << j) & 0x08 else b
+        _luts[key] = lut
+    return lut
+
+
+def _render_glyph(ch_buf, fc, bc):
+    '''
+    将1bpp字模(阴码、逐行、高位在前)展开为RGB565数据
+    '''
+    lut = memoryview(_nibble_lut(fc, bc))
+    buf = bytearray(len(ch_buf) * 16)
+    mv = memoryview(buf)
+    o = 0
+    for v in ch_buf:
+        h = (v >> 4) * 8
+        l = (v & 0x0f) * 8
+        mv[o:o + 8] = lut[h:h + 8]
+        mv[o + 8:o + 16] = lut[l:l + 8]
+        o += 16
+    return buf
+
+
+def _alpha_ramp(fc, bc):
+    '''
+    获取(前景色, 背景色)对应的16级过渡色表,第a项为前景色占a/15时各通道混合后的RGB565(低字节在前)
+    '''
+    key = (fc, bc)
+    ramp = _ramps.get(key)
+    if ramp is None:
+        if len(_ramps) >= 8:
+            _ramps.clear()
+        fr, fg, fb = fc >> 11, (fc >> 5) & 0x3F, fc & 0x1F
+        br, bg, bb = bc >> 11, (bc >> 5) & 0x3F, bc & 0x1F
+        ramp = bytearray(32)
+        for a in range(16):
+            k = 15 - a
+            r = (fr * a + br * k + 7) // 15
+            g = (fg * a + bg * k + 7) // 15
+            b = (fb * a + bb * k + 7) // 15
+            ramp[a * 2:a * 2 + 2] = ((r << 11) | (g << 5) | b).to_bytes(2, 'little')
+        _ramps[key] = ramp
+    return ramp
+
+
+def _render_glyph4(ch_buf, fc, bc):
+    '''
+    将4bpp抗锯齿字模(逐行、每字节2个像素、高半字节在前)展开为RGB565数据,每个像素查一次过渡色表
+    '''
+    ramp = memoryview(_alpha_ramp(fc, bc))
+    buf = bytearray(len(ch_buf) * 4)
+    mv = memoryview(buf)
+    o = 0
+    for v in ch_buf:
+        h = (v >> 4) * 2
+        l = (v & 0x0f) * 2
+        mv[o:o + 2] = ramp[h:h + 2]
+        mv[o + 2:o + 4] = ramp[l:l + 2]
+        o += 4
+    return buf
+
+
+def _glyph_width(font, xsize):
+    '''
+    字形渲染后每行的像素数:1bpp字模每行补齐到8像素,4bpp字模每行补齐到2像素
+    '''
+    if getattr(font, 'bpp', 1) == 4:
+        return (xsize + 1) & ~1
+    return (xsize + 7) & ~7
+
+
+def _cached_glyph(cache, font, ch, fc, bc):
+    '''
+    从字形缓存cache中取出已渲染的字符,未命中时按字库的bpp渲染后放入缓存,字库中没有该字符时返回None
+    '''
+    key = (id(font), ch, fc, bc)
+    buf = cache.get(key)
+    if buf is None:
+        ch_buf = font.get(ch)
+        if ch_buf is None:
+            return None
+        if getattr(font, 'bpp', 1) == 4:
+            buf = _render_glyph4(ch_buf, fc, bc)
+        else:
+            buf = _render_glyph(ch_buf, fc, bc)
+        cache.put(key, buf)
+    return buf
+
+
+def _compose_run(glyphs, ysize, width, fc, bc, cache):
+    '''
+    将一行字形合成为一块按行存放的RGB565缓冲
+    :param glyphs: [(字库, 字符, 字宽), ...],字库为None或字库中没有的字符显示为背景色
+    :param width: 行的最大宽度,超出部分按像素裁剪
+    :param cache: 字形缓存GlyphCache
+    :return: (缓冲, 像素宽度),宽度为0时缓冲为None
+    '''
+    total = 0
+    for g in glyphs:
+        total += g[2]
+    w = min(total, width)
+    if w <= 0:
+        return None, 0
+    stride = w * 2
+    buf = bytearray(stride * ysize)
+    mv = memoryview(buf)
+    c = 0
+    for font, ch, gw in glyphs:
+        if c >= w:
+            break
+        n = min(gw, w - c) * 2  # 每行可见的字节数
+        g = _cached_glyph(cache, font, ch, fc, bc) if font is not None else None
+        d = c * 2
+        if g is None:
+            for r in range(ysize):
+                _fill16(mv[d:d + n], bc, n)
+                d += stride
+        else:
+            gm = memoryview(g)
+            gs = gw * 2
+            s = 0
+            for r in range(ysize):
+                mv[d:d + n] = gm[s:s + n]
+                d += stride
+                s += gs
+        c += gw
+    return buf, w
+
+
+class GlyphCache(object):
+    '''
+    已渲染字形的缓存,以(字库, 字符, 前景色, 背景色)为键保存可直接发送的RGB565数据,
+    总大小超过预算时淘汰最久未使用的字形
+    '''
+    def __init__(self, budget=_GLYPH_BUDGET):
+        self._budget = budget
+        self._size = 0
+        self._tick = 0
+        self._items = {}    # key -> [buf, 最近一次使用的tick]
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._tick += 1
+        item[1] = self._tick
+        return item[0]
+
+    def put(self, key, buf):
+        n = len(buf)
+        if n > self._budget:
+            return
+        while self._size + n > self._budget:
+            self._evict()
+        self._tick += 1
+        self._items[key] = [buf, self._tick]
+        self._size += n
+
+    def _evict(self):
+        old_key = None
+        old_tick = 0
+        for key, item in self._items.items():
+            if old_key is None or item[1] < old_tick:
+                old_key = key
+                old_tick = item[1]
+        self._size -= len(self._items.pop(old_key)[0])
+
+    def resize(self, budget):
+        '''
+        修改内存预算,预算为0时关闭缓存
+        '''
+        self._budget = budget
+        while self._size > budget:
+            self._evict()
+
+    def clear(self):
+        self._items = {}
+        self._size = 0
+
+
+class Sprite(object):
+    '''
+    精灵图片,配合Peripheral_LCD.blit使用,记录当前位置以及被它覆盖的背景
+    帧缓冲模式下背景直接从帧缓冲中保存;非帧缓冲模式下需用set_background指定背景色或背景图
+    '''
+    def __init__(self, width, height, data, key=None):
+        '''
+        :param width: 宽度
+        :param height: 高度
+        :param data: 按行存放的RGB565数据(低字节在前)
+        :param key: 透明色,该颜色的像素不绘制,为None时不透明
+        '''
+        self.width = width
+        self.height = height
+        self.data = data
+        self.key = key
+        self.x = None       # 当前显示位置,未显示时为None
+        self.y = None
+        self._saved = None  # 帧缓冲模式下被覆盖的背景
+        self._bg = None     # 非帧缓冲模式下的背景,颜色或(x, y, w, h, data)
+        self._runs = None
+        self._runs_key = None
+
+    def set_background(self, bg, x=0, y=0, width=0, height=0):
+        '''
+        设置非帧缓冲模式下精灵移动区域的背景
+        :param bg: RGB565颜色值,或按行存放的RGB565背景图,背景图以外的区域显示为黑色
+        :param x: 背景图在屏幕上的x坐标,bg为颜色时忽略
+        :param y: 背景图在屏幕上的y坐标
+        :param width: 背景图宽度
+        :param height: 背景图高度
+        '''
+        if isinstance(bg, int):
+            self._bg = bg
+        else:
+            self._bg = (x, y, width, height, bg)
+
+    def runs(self, key):
+        '''
+        计算每行中非透明像素的连续段,结果按透明色缓存
+        :return: [[(起始列, 结束列+1), ...], ...],key为None时返回None
+        '''
+        if key is None:
+            return None
+        if self._runs is None or self._runs_key != key:
+            lo = key & 0xff
+            hi = key >> 8
+            d = self.data
+            runs = []
+            o = 0
+            for r in range(self.height):
+                row = []
+                start = -1
+                for c in range(self.width):
+                    if d[o] != lo or d[o + 1] != hi:
+                        if start < 0:
+                            start = c
+                    elif start >= 0:
+                        row.append((start, c))
+                        start = -1
+                    o += 2
+                if start >= 0:
+                    row.append((start, self.width))
+                runs.append(row)
+            self._runs = runs
+            self._runs_key = key
+        return self._runs
+
+
+def _paint_sprite(dst, ox, oy, cw, ch, sprite, sx, sy, runs):
+    '''
+    将精灵绘制到目标区域,超出区域的部分被裁剪
+    :param dst: 目标区域的memoryview,左上角屏幕坐标为(ox, oy),尺寸cw x ch,按行存放
+    :param sx: 精灵左上角的屏幕x坐标
+    :param sy: 精灵左上角的屏幕y坐标
+    :param runs: Sprite.runs()的结果,为None时整行绘制
+    '''
+    src = memoryview(sprite.data)
+    sw = sprite.width
+    stride = cw * 2
+    full = ((0, sw),)
+    for r in range(sprite.height):
+        y = sy + r
+        if y < oy or y >= oy + ch:
+            continue
+        for s, e in (full if runs is None else runs[r]):
+            x0 = max(sx + s, ox)
+            x1 = min(sx + e, ox + cw)
+            if x0 >= x1:
+                continue
+            d = (y - oy) * stride + (x0 - ox) * 2
+            o = (r * sw + x0 - sx) * 2
+            n = (x1 - x0) * 2
+            dst[d:d + n] = src[o:o + n]
+
 
 class CustomError(Exception):
     def __init__(self, ErrorInfo):
@@ -28,11 +485,18 @@ class Peripheral_LCD(object):
     LCD通用类,定义LCD屏的通用行为
     开放接口：
     DrawPoint(x, y, color),DrawLine(x0, y0, x1, y1, color),DrawRectangle(x0, y0, x1, y1, color)
+    DrawHLine(x, y, w, color),DrawVLine(x, y, h, color),FillRectangle(x0, y0, x1, y1, color)
     Clear(color),DrawCircle(x0, y0, r, color),ShowChar(x, y, xsize, ysize, ch_buf, fc, bc)
     ShowAscii(x, y, xsize, ysize, ch, fc, bc),ShowAsciiStr(x, y, xsize, ysize, str_ascii, fc, bc)
     ShowJpg(name, start_x, start_y), lcd_show_chinese(x, y, xsize, ysize, ch, fc, bc),
     lcd_show_chinese_str(x, y, xsize, ysize, str_ch, fc, bc),lcd_show_image(image_data, x, y, width, heigth)
     lcd_show_image_file(path, x, y, width, heigth, h)
+    EnableFrameBuffer(color, stripe_size),DisableFrameBuffer(),flush()
+    SetGlyphCacheSize(budget),SetFont(kind, xsize, ysize, font),ShowText(x, y, text, fc, bc, size, width, wrap)
+    SetScrollArea(tfa, vsa, bfa),SetScrollStart(line),SetRotation(rotation, mirror_x, mirror_y),GetRotation()
+    PreloadFonts(keys),lcd_show_image_bin(path, x, y, stripe_size),blit(sprite, x, y, key),unblit(sprite)
+    FillCircle(x0, y0, r, color),FillTriangle(x0, y0, x1, y1, x2, y2, color),FillPolygon(points, color)
+    FillRoundRect(x0, y0, x1, y1, r, color),DrawRoundRect(x0, y0, x1, y1, r, color)
     '''
     def __init__(self, child_self=None):
 
@@ -40,6 +504,274 @@ class Peripheral_LCD(object):
             raise CustomError("child LCD should be init first. ")
         else:
             self._child_self = child_self
+            self._fb = None
+            self._dirty = []
+            self._stripe_size = _STRIPE_SIZE
+            self._glyphs = GlyphCache()
+            self._fonts = {}
+            self._xf = None         # 逻辑坐标到屏幕坐标的变换系数,None表示不旋转不镜像
+            self._phys = None       # 屏幕(驱动初始化时)的宽和高
+            self._rotation = (0, False, False)
+
+    def EnableFrameBuffer(self, color=None, stripe_size=_STRIPE_SIZE):
+        '''
+        开启帧缓冲模式,之后的绘制只写入内存,调用flush()时才把脏区域发送到屏幕
+        帧缓冲大小为 宽 * 高 * 2 字节,如240x240需要115200字节
+        :param color: 帧缓冲初始颜色,不为None时同时清屏,保证缓冲与屏幕内容一致
+        :param stripe_size: flush时单次lcd_write的最大字节数
+        '''
+        w = self._child_self._lcd_w
+        h = self._child_self._lcd_h
+        self._fb = bytearray(w * h * 2)
+        self._dirty = []
+        self._stripe_size = stripe_size
+        if color is not None:
+            self.Clear(color)
+
+    def DisableFrameBuffer(self):
+        '''
+        先刷新未发送的脏区域,再关闭帧缓冲模式并释放缓冲
+        '''
+        self.flush()
+        self._fb = None
+
+    def _clip(self, x0, y0, x1, y1):
+        '''
+        将矩形裁剪到屏幕范围内,完全在屏幕外时返回None
+        '''
+        if x0 < 0:
+            x0 = 0
+        if y0 < 0:
+            y0 = 0
+        if x1 >= self._child_self._lcd_w:
+            x1 = self._child_self._lcd_w - 1
+        if y1 >= self._child_self._lcd_h:
+            y1 = self._child_self._lcd_h - 1
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _mark_dirty(self, x0, y0, x1, y1):
+        '''
+        记录脏矩形,与重叠或相邻的矩形合并,数量超过_MAX_DIRTY时并入面积增量最小的矩形
+        '''
+        dirty = self._dirty
+        merged = True
+        while merged:
+            merged = False
+            for i in range(len(dirty)):
+                r = dirty[i]
+                if x0 <= r[2] + 1 and r[0] <= x1 + 1 and y0 <= r[3] + 1 and r[1] <= y1 + 1:
+                    x0 = min(x0, r[0])
+                    y0 = min(y0, r[1])
+                    x1 = max(x1, r[2])
+                    y1 = max(y1, r[3])
+                    dirty.pop(i)
+                    merged = True
+                    break
+        if len(dirty) >= _MAX_DIRTY:
+            best = 0
+            best_cost = -1
+            for i in range(len(dirty)):
+                r = dirty[i]
+                cost = (max(x1, r[2]) - min(x0, r[0]) + 1) * (max(y1, r[3]) - min(y0, r[1]) + 1) \
+                    - (r[2] - r[0] + 1) * (r[3] - r[1] + 1)
+                if best_cost < 0 or cost < best_cost:
+                    best = i
+                    best_cost = cost
+            r = dirty.pop(best)
+            self._mark_dirty(min(x0, r[0]), min(y0, r[1]), max(x1, r[2]), max(y1, r[3]))
+            return
+        dirty.append([x0, y0, x1, y1])
+
+    def _fb_fill(self, x_s, y_s, x_e, y_e, color):
+        '''
+        在帧缓冲中填充矩形
+        '''
+        rect = self._clip(x_s, y_s, x_e, y_e)
+        if rect is None:
+            return
+        x_s, y_s, x_e, y_e = rect
+        w = self._child_self._lcd_w
+        n = (x_e - x_s + 1) * 2
+        fb = memoryview(self._fb)
+        first = (y_s * w + x_s) * 2
+        _fill16(fb[first:first + n], color, n)
+        for y in range(y_s + 1, y_e + 1):
+            s = (y * w + x_s) * 2
+            fb[s:s + n] = fb[first:first + n]
+        self._mark_dirty(x_s, y_s, x_e, y_e)
+
+    def _fb_write(self, buf, x_s, y_s, x_e, y_e):
+        '''
+        将按行存放的RGB565数据写入帧缓冲,超出屏幕的部分被裁剪
+        '''
+        rect = self._clip(x_s, y_s, x_e, y_e)
+        if rect is None:
+            return
+        cx0, cy0, cx1, cy1 = rect
+        w = self._child_self._lcd_w
+        src_w = (x_e - x_s + 1) * 2
+        n = (cx1 - cx0 + 1) * 2
+        src = memoryview(buf)
+        fb = memoryview(self._fb)
+        for y in range(cy0, cy1 + 1):
+            s = (y - y_s) * src_w + (cx0 - x_s) * 2
+            d = (y * w + cx0) * 2
+            fb[d:d + n] = src[s:s + n]
+        self._mark_dirty(cx0, cy0, cx1, cy1)
+
+    def _write(self, buf, x_s, y_s, x_e, y_e):
+        '''
+        所有绘制接口的统一出口,帧缓冲模式下写入内存,否则直接发送到屏幕
+        '''
+        if self._fb is None:
+            self._lcd_write(buf, x_s, y_s, x_e, y_e)
+        else:
+            self._fb_write(buf, x_s, y_s, x_e, y_e)
+
+    def _lcd_write(self, buf, x_s, y_s, x_e, y_e):
+        '''
+        按逻辑坐标发送按行存放的RGB565数据,设置了旋转或镜像时先变换到屏幕坐标
+        '''
+        if self._xf is None:
+            self._child_self._lcd.lcd_write(buf, x_s, y_s, x_e, y_e)
+            return
+        rect = self._clip(x_s, y_s, x_e, y_e)
+        if rect is None:
+            return
+        cx0, cy0, cx1, cy1 = rect
+        a, b, c, d, e, f = self._xf
+        px0, py0, px1, py1 = self._xrect(cx0, cy0, cx1, cy1)
+        pw = px1 - px0 + 1
+        out = bytearray(pw * (py1 - py0 + 1) * 2)
+        # 逻辑坐标每加1列(行),屏幕缓冲中的字节偏移的增量
+        dc = (d * pw + a) * 2
+        dr = (e * pw + b) * 2
+        o = ((d * cx0 + e * cy0 + f - py0) * pw + a * cx0 + b * cy0 + c - px0) * 2
+        bw = (x_e - x_s + 1) * 2
+        n = (cx1 - cx0 + 1) * 2
+        s = (cy0 - y_s) * bw + (cx0 - x_s) * 2
+        if dc == 2:
+            # 逻辑行在屏幕上仍是顺序的一行,整段复制
+            src = memoryview(buf)
+            dst = memoryview(out)
+            for r in range(cy1 - cy0 + 1):
+                dst[o:o + n] = src[s:s + n]
+                s += bw
+                o += dr
+        else:
+            for r in range(cy1 - cy0 + 1):
+                i = s
+                j = o
+                for k in range(0, n, 2):
+                    out[j] = buf[i]
+                    out[j + 1] = buf[i + 1]
+                    i += 2
+                    j += dc
+                s += bw
+                o += dr
+        self._child_self._lcd.lcd_write(out, px0, py0, px1, py1)
+
+    def _xrect(self, x0, y0, x1, y1):
+        '''
+        将逻辑坐标下的矩形变换为屏幕坐标下的矩形
+        '''
+        a, b, c, d, e, f = self._xf
+        xa = a * x0 + b * y0 + c
+        ya = d * x0 + e * y0 + f
+        xb = a * x1 + b * y1 + c
+        yb = d * x1 + e * y1 + f
+        return min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb)
+
+    def SetRotation(self, rotation=0, mirror_x=False, mirror_y=False):
+        '''
+        运行时旋转或镜像显示,不重新初始化屏幕,只更新预先计算的坐标变换
+        之后的绘制都使用旋转后的逻辑坐标,纯色填充直接变换矩形,图片和文字按行变换后发送
+        帧缓冲模式下缓冲按逻辑坐标存放,切换后需要重绘画面
+        :param rotation: 顺时针旋转角度,0、90、180或270
+        :param mirror_x: 左右镜像
+        :param mirror_y: 上下镜像
+        '''
+        if rotation not in (0, 90, 180, 270):
+            raise CustomError('unsupported rotation {}'.format(rotation))
+        if self._phys is None:
+            self._phys = (self._child_self._lcd_w, self._child_self._lcd_h)
+        pw, ph = self._phys
+        if rotation in (90, 270):
+            w, h = ph, pw
+        else:
+            w, h = pw, ph
+        # 先在逻辑坐标下镜像: x' = ma * x + mc, y' = me * y + mf
+        ma, mc = (-1, w - 1) if mirror_x else (1, 0)
+        me, mf = (-1, h - 1) if mirror_y else (1, 0)
+        # 再旋转到屏幕坐标: px = ra * x' + rb * y' + rc, py = rd * x' + re * y' + rf
+        ra, rb, rc, rd, re, rf = {
+            0: (1, 0, 0, 0, 1, 0),
+            90: (0, -1, pw - 1, 1, 0, 0),
+            180: (-1, 0, pw - 1, 0, -1, ph - 1),
+            270: (0, 1, 0, -1, 0, ph - 1),
+        }[rotation]
+        xf = (ra * ma, rb * me, ra * mc + rb * mf + rc,
+              rd * ma, re * me, rd * mc + re * mf + rf)
+        self._xf = None if xf == (1, 0, 0, 0, 1, 0) else xf
+        self._child_self._lcd_w = w
+        self._child_self._lcd_h = h
+        self._rotation = (rotation, mirror_x, mirror_y)
+        if self._fb is not None:
+            self._dirty = []
+
+    def GetRotation(self):
+        '''
+        :return: (rotation, mirror_x, mirror_y)
+        '''
+        return self._rotation
+
+    def _fb_read(self, buf, x_s, y_s, x_e, y_e):
+        '''
+        将帧缓冲中的矩形区域按行复制到buf,超出屏幕的部分保持不变
+        '''
+        rect = self._clip(x_s, y_s, x_e, y_e)
+        if rect is None:
+            return
+        cx0, cy0, cx1, cy1 = rect
+        w = self._child_self._lcd_w
+        dst_w = (x_e - x_s + 1) * 2
+        n = (cx1 - cx0 + 1) * 2
+        dst = memoryview(buf)
+        fb = memoryview(self._fb)
+        for y in range(cy0, cy1 + 1):
+            d = (y - y_s) * dst_w + (cx0 - x_s) * 2
+            s = (y * w + cx0) * 2
+            dst[d:d + n] = fb[s:s + n]
+
+    def flush(self):
+        '''
+        将帧缓冲中的脏区域发送到屏幕,每个脏矩形按条带分成若干次lcd_write
+        '''
+        if self._fb is None:
+            return
+        w = self._child_self._lcd_w
+        fb = memoryview(self._fb)
+        for x0, y0, x1, y1 in self._dirty:
+            n = (x1 - x0 + 1) * 2
+            rows = max(1, self._stripe_size // n)
+            y = y0
+            while y <= y1:
+                h = min(rows, y1 - y + 1)
+                buf = _stripe(n * h)
+                mv = memoryview(buf)
+                if n == w * 2:
+                    mv[:] = fb[y * n:(y + h) * n]
+                else:
+                    d = 0
+                    for r in range(y, y + h):
+                        s = (r * w + x0) * 2
+                        mv[d:d + n] = fb[s:s + n]
+                        d += n
+                self._lcd_write(buf, x0, y, x1, y + h - 1)
+                y += h
+        self._dirty = []
 
     def DrawPoint(self, x, y, color):
         '''
@@ -48,8 +780,18 @@ class Peripheral_LCD(object):
         :param y: y
         :param color: color
         '''
-        tmp = color.to_bytes(2, 'little')
-        self._child_self._lcd.lcd_write(bytearray(tmp), x, y, x, y)
+        if self._fb is None:
+            tmp = color.to_bytes(2, 'little')
+            if self._xf is not None:
+                if not (0 <= x < self._child_self._lcd_w and 0 <= y < self._child_self._lcd_h):
+                    return
+                x, y, _, _ = self._xrect(x, y, x, y)
+            self._child_self._lcd.lcd_write(bytearray(tmp), x, y, x, y)
+        elif 0 <= x < self._child_self._lcd_w and 0 <= y < self._child_self._lcd_h:
+            s = (y * self._child_self._lcd_w + x) * 2
+            self._fb[s] = color & 0xff
+            self._fb[s + 1] = color >> 8
+            self._mark_dirty(x, y, x, y)
 
 
     def Clear(self, color):
@@ -57,6 +799,9 @@ class Peripheral_LCD(object):
         清屏
         :param color: color
         '''
+        if self._fb is not None:
+            _fill16(memoryview(self._fb), color, len(self._fb))
+            self._dirty = []
         self._child_self._lcd.lcd_clear(color)
 
     def Fill(self, x_s, y_s, x_e, y_e, color):
@@ -68,23 +813,30 @@ class Peripheral_LCD(object):
         :param y_e: 结束y坐标
         :param color: color
         '''
-        tmp = color.to_bytes(2, 'little')
-        count = (x_e - x_s + 1)*(y_e - y_s + 1)
-
-        color_buf = bytearray(0)
-
-        for i in range(count):
-            color_buf += tmp
-
-        self._child_self._lcd.lcd_write(color_buf, x_s, y_s, x_e, y_e)
+        if self._fb is not None:
+            self._fb_fill(x_s, y_s, x_e, y_e, color)
+        elif self._xf is None:
+            fill_rect(self._child_self._lcd, x_s, y_s, x_e, y_e, color, self._stripe_size)
+        else:
+            rect = self._clip(x_s, y_s, x_e, y_e)
+            if rect is not None:
+                x_s, y_s, x_e, y_e = self._xrect(rect[0], rect[1], rect[2], rect[3])
+                fill_rect(self._child_self._lcd, x_s, y_s, x_e, y_e, color, self._stripe_size)
 
     def ColorFill(self, x_s, y_s, x_e, y_e, color_buff):
-        self._child_self._lcd.lcd_write(color_buff, x_s, y_s, x_e, y_e)
+        self._write(color_buff, x_s, y_s, x_e, y_e)
 
     def DrawLine(self, x0, y0, x1, y1, color):
         '''
         画线
+        水平线和竖直线一次窗口写入完成,其他角度按Bresenham算法把同一行(或列)上的连续像素合并成一段写入
         '''
+        if y0 == y1:
+            self.Fill(min(x0, x1), y0, max(x0, x1), y0, color)
+            return
+        if x0 == x1:
+            self.Fill(x0, min(y0, y1), x0, max(y0, y1), color)
+            return
         steep = abs(y1 - y0) > abs(x1 - x0)
         if steep:
             x0, y0 = y0, x0
@@ -99,25 +851,72 @@ class Peripheral_LCD(object):
             ystep = 1
         else:
             ystep = -1
+        run = x0  # 当前段的起点
         while x0 <= x1:
-            if steep:
-                self.DrawPoint(y0, x0, color)
-            else:
-                self.DrawPoint(x0, y0, color)
             err -= dy
+            if err < 0 or x0 == x1:
+                if run == x0:
+                    if steep:
+                        self.DrawPoint(y0, x0, color)
+                    else:
+                        self.DrawPoint(x0, y0, color)
+                elif steep:
+                    self.Fill(y0, run, y0, x0, color)
+                else:
+                    self.Fill(run, y0, x0, y0, color)
+                run = x0 + 1
             if err < 0:
                 y0 += ystep
                 err += dx
             x0 += 1
 
+    def DrawHLine(self, x, y, w, color):
+        '''
+        画水平线,一次窗口写入
+        :param x: 起点x坐标
+        :param y: y坐标
+        :param w: 线长(像素)
+        :param color: color
+        '''
+        if w > 0:
+            self.Fill(x, y, x + w - 1, y, color)
+
+    def DrawVLine(self, x, y, h, color):
+        '''
+        画竖直线,一次窗口写入
+        :param x: x坐标
+        :param y: 起点y坐标
+        :param h: 线长(像素)
+        :param color: color
+        '''
+        if h > 0:
+            self.Fill(x, y, x, y + h - 1, color)
+
     def DrawRectangle(self, x0, y0, x1, y1, color):
         '''
-        画矩形
+        画矩形,四条边各一次窗口写入
         '''
-        self.DrawLine(x0,y0,x1,y0,color)
-        self.DrawLine(x0,y0,x0,y1,color)
-        self.DrawLine(x0,y1,x1,y1,color)
-        self.DrawLine(x1,y0,x1,y1,color)
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        self.Fill(x0, y0, x1, y0, color)
+        if y1 == y0:
+            return
+        self.Fill(x0, y1, x1, y1, color)
+        if y1 - y0 > 1:
+            self.Fill(x0, y0 + 1, x0, y1 - 1, color)
+            self.Fill(x1, y0 + 1, x1, y1 - 1, color)
+
+    def FillRectangle(self, x0, y0, x1, y1, color):
+        '''
+        填充矩形,与Fill相同但不要求起点坐标小于终点坐标
+        '''
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        self.Fill(x0, y0, x1, y1, color)
 
     def DrawCircle(self, x0, y0, r, color):
         '''
@@ -143,7 +942,183 @@ class Peripheral_LCD(object):
                 di += 10+4*(a-b) 
                 b -= 1
 
-    def ShowChar(self, x, y, xsize, ysize, ch_buf, fc, bc):
+    def _fill_spans(self, spans, color):
+        '''
+        按行填充水平段,每段一次窗口写入(帧缓冲模式下一次内存填充)
+        相邻行上起止坐标相同的段合并为一个矩形填充
+        :param spans: 按y递增排列的(y, x_s, x_e)序列
+        '''
+        w = self._child_self._lcd_w
+        h = self._child_self._lcd_h
+        run = None
+        for y, x_s, x_e in spans:
+            if y < 0 or y >= h:
+                continue
+            if x_s < 0:
+                x_s = 0
+            if x_e >= w:
+                x_e = w - 1
+            if x_s > x_e:
+                continue
+            if run is not None and run[1] + 1 == y and run[2] == x_s and run[3] == x_e:
+                run[1] = y
+                continue
+            if run is not None:
+                self.Fill(run[2], run[0], run[3], run[1], color)
+            run = [y, y, x_s, x_e]
+        if run is not None:
+            self.Fill(run[2], run[0], run[3], run[1], color)
+
+    @staticmethod
+    def _circle_half(r):
+        '''
+        按DrawCircle相同的中点画圆算法,计算距圆心dy行处的半宽
+        :return: 长度为r+1的列表
+        '''
+        half = [0] * (r + 1)
+        a = 0
+        b = r
+        di = 3 - (r << 1)
+        while a <= b:
+            if a > half[b]:
+                half[b] = a
+            if b > half[a]:
+                half[a] = b
+            a += 1
+            if di < 0:
+                di += 4*a+6
+            else:
+                di += 10+4*(a-b)
+                b -= 1
+        return half
+
+    def FillCircle(self, x0, y0, r, color):
+        '''
+        填充圆,每行一次窗口写入,边缘与DrawCircle一致
+        :param x0: 圆心x坐标
+        :param y0: 圆心y坐标
+        :param r: 半径
+        :param color: color
+        '''
+        if r < 0:
+            return
+        half = self._circle_half(r)
+        self._fill_spans(((y0 + dy, x0 - half[abs(dy)], x0 + half[abs(dy)]) for dy in range(-r, r + 1)), color)
+
+    def FillPolygon(self, points, color):
+        '''
+        填充多边形,支持凸多边形和凹多边形(奇偶规则),每行每段一次窗口写入
+        :param points: 顶点坐标列表[(x, y), ...],首尾自动闭合
+        :param color: color
+        '''
+        n = len(points)
+        if n == 0:
+            return
+        ys = [p[1] for p in points]
+        y_min = min(ys)
+        y_max = max(ys)
+        if y_min == y_max:
+            xs = [p[0] for p in points]
+            self.Fill(min(xs), y_min, max(xs), y_min, color)
+            return
+        # 预先整理各边为(y上, y下, x上, dx),水平边不参与求交
+        edges = []
+        for i in range(n):
+            xa, ya = points[i]
+            xb, yb = points[(i + 1) % n]
+            if ya == yb:
+                continue
+            if ya > yb:
+                xa, ya, xb, yb = xb, yb, xa, ya
+            edges.append((ya, yb, xa, xb - xa))
+        self._fill_spans(self._polygon_spans(edges, y_min, y_max), color)
+
+    @staticmethod
+    def _polygon_spans(edges, y_min, y_max):
+        '''
+        逐行求多边形各边的交点并两两配对成段
+        边按[y上, y下)计入,最后一行按(y上, y下]计入,使底部顶点所在行也被填充
+        '''
+        for y in range(y_min, y_max + 1):
+            xs = []
+            last = y == y_max
+            for ya, yb, xa, dx in edges:
+                if (ya <= y < yb) if not last else (ya < y <= yb):
+                    den = yb - ya
+                    xs.append(xa + (2 * (y - ya) * dx + den) // (2 * den))
+            xs.sort()
+            for i in range(0, len(xs) - 1, 2):
+                yield y, xs[i], xs[i + 1]
+
+    def FillTriangle(self, x0, y0, x1, y1, x2, y2, color):
+        '''
+        填充三角形,每行一次窗口写入
+        '''
+        self.FillPolygon(((x0, y0), (x1, y1), (x2, y2)), color)
+
+    def _round_rect(self, x0, y0, x1, y1, r):
+        '''
+        整理圆角矩形参数,返回(x0, y0, x1, y1, r, half)
+        '''
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+        r = max(0, min(r, (x1 - x0) // 2, (y1 - y0) // 2))
+        return x0, y0, x1, y1, r, self._circle_half(r)
+
+    def FillRoundRect(self, x0, y0, x1, y1, r, color):
+        '''
+        填充圆角矩形,圆角部分每行一次窗口写入,中间部分一次写入
+        :param x0: 左上角x坐标
+        :param y0: 左上角y坐标
+        :param x1: 右下角x坐标
+        :param y1: 右下角y坐标
+        :param r: 圆角半径,超过短边一半时按短边一半处理
+        :param color: color
+        '''
+        x0, y0, x1, y1, r, half = self._round_rect(x0, y0, x1, y1, r)
+
+        def spans():
+            for y in range(y0, y1 + 1):
+                if y < y0 + r:
+                    inset = r - half[y0 + r - y]
+                elif y > y1 - r:
+                    inset = r - half[y - y1 + r]
+                else:
+                    inset = 0
+                yield y, x0 + inset, x1 - inset
+
+        self._fill_spans(spans(), color)
+
+    def DrawRoundRect(self, x0, y0, x1, y1, r, color):
+        '''
+        画圆角矩形,直边各一次窗口写入,圆角按行合并成段写入
+        参数同FillRoundRect
+        '''
+        x0, y0, x1, y1, r, half = self._round_rect(x0, y0, x1, y1, r)
+        if r == 0:
+            self.DrawRectangle(x0, y0, x1, y1, color)
+            return
+        self.Fill(x0 + r, y0, x1 - r, y0, color)
+        self.Fill(x0 + r, y1, x1 - r, y1, color)
+        self.Fill(x0, y0 + r, x0, y1 - r, color)
+        self.Fill(x1, y0 + r, x1, y1 - r, color)
+        # 圆角第dy行上的轮廓像素为距圆心half[dy+1]+1到half[dy]
+        arcs = []
+        for dy in range(r, 0, -1):
+            outer = half[dy]
+            inner = half[dy + 1] + 1 if dy < r else 1
+            if inner > outer:
+                inner = outer
+            arcs.append((dy, inner, outer))
+        for yc, sign in ((y0 + r, -1), (y1 - r, 1)):
+            for dy, inner, outer in arcs:
+                y = yc + sign * dy
+                self._fill_spans(((y, x0 + r - outer, x0 + r - inner),), color)
+                self._fill_spans(((y, x1 - r + inner, x1 - r + outer),), color)
+
+    def ShowChar(self, x, y, xsize, ysize, ch_buf, fc, bc, bpp=1):
         '''
         单个字符显示，包括汉字和ASCII
         :param x:x轴坐标
@@ -153,21 +1128,151 @@ class Peripheral_LCD(object):
         :param ch_buf:存放汉字字模的元组或者列表
         :param fc:字体颜色，RGB565
         :param bc:背景颜色，RGB565
+        :param bpp:字模每像素位数,1为单色字模,4为抗锯齿字模
+        '''
+        if bpp == 4:
+            xsize = (xsize + 1) & ~1
+            buf = _render_glyph4(ch_buf, fc, bc)
+        else:
+            xsize = (xsize + 7) & ~7
+            buf = _render_glyph(ch_buf, fc, bc)
+        self._write(buf, x, y, x + xsize - 1, y + ysize - 1)
+
+    def SetGlyphCacheSize(self, budget):
+        '''
+        设置字形缓存的内存预算
+        :param budget: 字节数,为0时关闭缓存
+        '''
+        self._glyphs.resize(budget)
+
+    def SetFont(self, kind, xsize, ysize, font):
+        '''
+        注册字库,替换或扩充内置的字典字库
+        :param kind: 'ascii'或'hanzi'
+        :param xsize: 字体宽度
+        :param ysize: 字体高度
+        :param font: 提供get(ch)方法的字库对象,如LCDFont.BinFont或字典,为None时取消注册
+        '''
+        key = (kind, xsize, ysize)
+        old = self._fonts.get(key)
+        if font is None:
+            self._fonts.pop(key, None)
+        else:
+            self._fonts[key] = font
+        if old is not None:
+            self._glyphs.clear()
+
+    def PreloadFonts(self, keys=None):
+        '''
+        预先导入内置字库,见preload_fonts
+        '''
+        preload_fonts(keys)
+
+    def _ascii_font(self, xsize, ysize):
+        key = ('ascii', xsize, ysize)
+        font = self._fonts.get(key)
+        if font is None:
+            font = _builtin_font(key)
+        return font
+
+    def _hanzi_font(self, xsize, ysize):
+        key = ('hanzi', xsize, ysize)
+        font = self._fonts.get(key)
+        if font is None:
+            font = _builtin_font(key)
+        return font
+
+    def _glyph(self, font, ch, fc, bc):
+        '''
+        从字形缓存中取出已渲染的字符,未命中时渲染后放入缓存,字库中没有该字符时返回None
+        '''
+        return _cached_glyph(self._glyphs, font, ch, fc, bc)
+
+    def _show_glyph(self, font, x, y, xsize, ysize, ch, fc, bc):
+        buf = self._glyph(font, ch, fc, bc)
+        if buf is not None:
+            xsize = _glyph_width(font, xsize)
+            self._write(buf, x, y, x + xsize - 1, y + ysize - 1)
+
+    def _show_run(self, x, y, ysize, glyphs, width, fc, bc):
+        '''
+        将一行字形合成为一块按行存放的缓冲,一次窗口写入
+        :param glyphs: [(字库, 字符, 字宽), ...],字库中没有的字符显示为背景色
+        :param width: 行的最大宽度,超出部分按像素裁剪
+        :return: 下一行的y坐标
+        '''
+        buf, w = _compose_run(glyphs, ysize, width, fc, bc, self._glyphs)
+        if w > 0:
+            self._write(buf, x, y, x + w - 1, y + ysize - 1)
+        return y + ysize
+
+    def ShowText(self, x, y, text, fc, bc, size=16, width=None, wrap=False):
+        '''
+        ASCII与汉字混合的文本显示,每行合成为一块缓冲后一次窗口写入,'\\n'换行
+        :param x:x轴显示起点
+        :param y:y轴显示起点
+        :param text:待显示的字符串
+        :param fc:字体颜色，RGB565
+        :param bc:背景颜色，RGB565
+        :param size:字高,16使用8x16的ASCII和16x16的汉字,24使用16x24的ASCII和24x24的汉字
+        :param width:显示区域宽度,默认到屏幕右边缘
+        :param wrap:为True时超出宽度自动换行,否则超出部分被裁剪
+        :return:最后一行下方的y坐标
         '''
-        rgb_buf = []
-        t1 = xsize // 8
-        t2 = xsize % 8
-        if t2 != 0:
-            xsize = (t1 + 1) * 8
-        for i in range(0, len(ch_buf)):
-            for j in range(0, 8):
-                if (ch_buf[i] << j) & 0x80 == 0x00:
-                    rgb_buf.append(bc & 0xff)
-                    rgb_buf.append(bc >> 8)
+        sizes = _TEXT_FONTS.get(size)
+        if sizes is None:
+            raise CustomError('unsupported text size {}'.format(size))
+        lcd_w = self._child_self._lcd_w
+        lcd_h = self._child_self._lcd_h
+        if width is None or x + width > lcd_w:
+            width = lcd_w - x
+        aw = sizes[0][0]
+        hw = sizes[1][0]
+        afont = self._ascii_font(aw, size)
+        hfont = self._hanzi_font(hw, size)
+        for text_line in text.split('\n'):
+            if y >= lcd_h:
+                break
+            chars = _chars(text_line)
+            ascii_only = True
+            for ch in chars:
+                if len(ch) != 1 or ord(ch) >= 0x80:
+                    ascii_only = False
+                    break
+            if ascii_only:
+                # 定宽快速路径:每行字符数固定,直接按字符数切分,最后一个字符按像素裁剪
+                per_line = max(1, width // aw)
+                if wrap:
+                    parts = [chars[i:i + per_line] for i in range(0, len(chars), per_line)] or [chars]
                 else:
-                    rgb_buf.append(fc & 0xff)
-                    rgb_buf.append(fc >> 8)
-        self._child_self._lcd.lcd_write(bytearray(rgb_buf), x, y, x + xsize - 1, y + ysize - 1)
+                    parts = [chars[:per_line + 1]]
+                for part in parts:
+                    if y >= lcd_h:
+                        break
+                    y = self._show_run(x, y, size, [(afont, ch, aw) for ch in part], width, fc, bc)
+                continue
+            run = []
+            used = 0
+            for ch in chars:
+                if len(ch) == 1 and ord(ch) < 0x80:
+                    g = (afont, ch, aw)
+                else:
+                    g = (hfont, ch, hw)
+                # 比width还宽的单个字符单独成行(裁剪显示),不先输出空行
+                if run and used + g[2] > width:
+                    if not wrap:
+                        run.append(g)
+                        break
+                    y = self._show_run(x, y, size, run, width, fc, bc)
+                    run = []
+                    used = 0
+                    if y >= lcd_h:
+                        break
+                run.append(g)
+                used += g[2]
+            if run and y < lcd_h:
+                y = self._show_run(x, y, size, run, width, fc, bc)
+        return y
 
     def ShowAscii(self, x, y, xsize, ysize, ch, fc, bc):
         '''
@@ -180,15 +1285,9 @@ class Peripheral_LCD(object):
         :param fc:字体颜色，RGB565
         :param bc:背景颜色，RGB565
         '''
-        ascii_dict = {}
-        if xsize == 8 and ysize == 16:
-            ascii_dict = LCDPublic.ascii_8x16_dict
-        elif xsize == 16 and ysize == 24:
-            ascii_dict = LCDPublic.ascii_16x24_dict
-
-        for key in ascii_dict:
-            if ch == key:
-                self.ShowChar(x, y, xsize, ysize, ascii_dict[key], fc, bc)
+        font = self._ascii_font(xsize, ysize)
+        if font is not None:
+            self._show_glyph(font, x, y, xsize, ysize, ch, fc, bc)
 
 
     def ShowAsciiStr(self, x, y, xsize, ysize, str_ascii, fc, bc):
@@ -202,13 +1301,13 @@ class Peripheral_LCD(object):
         :param fc:字体颜色，RGB565
         :param bc:背景颜色，RGB565
         '''
-        xs = x
-        ys = y
         if (len(str_ascii) * xsize + x) > self._child_self._lcd_w:
             raise Exception('Display out of range')
-        for ch in str_ascii:
-            self.ShowAscii(xs, ys, xsize, ysize, ch, fc, bc)
-            xs += xsize
+        font = self._ascii_font(xsize, ysize)
+        if font is not None and str_ascii:
+            gw = _glyph_width(font, xsize)
+            run = [(font, ch, gw) for ch in str_ascii]
+            self._show_run(x, y, ysize, run, len(run) * gw, fc, bc)
 
     def ShowJpg(self,name, start_x, start_y):
         '''
@@ -230,17 +1329,9 @@ class Peripheral_LCD(object):
         :param fc:字体颜色，RGB565
         :param bc:背景颜色，RGB565
         '''
-        hanzi_dict = {}
-        if xsize == 16 and ysize == 16:
-            hanzi_dict = LCDPublic.hanzi_16x16_dict
-        elif xsize == 16 and ysize == 24:
-            hanzi_dict = LCDPublic.hanzi_16x24_dict
-        elif xsize == 24 and ysize == 24:
-            hanzi_dict = LCDPublic.hanzi_24x24_dict
-
-        for key in hanzi_dict:
-            if ch == key:
-                self.ShowChar(x, y, xsize, ysize, hanzi_dict[key], fc, bc)
+        font = self._hanzi_font(xsize, ysize)
+        if font is not None:
+            self._show_glyph(font, x, y, xsize, ysize, ch, fc, bc)
 
     def lcd_show_chinese_str(self, x, y, xsize, ysize, str_ch, fc, bc):
         '''
@@ -253,16 +1344,14 @@ class Peripheral_LCD(object):
         :param fc:字体颜色，RGB565
         :param bc:背景颜色，RGB565
         '''
-        xs = x
-        ys = y
-        # print('chstrlen={}, w={}'.format(len(str), self.lcd_w))
-        if (len(str_ch) / 3 * xsize + x) > self._child_self._lcd_w:
+        chars = _chars(str_ch)
+        if (len(chars) * xsize + x) > self._child_self._lcd_w:
             raise Exception('Display out of range')
-        for i in range(0, len(str_ch), 3):
-            index = i + 3
-            ch = str_ch[i:index]
-            self.lcd_show_chinese(xs, ys, xsize, ysize, ch, fc, bc)
-            xs += xsize
+        font = self._hanzi_font(xsize, ysize)
+        if font is not None and chars:
+            gw = _glyph_width(font, xsize)
+            run = [(font, ch, gw) for ch in chars]
+            self._show_run(x, y, ysize, run, len(run) * gw, fc, bc)
 
     def lcd_show_image(self, image_data, x, y, width, heigth):
         '''
@@ -273,7 +1362,166 @@ class Peripheral_LCD(object):
         :param width:图片宽度
         :param heigth:图片高度
         '''
-        self._child_self._lcd.lcd_write(bytearray(image_data), x, y, x + width - 1, y + heigth - 1)
+        self._write(bytearray(image_data), x, y, x + width - 1, y + heigth - 1)
+
+    def blit(self, sprite, x, y, key=None):
+        '''
+        将精灵移动到(x, y):恢复旧位置的背景,在新位置绘制精灵,只发送变化的区域
+        帧缓冲模式下背景从帧缓冲保存和恢复,变化区域记为脏矩形,由flush()发送;
+        非帧缓冲模式下用精灵的背景(Sprite.set_background)与精灵合成旧、新位置的并集矩形后一次发送,
+        两个位置相距较远时分成两个矩形分别发送
+        :param sprite: Sprite对象
+        :param x: 新位置x坐标
+        :param y: 新位置y坐标
+        :param key: 透明色,为None时使用sprite.key
+        '''
+        if key is None:
+            key = sprite.key
+        runs = sprite.runs(key)
+        w = sprite.width
+        h = sprite.height
+        if self._fb is not None:
+            lcd_w = self._child_self._lcd_w
+            lcd_h = self._child_self._lcd_h
+            if sprite.x is not None and sprite._saved is not None:
+                self._fb_write(sprite._saved, sprite.x, sprite.y, sprite.x + w - 1, sprite.y + h - 1)
+            if sprite._saved is None:
+                sprite._saved = bytearray(w * h * 2)
+            self._fb_read(sprite._saved, x, y, x + w - 1, y + h - 1)
+            _paint_sprite(memoryview(self._fb), 0, 0, lcd_w, lcd_h, sprite, x, y, runs)
+            rect = self._clip(x, y, x + w - 1, y + h - 1)
+            if rect is not None:
+                self._mark_dirty(rect[0], rect[1], rect[2], rect[3])
+        else:
+            new = (x, y, x + w - 1, y + h - 1)
+            if sprite.x is None:
+                rects = (new,)
+            else:
+                old = (sprite.x, sprite.y, sprite.x + w - 1, sprite.y + h - 1)
+                union = (min(new[0], old[0]), min(new[1], old[1]), max(new[2], old[2]), max(new[3], old[3]))
+                if (union[2] - union[0] + 1) * (union[3] - union[1] + 1) <= 4 * w * h:
+                    rects = (union,)
+                else:
+                    rects = (old, new)
+            sprite.x = x
+            sprite.y = y
+            for rect in rects:
+                self._compose_sprite(sprite, rect, runs)
+        sprite.x = x
+        sprite.y = y
+
+    def unblit(self, sprite):
+        '''
+        隐藏精灵,恢复其覆盖的背景
+        '''
+        if sprite.x is None:
+            return
+        w = sprite.width
+        h = sprite.height
+        if self._fb is not None:
+            if sprite._saved is not None:
+                self._fb_write(sprite._saved, sprite.x, sprite.y, sprite.x + w - 1, sprite.y + h - 1)
+        else:
+            self._compose_sprite(sprite, (sprite.x, sprite.y, sprite.x + w - 1, sprite.y + h - 1), None, False)
+        sprite.x = None
+        sprite.y = None
+
+    def _compose_sprite(self, sprite, rect, runs, draw=True):
+        '''
+        非帧缓冲模式下合成一个矩形区域:先铺背景,draw为True时再绘制当前位置的精灵,然后一次发送
+        '''
+        bg = sprite._bg
+        if bg is None:
+            raise CustomError('sprite background is not set')
+        rect = self._clip(rect[0], rect[1], rect[2], rect[3])
+        if rect is None:
+            return
+        x0, y0, x1, y1 = rect
+        cw = x1 - x0 + 1
+        ch = y1 - y0 + 1
+        buf = _stripe(cw * ch * 2)
+        mv = memoryview(buf)
+        if isinstance(bg, int):
+            _fill16(mv, bg, len(buf))
+        else:
+            bx, by, bw, bh, data = bg
+            _fill16(mv, 0, len(buf))
+            src = memoryview(data)
+            sx0 = max(x0, bx)
+            sx1 = min(x1, bx + bw - 1)
+            if sx0 <= sx1:
+                n = (sx1 - sx0 + 1) * 2
+                for yy in range(max(y0, by), min(y1, by + bh - 1) + 1):
+                    d = ((yy - y0) * cw + sx0 - x0) * 2
+                    o = ((yy - by) * bw + sx0 - bx) * 2
+                    mv[d:d + n] = src[o:o + n]
+        if draw:
+            _paint_sprite(mv, x0, y0, cw, ch, sprite, sprite.x, sprite.y, runs)
+        self._write(buf, x0, y0, x1, y1)
+
+    def lcd_show_image_bin(self, path, x, y, stripe_size=None):
+        '''
+        显示LCDImage格式的图片文件(RGB565原始格式或RLE压缩格式),按条带读取或解码到可复用的缓冲区后直接发送
+        :param path:图片文件路径,可用LCDImage.txt_to_raw、LCDImage.encode_rle等工具生成
+        :param x:起点x
+        :param y:起点y
+        :param stripe_size:单次发送的最大字节数,默认与Fill相同
+        '''
+        from usr.LCDImage import read_header, RLE_MAGIC
+        with open(path, 'rb') as f:
+            head = read_header(f)
+            if head is None:
+                raise CustomError('{} is not an RGB565 image file'.format(path))
+            if head[0] == RLE_MAGIC:
+                self._show_rle(f, x, y, head[1], head[2], head[3], stripe_size)
+            else:
+                self._show_raw(f, x, y, head[1], head[2], head[3], stripe_size)
+
+    def _show_rle(self, f, x, y, width, height, palette_size, stripe_size=None):
+        '''
+        从文件当前位置流式解码RLE数据,每解满一个条带发送一次
+        '''
+        from usr.LCDImage import RleDecoder
+        decoder = RleDecoder(f, palette_size)
+        row = width * 2
+        if stripe_size is None:
+            stripe_size = self._stripe_size
+        rows = min(max(1, stripe_size // row), height)
+        ys = y
+        end = y + height
+        while ys < end:
+            n = min(rows, end - ys)
+            buf = _stripe(row * n)
+            decoder.read(memoryview(buf), width * n)
+            self._write(buf, x, ys, x + width - 1, ys + n - 1)
+            ys += n
+
+    def _show_raw(self, f, x, y, width, height, stride, stripe_size=None):
+        '''
+        从文件当前位置读取按行存放的RGB565数据并按条带显示
+        '''
+        row = width * 2
+        if stripe_size is None:
+            stripe_size = self._stripe_size
+        rows = min(max(1, stripe_size // row), height)
+        pad = stride - row
+        ys = y
+        end = y + height
+        while ys < end:
+            n = min(rows, end - ys)
+            buf = _stripe(row * n)
+            mv = memoryview(buf)
+            if pad == 0:
+                got = f.readinto(mv)
+            else:
+                got = 0
+                for r in range(n):
+                    got += f.readinto(mv[r * row:(r + 1) * row])
+                    f.seek(pad, 1)
+            if got != row * n:
+                raise ValueError('truncated image')
+            self._write(buf, x, ys, x + width - 1, ys + n - 1)
+            ys += n
 
     def lcd_show_image_file(self, path, x, y, width, heigth, h):
         '''
@@ -286,7 +1534,17 @@ class Peripheral_LCD(object):
         :param width:图片宽度
         :param heigth:图片高度
         :param h:分割后每个图片的高度
+        LCDImage格式的二进制文件会被自动识别并按 width * h * 2 字节的条带流式显示,此时宽高以文件头为准
         '''
+        from usr.LCDImage import read_header, RLE_MAGIC
+        with open(path, 'rb') as f:
+            head = read_header(f)
+            if head is not None:
+                if head[0] == RLE_MAGIC:
+                    self._show_rle(f, x, y, head[1], head[2], head[3], head[1] * h * 2)
+                else:
+                    self._show_raw(f, x, y, head[1], head[2], head[3], head[1] * h * 2)
+                return
         image_data = []
         read_n = 0  # 已经读取的字节数
         byte_n = 0  # 字节数
@@ -318,12 +1576,45 @@ class Peripheral_LCD(object):
                             if h2 != 0:
                                 self.lcd_show_image(image_data, xs, ys, width, h2)
 
+    def SetScrollArea(self, tfa, vsa, bfa=None):
+        '''
+        设置硬件垂直滚动区域(VSCRDEF,0x33),滚动区域按整行滚动
+        仅支持声明了_scroll_lines(控制器显存行数)的屏,且屏幕方向不能交换行列或倒转行序,也不能设置SetRotation
+        :param tfa: 顶部固定区域行数
+        :param vsa: 滚动区域行数
+        :param bfa: 底部固定区域行数,默认为显存剩余行数
+        :return: 屏幕支持硬件滚动时返回True,否则返回False且不发送命令
+        '''
+        lines = getattr(self._child_self, '_scroll_lines', 0)
+        if not lines or self._xf is not None:
+            return False
+        if bfa is None:
+            bfa = lines - tfa - vsa
+        if tfa < 0 or vsa <= 0 or bfa < 0 or tfa + vsa + bfa != lines:
+            raise CustomError('invalid scroll area {}+{}+{} for {} lines'.format(tfa, vsa, bfa, lines))
+        lcd = self._child_self._lcd
+        lcd.lcd_write_cmd(0x33, 1)
+        for v in (tfa, vsa, bfa):
+            lcd.lcd_write_data(v >> 8, 1)
+            lcd.lcd_write_data(v & 0xff, 1)
+        return True
+
+    def SetScrollStart(self, line):
+        '''
+        设置滚动区域的起始显存行(VSCRSADD,0x37),取值范围为[tfa, tfa+vsa)
+        '''
+        lcd = self._child_self._lcd
+        lcd.lcd_write_cmd(0x37, 1)
+        lcd.lcd_write_data(line >> 8, 1)
+        lcd.lcd_write_data(line & 0xff, 1)
+
     @staticmethod
     def get_rgb565_color(r, g, b):
         '''
         将24位色转换位16位色
         如红色的24位色为0xFF0000，则r=0xFF,g=0x00,b=0x00,
         将r、g、b的值传入下面函数即可得到16位相同颜色数据
+        整块缓冲的转换见LCDColor模块
         '''
         return ((r << 8) & 0xF800) | ((g << 3) & 0x07E0) | ((b >> 3) & 0x001F)
 
@@ -332,3 +1623,88 @@ class Peripheral_LCD(object):
 
 
          
+
+
+class Console(object):
+    '''
+    终端/日志窗口,占用屏幕上整行宽度的一块区域
+    屏幕支持硬件滚动时,追加一行只重绘该行并修改滚动起始行;否则退回到整块区域重绘
+    '''
+    def __init__(self, lcd, top=0, height=None, size=16, fc=0xFFFF, bc=0x0000):
+        '''
+        :param lcd: Peripheral_LCD子类实例
+        :param top: 区域起始行
+        :param height: 区域高度,默认到屏幕底部,按行高向下取整
+        :param size: 字高,同ShowText
+        :param fc: 字体颜色
+        :param bc: 背景颜色
+        '''
+        sizes = _TEXT_FONTS.get(size)
+        if sizes is None:
+            raise CustomError('unsupported text size {}'.format(size))
+        if height is None:
+            height = lcd._child_self._lcd_h - top
+        self._lcd = lcd
+        self._top = top
+        self._size = size
+        self._fc = fc
+        self._bc = bc
+        self.rows = height // size
+        if self.rows <= 0:
+            raise CustomError('console area is smaller than one line')
+        # 一行固定写满屏幕宽度,用空格补齐即可一次写入同时擦除旧内容
+        self._pad = ' ' * (lcd._child_self._lcd_w // sizes[0][0] + 1)
+        self._hw = lcd.SetScrollArea(top, self.rows * size)
+        self._lines = None if self._hw else []
+        self.clear()
+
+    def clear(self):
+        '''
+        清空窗口并复位滚动位置
+        '''
+        lcd = self._lcd
+        lcd.Fill(0, self._top, lcd._child_self._lcd_w - 1, self._top + self.rows * self._size - 1, self._bc)
+        self._count = 0
+        self._offset = 0
+        if self._hw:
+            lcd.SetScrollStart(self._top)
+        else:
+            self._lines = []
+
+    def _draw(self, row, text):
+        self._lcd.ShowText(0, self._top + row * self._size, text + self._pad, self._fc, self._bc, self._size)
+
+    def append(self, text):
+        '''
+        追加文本,'\n'分隔多行,超出屏幕宽度的部分被裁剪
+        '''
+        for line in text.split('\n'):
+            if self._hw:
+                self._append_hw(line)
+            else:
+                self._append_sw(line)
+        self._lcd.flush()
+
+    def _append_hw(self, line):
+        if self._count < self.rows:
+            self._draw(self._count, line)
+            self._count += 1
+            return
+        # 窗口已满:最旧的一行所在的显存行写入新行,再把滚动起点移到下一行
+        self._draw(self._offset, line)
+        self._offset = (self._offset + 1) % self.rows
+        lcd = self._lcd
+        if lcd._fb is not None:
+            lcd.flush()
+        lcd.SetScrollStart(self._top + self._offset * self._size)
+
+    def _append_sw(self, line):
+        lines = self._lines
+        if len(lines) < self.rows:
+            lines.append(line)
+            self._draw(len(lines) - 1, line)
+            return
+        lines.pop(0)
+        lines.append(line)
+        for row in range(self.rows):
+            self._draw(row, lines[row])
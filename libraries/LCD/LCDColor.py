@@ -0,0 +1,170 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+整块缓冲的颜色转换工具
+
+所有转换都写入调用者提供的bytearray,不在转换过程中分配内存;
+逐像素只做查表和按位或,结果与Peripheral_LCD.get_rgb565_color逐个转换完全一致。
+输出默认按lcd_write的顺序存放(低字节在前),swap=True时高字节在前。
+
+RGB565的两个字节可以由各通道独立查表后按位或得到:
+    低字节 = G_LO[g] | B_LO[b]
+    高字节 = R_HI[r] | G_HI[g]
+'''
+
+_tables = None
+
+
+def _rgb_tables(lut=None):
+    '''
+    生成(R_HI, G_HI, G_LO, B_LO)四张256字节的查表,lut不为None时先对各通道应用lut
+    '''
+    global _tables
+    if lut is None and _tables is not None:
+        return _tables
+    idx = range(256) if lut is None else lut
+    tables = (
+        bytes([v & 0xF8 for v in idx]),
+        bytes([v >> 5 for v in idx]),
+        bytes([(v << 3) & 0xE0 for v in idx]),
+        bytes([v >> 3 for v in idx]),
+    )
+    if lut is None:
+        _tables = tables
+    return tables
+
+
+def _check(dst, n):
+    if len(dst) < n * 2:
+        raise ValueError('output buffer too small: {} < {}'.format(len(dst), n * 2))
+
+
+def rgb888_to_rgb565(src, dst, bgr=False, swap=False, lut=None):
+    '''
+    RGB888转RGB565
+    :param src: 每像素3字节的输入缓冲
+    :param dst: 输出bytearray,长度不小于像素数 * 2
+    :param bgr: 输入按B、G、R顺序存放时为True
+    :param swap: 为True时输出高字节在前
+    :param lut: 转换前对各通道应用的256字节查表(如gamma_lut、brightness_lut的结果)
+    :return: 转换的像素数
+    '''
+    n = len(src) // 3
+    _check(dst, n)
+    r_hi, g_hi, g_lo, b_lo = _rgb_tables(lut)
+    ri, bi = (2, 0) if bgr else (0, 2)
+    lo_i, hi_i = (1, 0) if swap else (0, 1)
+    s = 0
+    d = 0
+    for _ in range(n):
+        r = src[s + ri]
+        g = src[s + 1]
+        b = src[s + bi]
+        dst[d + lo_i] = g_lo[g] | b_lo[b]
+        dst[d + hi_i] = r_hi[r] | g_hi[g]
+        s += 3
+        d += 2
+    return n
+
+
+def gray_to_rgb565(src, dst, swap=False, lut=None):
+    '''
+    8位灰度转RGB565,结果与get_rgb565_color(v, v, v)一致
+    :param src: 每像素1字节的输入缓冲
+    :param dst: 输出bytearray,长度不小于像素数 * 2
+    :param swap: 为True时输出高字节在前
+    :param lut: 转换前应用的256字节查表
+    :return: 转换的像素数
+    '''
+    n = len(src)
+    _check(dst, n)
+    r_hi, g_hi, g_lo, b_lo = _rgb_tables(lut)
+    # 灰度只有256种取值,先把每种取值对应的两个字节排好
+    pair = bytearray(512)
+    lo_i, hi_i = (1, 0) if swap else (0, 1)
+    for v in range(256):
+        pair[v * 2 + lo_i] = g_lo[v] | b_lo[v]
+        pair[v * 2 + hi_i] = r_hi[v] | g_hi[v]
+    d = 0
+    for v in src:
+        v += v
+        dst[d] = pair[v]
+        dst[d + 1] = pair[v + 1]
+        d += 2
+    return n
+
+
+def swap_bytes(src, dst=None):
+    '''
+    交换RGB565缓冲中每个像素的高低字节,用于适配高字节在前的屏
+    :param src: RGB565缓冲
+    :param dst: 输出bytearray,为None时原地交换
+    :return: 输出缓冲
+    '''
+    if dst is None:
+        dst = src
+    n = len(src) & ~1
+    if len(dst) < n:
+        raise ValueError('output buffer too small: {} < {}'.format(len(dst), n))
+    for i in range(0, n, 2):
+        a = src[i]
+        dst[i] = src[i + 1]
+        dst[i + 1] = a
+    return dst
+
+
+def gamma_lut(gamma):
+    '''
+    生成gamma查表: out = 255 * (in / 255) ** gamma
+    '''
+    return bytes([int(255 * (i / 255) ** gamma + 0.5) for i in range(256)])
+
+
+def brightness_lut(level):
+    '''
+    生成亮度查表: out = in * level / 255
+    :param level: 亮度,0~255,255为原亮度
+    '''
+    level = max(0, min(255, level))
+    return bytes([(i * level + 127) // 255 for i in range(256)])
+
+
+def apply_lut_rgb565(src, lut, dst=None, swap=False):
+    '''
+    对RGB565缓冲的各通道应用256字节查表(如亮度、gamma)
+    各通道先按get_rgb565_color的逆运算扩展到8位(低位补高位),查表后再截回5/6位
+    :param src: RGB565缓冲
+    :param lut: 256字节查表
+    :param dst: 输出bytearray,为None时原地修改
+    :param swap: 缓冲为高字节在前时为True
+    :return: 输出缓冲
+    '''
+    if dst is None:
+        dst = src
+    n = len(src) // 2
+    _check(dst, n)
+    r_t = bytes([lut[(c << 3) | (c >> 2)] & 0xF8 for c in range(32)])
+    g_t = bytes([lut[(c << 2) | (c >> 4)] >> 2 for c in range(64)])
+    b_t = bytes([lut[(c << 3) | (c >> 2)] >> 3 for c in range(32)])
+    lo_i, hi_i = (1, 0) if swap else (0, 1)
+    d = 0
+    for _ in range(n):
+        lo = src[d + lo_i]
+        hi = src[d + hi_i]
+        g = g_t[((hi & 0x07) << 3) | (lo >> 5)]
+        dst[d + lo_i] = ((g << 5) & 0xE0) | b_t[lo & 0x1F]
+        dst[d + hi_i] = r_t[hi >> 3] | (g >> 3)
+        d += 2
+    return dst
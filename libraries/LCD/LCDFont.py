@@ -0,0 +1,209 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+二进制字库文件
+
+文件格式(小端):
+    0   4   魔数 b'QFNT'
+    4   1   版本号
+    5   1   每像素位数(bpp)
+    6   1   字宽(像素)
+    7   1   字高(像素)
+    8   2   每个字形的字节数
+    10  2   保留
+    12  4   字形数量count
+    16      索引区: count个4字节Unicode码点,升序排列
+    16+4*count  点阵区: count个字形,顺序与索引一致
+
+1bpp点阵与内置字库(font_*模块)的字模相同(阴码、逐行式、顺向),可直接交给Peripheral_LCD渲染。
+4bpp点阵为抗锯齿字模:逐行存放,每字节2个像素,高半字节在前,每行补齐到整字节;
+每个像素0~15表示前景色所占的比例,渲染时按(前景色, 背景色)查16级过渡色表。
+加载时只读取文件头,字形按需seek读取,并放入一个小缓存。
+'''
+
+from usr.LCD import GlyphCache
+
+FONT_MAGIC = b'QFNT'
+FONT_VERSION = 1
+_HEADER_SIZE = 16
+_INDEX_IN_RAM = 256     # 字形数量不超过该值时索引一次性读入内存
+_BPP = (1, 4)           # 支持的每像素位数
+
+
+def _codepoint(ch):
+    '''
+    获取字符的Unicode码点,兼容按UTF-8字节存储str的固件
+    '''
+    if len(ch) == 1:
+        return ord(ch)
+    c = ord(ch[0])
+    if c >= 0xF0:
+        cp = c & 0x07
+    elif c >= 0xE0:
+        cp = c & 0x0F
+    else:
+        cp = c & 0x1F
+    for i in range(1, len(ch)):
+        cp = (cp << 6) | (ord(ch[i]) & 0x3F)
+    return cp
+
+
+def write_font(path, width, height, glyphs, bpp=1):
+    '''
+    生成二进制字库文件
+    :param path: 输出文件路径
+    :param width: 字宽
+    :param height: 字高
+    :param glyphs: (字符或码点, 点阵数据)的可迭代对象,点阵长度必须一致
+    :param bpp: 每像素位数
+    :return: 写入的字形数量
+    '''
+    items = []
+    for ch, bitmap in glyphs:
+        if not isinstance(ch, int):
+            ch = _codepoint(ch)
+        items.append((ch, bytes(bitmap)))
+    items.sort(key=lambda item: item[0])
+    glyph_size = len(items[0][1]) if items else 0
+    for cp, bitmap in items:
+        if len(bitmap) != glyph_size:
+            raise ValueError('glyph U+{:04X} has {} bytes, expected {}'.format(cp, len(bitmap), glyph_size))
+    with open(path, 'wb') as f:
+        f.write(FONT_MAGIC)
+        f.write(bytes((FONT_VERSION, bpp, width, height)))
+        f.write(glyph_size.to_bytes(2, 'little'))
+        f.write(bytes(2))
+        f.write(len(items).to_bytes(4, 'little'))
+        for cp, bitmap in items:
+            f.write(cp.to_bytes(4, 'little'))
+        for cp, bitmap in items:
+            f.write(bitmap)
+    return len(items)
+
+
+def pack_4bpp(levels, width, height):
+    '''
+    将逐行存放的灰度值打包为4bpp字模
+    :param levels: width * height个0~255的灰度值,0为背景色,255为前景色
+    :return: 每行(width + 1) // 2字节的点阵数据
+    '''
+    stride = (width + 1) // 2
+    out = bytearray(stride * height)
+    for y in range(height):
+        row = y * width
+        for x in range(width):
+            v = (levels[row + x] * 15 + 127) // 255
+            if x & 1:
+                out[y * stride + (x >> 1)] |= v
+            else:
+                out[y * stride + (x >> 1)] |= v << 4
+    return bytes(out)
+
+
+def font_from_dict(font_dict, path, width, height):
+    '''
+    将字典字库(如font_ascii_8x16.ascii_8x16_dict)转换为二进制字库文件
+    '''
+    return write_font(path, width, height, font_dict.items())
+
+
+class BinFont(object):
+    '''
+    二进制字库,接口与字典字库相同(get),可通过Peripheral_LCD.SetFont注册使用,
+    bpp为4时Peripheral_LCD按抗锯齿字模渲染
+    '''
+    def __init__(self, path, cache_budget=2048):
+        self._f = open(path, 'rb')
+        head = self._f.read(_HEADER_SIZE)
+        if len(head) != _HEADER_SIZE or head[0:4] != FONT_MAGIC:
+            self._f.close()
+            raise ValueError('not a font file: {}'.format(path))
+        if head[4] != FONT_VERSION:
+            self._f.close()
+            raise ValueError('unsupported font version {}'.format(head[4]))
+        if head[5] not in _BPP:
+            self._f.close()
+            raise ValueError('unsupported bpp {}'.format(head[5]))
+        self.bpp = head[5]
+        self.width = head[6]
+        self.height = head[7]
+        self.glyph_size = int.from_bytes(head[8:10], 'little')
+        self.count = int.from_bytes(head[12:16], 'little')
+        self._data = _HEADER_SIZE + self.count * 4
+        self._index = None
+        if self.count <= _INDEX_IN_RAM:
+            self._index = self._f.read(self.count * 4)
+        self._cache = GlyphCache(cache_budget)
+
+    def _code_at(self, i):
+        if self._index is not None:
+            return int.from_bytes(self._index[i * 4:i * 4 + 4], 'little')
+        self._f.seek(_HEADER_SIZE + i * 4)
+        return int.from_bytes(self._f.read(4), 'little')
+
+    def _find(self, cp):
+        '''
+        在索引区中二分查找码点,返回字形序号,不存在时返回-1
+        '''
+        lo = 0
+        hi = self.count - 1
+        while lo <= hi:
+            mid = (lo + hi) >> 1
+            v = self._code_at(mid)
+            if v == cp:
+                return mid
+            if v < cp:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return -1
+
+    def get(self, ch, default=None):
+        '''
+        读取字符的点阵数据,字库中没有该字符时返回default
+        '''
+        cp = _codepoint(ch)
+        bitmap = self._cache.get(cp)
+        if bitmap is None:
+            i = self._find(cp)
+            if i < 0:
+                return default
+            self._f.seek(self._data + i * self.glyph_size)
+            bitmap = self._f.read(self.glyph_size)
+            self._cache.put(cp, bitmap)
+        return bitmap
+
+    def __contains__(self, ch):
+        return self._find(_codepoint(ch)) >= 0
+
+    def close(self):
+        self._f.close()
+
+
+if __name__ == '__main__':
+    from usr.font_ascii_8x16 import ascii_8x16_dict
+    from usr.font_ascii_16x24 import ascii_16x24_dict
+    from usr.font_hanzi_16x16 import hanzi_16x16_dict
+    from usr.font_hanzi_16x24 import hanzi_16x24_dict
+    from usr.font_hanzi_24x24 import hanzi_24x24_dict
+
+    font_from_dict(ascii_8x16_dict, '/usr/ascii_8x16.fnt', 8, 16)
+    font_from_dict(ascii_16x24_dict, '/usr/ascii_16x24.fnt', 16, 24)
+    font_from_dict(hanzi_16x16_dict, '/usr/hanzi_16x16.fnt', 16, 16)
+    font_from_dict(hanzi_16x24_dict, '/usr/hanzi_16x24.fnt', 16, 24)
+    font_from_dict(hanzi_24x24_dict, '/usr/hanzi_24x24.fnt', 24, 24)
+
+    font = BinFont('/usr/ascii_8x16.fnt')
+    print(font.width, font.height, font.count, font.get('A'))
@@ -0,0 +1,359 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+图片文件格式与转换工具
+
+原始RGB565图片(.bin)格式(小端):
+    0   4   魔数 b'Q565'
+    4   2   宽度(像素)
+    6   2   高度(像素)
+    8   2   行跨度stride(每行字节数,不小于 宽度 * 2)
+    10  2   保留
+    12      像素数据: 高度行,每行stride字节,前 宽度 * 2 字节为RGB565(低字节在前),与lcd_write的数据顺序一致
+
+显示时由Peripheral_LCD.lcd_show_image_bin按条带readinto到可复用的缓冲区后直接发送,不经过文本解析。
+
+压缩图片(.rle)格式(小端):
+    0   4   魔数 b'QRLE'
+    4   2   宽度(像素)
+    6   2   高度(像素)
+    8   2   调色板颜色数(0、16或256),为0时像素直接以RGB565存放
+    10  2   保留
+    12      调色板: 颜色数 * 2 字节RGB565
+            数据包: 像素按行连续编码,可跨行
+                控制字节c的最高位为1时,后跟1个像素,重复(c & 0x7F) + 1次
+                控制字节c的最高位为0时,后跟c + 1个不同的像素
+            像素的存放方式: 无调色板时2字节RGB565;256色时1字节索引;
+            16色时重复包为1字节索引,不同像素包每字节存2个索引(高4位在前)
+
+纯色较多的图标、背景压缩后通常只有原始大小的几分之一到几十分之一,
+显示时由RleDecoder直接解码到条带缓冲区再发送,解码结果与原始RGB565数据逐字节一致。
+'''
+
+from usr.LCD import _fill16
+
+RAW_MAGIC = b'Q565'
+RLE_MAGIC = b'QRLE'
+HEADER_SIZE = 12
+_MAX_RUN = 128
+
+
+def read_header(f):
+    '''
+    读取图片文件头
+    :param f: 以'rb'方式打开的文件对象
+    :return: (魔数, 宽度, 高度, stride或调色板颜色数),不是本模块的图片格式时返回None
+    '''
+    head = f.read(HEADER_SIZE)
+    if len(head) != HEADER_SIZE or head[0:4] not in (RAW_MAGIC, RLE_MAGIC):
+        return None
+    return (bytes(head[0:4]),
+            int.from_bytes(head[4:6], 'little'),
+            int.from_bytes(head[6:8], 'little'),
+            int.from_bytes(head[8:10], 'little'))
+
+
+def _write_header(f, magic, width, height, stride):
+    f.write(magic)
+    f.write(width.to_bytes(2, 'little'))
+    f.write(height.to_bytes(2, 'little'))
+    f.write(stride.to_bytes(2, 'little'))
+    f.write(bytes(2))
+
+
+def write_raw(path, width, height, data, stride=None):
+    '''
+    保存RGB565图片文件
+    :param path: 输出文件路径
+    :param width: 宽度
+    :param height: 高度
+    :param data: 按行存放的RGB565数据,长度为 宽度 * 高度 * 2
+    :param stride: 行跨度,大于 宽度 * 2 时每行末尾补0
+    '''
+    row = width * 2
+    if stride is None:
+        stride = row
+    if stride < row:
+        raise ValueError('stride {} is smaller than a row ({} bytes)'.format(stride, row))
+    if len(data) != row * height:
+        raise ValueError('expected {} bytes of pixel data, got {}'.format(row * height, len(data)))
+    pad = bytes(stride - row)
+    mv = memoryview(data)
+    with open(path, 'wb') as f:
+        _write_header(f, RAW_MAGIC, width, height, stride)
+        for r in range(height):
+            f.write(mv[r * row:(r + 1) * row])
+            if pad:
+                f.write(pad)
+
+
+def txt_to_raw(txt_path, bin_path, width, height):
+    '''
+    将lcd_show_image_file使用的文本图片(逗号分隔的十进制字节)转换为RGB565图片文件,按行流式转换
+    :param txt_path: 文本图片路径
+    :param bin_path: 输出文件路径
+    :param width: 图片宽度
+    :param height: 图片高度
+    '''
+    total = width * height * 2
+    n = 0
+    with open(txt_path, 'r') as src, open(bin_path, 'wb') as dst:
+        _write_header(dst, RAW_MAGIC, width, height, width * 2)
+        while n < total:
+            line = src.readline()
+            if line == '':
+                break
+            values = [int(v) for v in line.strip('\r\n').strip(',').split(',') if v.strip()]
+            if n + len(values) > total:
+                values = values[:total - n]
+            dst.write(bytes(values))
+            n += len(values)
+    if n != total:
+        raise ValueError('{} has {} bytes, expected {}'.format(txt_path, n, total))
+
+
+def _palette_size(colors):
+    if colors <= 16:
+        return 16
+    if colors <= 256:
+        return 256
+    return 0
+
+
+def encode_rle(path, width, height, data, palette=True):
+    '''
+    将RGB565数据压缩保存为RLE图片文件
+    :param path: 输出文件路径
+    :param width: 宽度
+    :param height: 高度
+    :param data: 按行存放的RGB565数据(低字节在前),长度为 宽度 * 高度 * 2
+    :param palette: 为True时颜色数不超过256则使用16色或256色调色板
+    :return: 压缩后的文件大小
+    '''
+    npix = width * height
+    if len(data) != npix * 2:
+        raise ValueError('expected {} bytes of pixel data, got {}'.format(npix * 2, len(data)))
+    pixels = [data[i] | (data[i + 1] << 8) for i in range(0, npix * 2, 2)]
+    colors = {}
+    pal_size = 0
+    if palette:
+        for p in pixels:
+            if p not in colors:
+                colors[p] = len(colors)
+                if len(colors) > 256:
+                    break
+        pal_size = _palette_size(len(colors))
+    out = bytearray()
+    if pal_size:
+        pal = bytearray(pal_size * 2)
+        for p, i in colors.items():
+            pal[i * 2] = p & 0xff
+            pal[i * 2 + 1] = p >> 8
+        out += pal
+        values = [colors[p] for p in pixels]
+    else:
+        values = pixels
+
+    def put(v):
+        if pal_size:
+            out.append(v)
+        else:
+            out.append(v & 0xff)
+            out.append(v >> 8)
+
+    i = 0
+    lit = []
+    while i < npix:
+        v = values[i]
+        n = 1
+        while i + n < npix and n < _MAX_RUN and values[i + n] == v:
+            n += 1
+        if n >= 3 or (n == 2 and not lit):
+            while lit:
+                chunk = lit[:_MAX_RUN]
+                lit = lit[_MAX_RUN:]
+                out.append(len(chunk) - 1)
+                if pal_size == 16:
+                    for k in range(0, len(chunk), 2):
+                        lo = chunk[k + 1] if k + 1 < len(chunk) else 0
+                        out.append((chunk[k] << 4) | lo)
+                else:
+                    for c in chunk:
+                        put(c)
+            out.append(0x80 | (n - 1))
+            put(v)
+            i += n
+        else:
+            lit.append(v)
+            i += 1
+            if len(lit) == _MAX_RUN:
+                out.append(_MAX_RUN - 1)
+                if pal_size == 16:
+                    for k in range(0, _MAX_RUN, 2):
+                        out.append((lit[k] << 4) | lit[k + 1])
+                else:
+                    for c in lit:
+                        put(c)
+                lit = []
+    if lit:
+        out.append(len(lit) - 1)
+        if pal_size == 16:
+            for k in range(0, len(lit), 2):
+                lo = lit[k + 1] if k + 1 < len(lit) else 0
+                out.append((lit[k] << 4) | lo)
+        else:
+            for c in lit:
+                put(c)
+    with open(path, 'wb') as f:
+        _write_header(f, RLE_MAGIC, width, height, pal_size)
+        f.write(out)
+    return HEADER_SIZE + len(out)
+
+
+def raw_to_rle(raw_path, rle_path, palette=True):
+    '''
+    将RGB565图片文件转换为RLE图片文件
+    :return: 压缩后的文件大小
+    '''
+    with open(raw_path, 'rb') as f:
+        head = read_header(f)
+        if head is None or head[0] != RAW_MAGIC:
+            raise ValueError('{} is not an RGB565 image file'.format(raw_path))
+        width, height, stride = head[1], head[2], head[3]
+        row = width * 2
+        data = bytearray(row * height)
+        mv = memoryview(data)
+        got = 0
+        for r in range(height):
+            got += f.readinto(mv[r * row:(r + 1) * row])
+            if stride > row:
+                f.seek(stride - row, 1)
+    if got != len(data):
+        raise ValueError('{} has {} bytes of pixel data, expected {}'.format(raw_path, got, len(data)))
+    return encode_rle(rle_path, width, height, data, palette)
+
+
+class RleDecoder(object):
+    '''
+    RLE图片的流式解码器,每次解出指定数量的像素写入调用方提供的缓冲区,数据包可以跨越多次调用
+    '''
+    def __init__(self, f, palette_size, chunk_size=512):
+        self._f = f
+        self._pal_size = palette_size
+        self._pal = f.read(palette_size * 2) if palette_size else None
+        self._buf = bytearray(chunk_size)
+        self._len = 0
+        self._pos = 0
+        self._repeat = False    # 当前数据包是否为重复包
+        self._left = 0          # 当前数据包剩余的像素数
+        self._lo = 0            # 重复包的像素低字节
+        self._hi = 0            # 重复包的像素高字节
+        self._nibble = -1       # 16色不同像素包中尚未使用的低4位索引
+
+    def _byte(self):
+        if self._pos >= self._len:
+            self._len = self._f.readinto(self._buf)
+            self._pos = 0
+            if not self._len:
+                raise ValueError('truncated RLE image')
+        v = self._buf[self._pos]
+        self._pos += 1
+        return v
+
+    def _pixel(self, mv, o):
+        '''
+        读取一个像素写入mv[o:o + 2]
+        '''
+        if self._pal_size == 0:
+            mv[o] = self._byte()
+            mv[o + 1] = self._byte()
+            return
+        if self._pal_size == 16 and not self._repeat:
+            if self._nibble >= 0:
+                i = self._nibble
+                self._nibble = -1
+            else:
+                v = self._byte()
+                i = v >> 4
+                self._nibble = v & 0x0f
+        else:
+            i = self._byte()
+        mv[o] = self._pal[i * 2]
+        mv[o + 1] = self._pal[i * 2 + 1]
+
+    def read(self, mv, npix):
+        '''
+        解码npix个像素写入mv(RGB565,低字节在前)
+        '''
+        o = 0
+        end = npix * 2
+        while o < end:
+            if self._left == 0:
+                c = self._byte()
+                self._nibble = -1
+                if c & 0x80:
+                    self._repeat = True
+                    self._left = (c & 0x7f) + 1
+                    self._pixel(mv, o)
+                    self._lo = mv[o]
+                    self._hi = mv[o + 1]
+                    self._left -= 1
+                    o += 2
+                    continue
+                self._repeat = False
+                self._left = c + 1
+            n = min(self._left, (end - o) // 2)
+            if self._repeat:
+                _fill16(mv[o:o + n * 2], self._lo | (self._hi << 8), n * 2)
+                o += n * 2
+            else:
+                for k in range(n):
+                    self._pixel(mv, o)
+                    o += 2
+            self._left -= n
+
+
+def decode_rle(rle_path):
+    '''
+    将RLE图片完整解码为RGB565数据,用于与原始图片逐字节比对
+    :return: (宽度, 高度, bytearray)
+    '''
+    with open(rle_path, 'rb') as f:
+        head = read_header(f)
+        if head is None or head[0] != RLE_MAGIC:
+            raise ValueError('{} is not an RLE image file'.format(rle_path))
+        width, height = head[1], head[2]
+        data = bytearray(width * height * 2)
+        RleDecoder(f, head[3]).read(memoryview(data), width * height)
+    return width, height, data
+
+
+def verify_rle(rle_path, raw_path):
+    '''
+    逐字节比对RLE图片的解码结果与原始RGB565图片
+    :return: 一致时返回True
+    '''
+    width, height, data = decode_rle(rle_path)
+    with open(raw_path, 'rb') as f:
+        head = read_header(f)
+        if head is None or head[0] != RAW_MAGIC or head[1] != width or head[2] != height:
+            return False
+        row = width * 2
+        for r in range(height):
+            if f.read(row) != data[r * row:(r + 1) * row]:
+                return False
+            if head[3] > row:
+                f.seek(head[3] - row, 1)
+    return True
@@ -0,0 +1,245 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+单色屏(按8像素一页组织显存,如SSD1306、UC1628)的1bpp页帧缓冲
+
+帧缓冲按页存放: 第p页第x列的字节位于 p * 宽 + x,字节的bit0为该页最上面一行;
+绘图接口与Peripheral_LCD相同,只写入帧缓冲,脏区域按页记录列范围,flush()时只发送变化的页段。
+128x64的屏整屏刷新为1KB,而经RGB565通道需要16KB。
+RGB565颜色按亮度转换为单色: 亮度超过一半的颜色点亮像素,如0xFFFF点亮,0x0000熄灭。
+'''
+
+from usr.LCD import Peripheral_LCD, CustomError, _stripe
+
+_PAGE_MERGE = 16    # 相邻页合并为一次窗口写入时,允许多发送的字节数(约等于一次窗口设置的开销)
+_lum_hi = None
+_lum_lo = None
+
+
+def _lum_tables():
+    '''
+    RGB565高、低字节各自对应的亮度分量(5位红 + 绿的高5位 + 5位蓝,最大93)
+    '''
+    global _lum_hi, _lum_lo
+    if _lum_hi is None:
+        _lum_hi = bytes([(v >> 3) + ((v & 0x07) << 2) for v in range(256)])
+        _lum_lo = bytes([(v >> 6) + (v & 0x1F) for v in range(256)])
+    return _lum_hi, _lum_lo
+
+
+def _mono(color):
+    '''
+    RGB565颜色是否点亮像素
+    '''
+    hi, lo = _lum_tables()
+    return hi[(color >> 8) & 0xFF] + lo[color & 0xFF] >= 47
+
+
+class Peripheral_MonoLCD(Peripheral_LCD):
+    '''
+    单色页寻址屏的通用类,子类与Peripheral_LCD的子类相同,需提供_lcd、_lcd_w和_lcd_h
+    屏幕窗口按(起始列, 起始页, 结束列, 结束页)传给lcd_write,数据按页依次存放
+    绘图只写入帧缓冲,调用flush()后发送;Clear()立即发送整屏
+    额外接口: ShowPages(data, x, page, width, pages)
+    地址命令中没有窗口占位符的屏(如UC1628)将_full_flush设为True,flush()时发送整屏
+    '''
+    _full_flush = False
+
+    def __init__(self, child_self=None):
+        super().__init__(child_self)
+        self._pages = (self._child_self._lcd_h + 7) >> 3
+        self._buf = bytearray(self._child_self._lcd_w * self._pages)
+        self._page_dirty = [None] * self._pages
+
+    def EnableFrameBuffer(self, color=None, stripe_size=None):
+        '''
+        单色屏始终使用页帧缓冲,color不为None时清屏
+        '''
+        if color is not None:
+            self.Clear(color)
+
+    def DisableFrameBuffer(self):
+        '''
+        单色屏始终使用页帧缓冲,这里只刷新未发送的脏区域
+        '''
+        self.flush()
+
+    def SetRotation(self, rotation=0, mirror_x=False, mirror_y=False):
+        '''
+        页帧缓冲按屏幕方向存放,不支持运行时旋转和镜像
+        '''
+        if rotation or mirror_x or mirror_y:
+            raise CustomError('rotation is not supported on page-addressed displays')
+
+    def _mark_page(self, page, x0, x1):
+        d = self._page_dirty[page]
+        if d is None:
+            self._page_dirty[page] = [x0, x1]
+        else:
+            if x0 < d[0]:
+                d[0] = x0
+            if x1 > d[1]:
+                d[1] = x1
+
+    def DrawPoint(self, x, y, color):
+        '''
+        画点
+        '''
+        if 0 <= x < self._child_self._lcd_w and 0 <= y < self._child_self._lcd_h:
+            page = y >> 3
+            i = page * self._child_self._lcd_w + x
+            if _mono(color):
+                self._buf[i] |= 1 << (y & 7)
+            else:
+                self._buf[i] &= ~(1 << (y & 7))
+            self._mark_page(page, x, x)
+
+    def Clear(self, color):
+        '''
+        清屏,整屏立即发送
+        '''
+        v = b'\xff' if _mono(color) else b'\x00'
+        self._buf[:] = v * len(self._buf)
+        w = self._child_self._lcd_w
+        for page in range(self._pages):
+            self._page_dirty[page] = [0, w - 1]
+        self.flush()
+
+    def Fill(self, x_s, y_s, x_e, y_e, color):
+        '''
+        填充矩形,整页高度的部分按字节整段填充
+        '''
+        rect = self._clip(x_s, y_s, x_e, y_e)
+        if rect is None:
+            return
+        x_s, y_s, x_e, y_e = rect
+        w = self._child_self._lcd_w
+        on = _mono(color)
+        buf = self._buf
+        n = x_e - x_s + 1
+        for page in range(y_s >> 3, (y_e >> 3) + 1):
+            top = max(y_s, page << 3) & 7
+            bot = min(y_e, (page << 3) + 7) & 7
+            mask = (0xFF << top) & (0xFF >> (7 - bot))
+            s = page * w + x_s
+            if mask == 0xFF:
+                buf[s:s + n] = (b'\xff' if on else b'\x00') * n
+            elif on:
+                for i in range(s, s + n):
+                    buf[i] |= mask
+            else:
+                mask ^= 0xFF
+                for i in range(s, s + n):
+                    buf[i] &= mask
+            self._mark_page(page, x_s, x_e)
+
+    def _write(self, buf, x_s, y_s, x_e, y_e):
+        '''
+        将RGB565数据按亮度转为单色写入帧缓冲,文字、图片、精灵等都经过这里
+        '''
+        hi, lo = _lum_tables()
+        w = self._child_self._lcd_w
+        h = self._child_self._lcd_h
+        bw = x_e - x_s + 1
+        fb = self._buf
+        cx0 = max(x_s, 0)
+        cx1 = min(x_e, w - 1)
+        if cx0 > cx1:
+            return
+        for y in range(max(y_s, 0), min(y_e, h - 1) + 1):
+            page = y >> 3
+            bit = 1 << (y & 7)
+            keep = bit ^ 0xFF
+            s = ((y - y_s) * bw + cx0 - x_s) * 2
+            d = page * w + cx0
+            for x in range(cx0, cx1 + 1):
+                if hi[buf[s + 1]] + lo[buf[s]] >= 47:
+                    fb[d] |= bit
+                else:
+                    fb[d] &= keep
+                s += 2
+                d += 1
+            self._mark_page(page, cx0, cx1)
+
+    def ShowPages(self, data, x, page, width, pages):
+        '''
+        显示按页存放的单色图片(与屏幕显存格式相同),不需要颜色转换
+        :param data: 图片数据, pages * width 字节,按页依次存放
+        :param x: 起始列
+        :param page: 起始页
+        :param width: 图片宽度(列数)
+        :param pages: 图片页数(高度 / 8)
+        '''
+        w = self._child_self._lcd_w
+        x0 = max(x, 0)
+        x1 = min(x + width, w) - 1
+        if x0 > x1:
+            return
+        src = memoryview(data)
+        for p in range(pages):
+            dp = page + p
+            if dp < 0 or dp >= self._pages:
+                continue
+            s = p * width + x0 - x
+            d = dp * w + x0
+            self._buf[d:d + x1 - x0 + 1] = src[s:s + x1 - x0 + 1]
+            self._mark_page(dp, x0, x1)
+
+    def flush(self):
+        '''
+        发送变化的页段:每页只发送脏列范围,相邻的脏页在多发送的字节不超过_PAGE_MERGE时合并为一次窗口写入
+        '''
+        lcd = self._child_self._lcd
+        w = self._child_self._lcd_w
+        dirty = self._page_dirty
+        fb = memoryview(self._buf)
+        if self._full_flush:
+            if any(d is not None for d in dirty):
+                lcd.lcd_write(self._buf, 0, 0, w - 1, self._pages - 1)
+                for p in range(self._pages):
+                    dirty[p] = None
+            return
+        page = 0
+        while page < self._pages:
+            d = dirty[page]
+            if d is None:
+                page += 1
+                continue
+            x0, x1 = d
+            cost = x1 - x0 + 1
+            end = page
+            while end + 1 < self._pages and dirty[end + 1] is not None:
+                nx0 = min(x0, dirty[end + 1][0])
+                nx1 = max(x1, dirty[end + 1][1])
+                ncost = cost + dirty[end + 1][1] - dirty[end + 1][0] + 1
+                if (nx1 - nx0 + 1) * (end + 2 - page) > ncost + _PAGE_MERGE:
+                    break
+                x0, x1, cost = nx0, nx1, ncost
+                end += 1
+            n = x1 - x0 + 1
+            if n == w and page == 0 and end == self._pages - 1:
+                out = self._buf
+            else:
+                out = _stripe(n * (end - page + 1))
+                mv = memoryview(out)
+                o = 0
+                for p in range(page, end + 1):
+                    s = p * w + x0
+                    mv[o:o + n] = fb[s:s + n]
+                    o += n
+            lcd.lcd_write(out, x0, page, x1, end)
+            for p in range(page, end + 1):
+                dirty[p] = None
+            page = end + 1
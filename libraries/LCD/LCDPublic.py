@@ -38,457 +38,25 @@ YEND        = 0xD3         # End point Y coordinate register (2byte)
 fc=black
 bc=white
 
-# 16 x 16 汉字字库
-# 宋体、阴码，逐行式，顺向（高位在前）
-hanzi_16x16_dict = {
-    '移': (0x08, 0x20, 0x1C, 0x20, 0xF0, 0x7C, 0x10, 0x84, 0x11, 0x48, 0xFC, 0x30, 0x10, 0x20, 0x30, 0x48,
-          0x39, 0x90, 0x54, 0x3E, 0x54, 0x42, 0x91, 0xA4, 0x10, 0x18, 0x10, 0x10, 0x10, 0x60, 0x11, 0x80),
-    '远': (0x00, 0x00, 0x23, 0xF8, 0x10, 0x00, 0x10, 0x00, 0x00, 0x00, 0x07, 0xFC, 0xF1, 0x20, 0x11, 0x20,
-          0x11, 0x20, 0x11, 0x20, 0x11, 0x24, 0x12, 0x24, 0x12, 0x24, 0x14, 0x1C, 0x28, 0x00, 0x47, 0xFE),
-    '通': (0x00, 0x00, 0x47, 0xF8, 0x20, 0x10, 0x21, 0xA0, 0x00, 0x40, 0x07, 0xFC, 0xE4, 0x44, 0x24, 0x44,
-          0x27, 0xFC, 0x24, 0x44, 0x24, 0x44, 0x27, 0xFC, 0x24, 0x44, 0x24, 0x54, 0x54, 0x08, 0x8F, 0xFE),
-    '信': (0x08, 0x40, 0x08, 0x20, 0x0B, 0xFE, 0x10, 0x00, 0x10, 0x00, 0x31, 0xFC, 0x30, 0x00, 0x50, 0x00,
-          0x91, 0xFC, 0x10, 0x00, 0x10, 0x00, 0x11, 0xFC, 0x11, 0x04, 0x11, 0x04, 0x11, 0xFC, 0x11, 0x04),
-    '你': (0x08, 0x80, 0x08, 0x80, 0x08, 0x80, 0x11, 0xFE, 0x11, 0x02, 0x32, 0x04, 0x34, 0x20, 0x50, 0x20,
-          0x91, 0x28, 0x11, 0x24, 0x12, 0x24, 0x12, 0x22, 0x14, 0x22, 0x10, 0x20, 0x10, 0xA0, 0x10, 0x40),
-    '好': (0x10, 0x00, 0x10, 0xFC, 0x10, 0x04, 0x10, 0x08, 0xFC, 0x10, 0x24, 0x20, 0x24, 0x20, 0x25, 0xFE,
-          0x24, 0x20, 0x48, 0x20, 0x28, 0x20, 0x10, 0x20, 0x28, 0x20, 0x44, 0x20, 0x84, 0xA0, 0x00, 0x40),
-}
-
-# 16 x 24 汉字字库
-# 宋体、阴码，逐行式，顺向（高位在前）
-hanzi_16x24_dict = {
-    '移': (0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x0E, 0x60, 0x38, 0x44, 0x08, 0x7C, 0x08, 0xCC, 0x09, 0x68,
-          0x0A, 0x30, 0x7C, 0x10, 0x08, 0x20, 0x18, 0x50, 0x1C, 0xB0, 0x1B, 0x22, 0x2A, 0x5E, 0x28, 0x44,
-          0x28, 0xC4, 0x49, 0x28, 0x08, 0x28, 0x08, 0x10, 0x08, 0x20, 0x08, 0xC0, 0x0F, 0x00, 0x00, 0x00,),
-    '远': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x08, 0x13, 0xF8, 0x10, 0x00, 0x10, 0x00, 0x00, 0x04,
-          0x03, 0x5C, 0x00, 0xA0, 0x70, 0xA0, 0x11, 0x20, 0x11, 0x20, 0x11, 0x20, 0x11, 0x20, 0x11, 0x24,
-          0x12, 0x24, 0x12, 0x36, 0x14, 0x1C, 0x68, 0x00, 0x46, 0x00, 0x43, 0xFC, 0x00, 0x00, 0x00, 0x00,),
-    '通': (0x00, 0x00, 0x00, 0x00, 0x01, 0xF8, 0x20, 0x08, 0x10, 0x90, 0x10, 0x60, 0x00, 0x44, 0x03, 0xFC,
-          0x02, 0x44, 0x12, 0x44, 0x73, 0xFC, 0x12, 0x44, 0x12, 0x44, 0x12, 0x44, 0x13, 0xFC, 0x12, 0x44,
-          0x12, 0x44, 0x12, 0x44, 0x12, 0x4C, 0x28, 0x00, 0x46, 0x00, 0x43, 0xFE, 0x00, 0x00, 0x00, 0x00,),
-    '信': (0x00, 0x00, 0x08, 0x00, 0x0C, 0x40, 0x08, 0x40, 0x08, 0x20, 0x17, 0xFE, 0x10, 0x00, 0x10, 0x00,
-          0x10, 0x08, 0x31, 0xF0, 0x30, 0x00, 0x50, 0x00, 0x53, 0xFC, 0x10, 0x00, 0x10, 0x00, 0x10, 0xFC,
-          0x11, 0x04, 0x11, 0x04, 0x11, 0x04, 0x11, 0x04, 0x11, 0xF8, 0x11, 0x04, 0x10, 0x00, 0x00, 0x00,),
-}
-
-# 24 x 24 汉字字库
-# 宋体、阴码，逐行式，顺向（高位在前）
-hanzi_24x24_dict = {
-    '移': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0xC3, 0x00, 0x1F, 0x02, 0x00, 0x02,
-          0x07, 0xF8, 0x02, 0x04, 0x18, 0x02, 0x0A, 0x30, 0x02, 0x53, 0x60, 0x7F, 0xE1, 0xC0, 0x06, 0x01,
-          0x80, 0x06, 0x03, 0xC0, 0x07, 0x0D, 0x80, 0x0E, 0xF3, 0xFC, 0x0A, 0x46, 0x0C, 0x12, 0x4C, 0x08,
-          0x12, 0x12, 0x10, 0x22, 0x21, 0x30, 0x42, 0x01, 0x60, 0x02, 0x00, 0x80, 0x02, 0x03, 0x00, 0x02,
-          0x1C, 0x00, 0x02, 0xE0, 0x00, 0x00, 0x00, 0x00,),
-    '远': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x20, 0x08, 0x7F, 0xF0, 0x0C, 0x00, 0x00, 0x04,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x01, 0xFF, 0xFC, 0x00, 0x18, 0x80, 0x7E, 0x18,
-          0x80, 0x04, 0x18, 0x80, 0x04, 0x10, 0x80, 0x04, 0x10, 0x80, 0x04, 0x10, 0x88, 0x04, 0x20, 0x88,
-          0x04, 0x60, 0x8C, 0x04, 0xC0, 0xFC, 0x1B, 0x00, 0x00, 0x31, 0x00, 0x00, 0x60, 0xFF, 0xFE, 0x00,
-          0x1F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '通': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7F, 0xE0, 0x10, 0x00, 0x30, 0x08, 0x08, 0xC0, 0x0C,
-          0x07, 0x00, 0x0C, 0x03, 0x00, 0x00, 0x7F, 0xF8, 0x00, 0x42, 0x08, 0x00, 0x42, 0x08, 0x7C, 0x7F,
-          0xF8, 0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x7F, 0xF8, 0x04, 0x42, 0x08,
-          0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x42, 0x18, 0x1A, 0x42, 0x38, 0x31, 0x80, 0x10, 0x60,
-          0xFF, 0xFC, 0x00, 0x1F, 0xF8, 0x00, 0x00, 0x00,),
-    '信': (0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x03, 0x02, 0x00, 0x02, 0x03, 0x00, 0x02, 0x03, 0x08, 0x04,
-          0xFF, 0xFC, 0x04, 0x00, 0x00, 0x08, 0x00, 0x10, 0x0C, 0x7F, 0xF8, 0x14, 0x00, 0x00, 0x14, 0x00,
-          0x10, 0x24, 0x7F, 0xF8, 0x44, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x3F, 0xF8,
-          0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x3F, 0xF0, 0x04,
-          0x20, 0x10, 0x04, 0x20, 0x10, 0x00, 0x00, 0x00,),
-}
-
-# 常用ASCII字符集
-# 字宽：8   【实际取模时，字宽设置为16，对应英文字宽则为8】
-# 字高：16
-# 宋体、阴码，逐行式，顺向（高位在前）
-ascii_8x16_dict = {
-    ' ': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '!': (0x00, 0x00, 0x00, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x00, 0x00, 0x10, 0x10, 0x00, 0x00,),
-    '"': (0x00, 0x12, 0x24, 0x24, 0x48, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    "#": (0x00, 0x00, 0x00, 0x12, 0x12, 0x12, 0x7E, 0x24, 0x24, 0x24, 0x7E, 0x24, 0x24, 0x24, 0x00, 0x00,),
-    '$': (0x00, 0x00, 0x08, 0x3C, 0x4A, 0x4A, 0x48, 0x38, 0x0C, 0x0A, 0x0A, 0x4A, 0x4A, 0x3C, 0x08, 0x08,),
-    '%': (0x00, 0x00, 0x00, 0x44, 0xA4, 0xA8, 0xA8, 0xB0, 0x54, 0x1A, 0x2A, 0x2A, 0x4A, 0x44, 0x00, 0x00,),
-    '&': (0x00, 0x00, 0x00, 0x30, 0x48, 0x48, 0x48, 0x50, 0x6E, 0xA4, 0x94, 0x98, 0x89, 0x76, 0x00, 0x00,),
-    "'": (0x00, 0x60, 0x20, 0x20, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '(': (0x00, 0x02, 0x04, 0x08, 0x08, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x08, 0x08, 0x04, 0x02, 0x00,),
-    ')': (0x00, 0x40, 0x20, 0x10, 0x10, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x10, 0x10, 0x20, 0x40, 0x00,),
-    '*': (0x00, 0x00, 0x00, 0x00, 0x10, 0x10, 0xD6, 0x38, 0x38, 0xD6, 0x10, 0x10, 0x00, 0x00, 0x00, 0x00,),
-    '+': (0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x08, 0x08, 0x7F, 0x08, 0x08, 0x08, 0x00, 0x00, 0x00, 0x00,),
-    ',': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x20, 0x20, 0x40,),
-    '-': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '.': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x60, 0x00, 0x00,),
-    '/': (0x00, 0x00, 0x02, 0x04, 0x04, 0x04, 0x08, 0x08, 0x10, 0x10, 0x10, 0x20, 0x20, 0x40, 0x40, 0x00,),
-    '0': (0x00, 0x00, 0x00, 0x18, 0x24, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x24, 0x18, 0x00, 0x00,),
-    '1': (0x00, 0x00, 0x00, 0x08, 0x38, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x3E, 0x00, 0x00,),
-    '2': (0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x42, 0x02, 0x04, 0x08, 0x10, 0x20, 0x42, 0x7E, 0x00, 0x00,),
-    '3': (0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x02, 0x04, 0x18, 0x04, 0x02, 0x42, 0x42, 0x3C, 0x00, 0x00,),
-    '4': (0x00, 0x00, 0x00, 0x04, 0x0C, 0x0C, 0x14, 0x24, 0x24, 0x44, 0x7F, 0x04, 0x04, 0x1F, 0x00, 0x00,),
-    '5': (0x00, 0x00, 0x00, 0x7E, 0x40, 0x40, 0x40, 0x78, 0x44, 0x02, 0x02, 0x42, 0x44, 0x38, 0x00, 0x00,),
-    '6': (0x00, 0x00, 0x00, 0x18, 0x24, 0x40, 0x40, 0x5C, 0x62, 0x42, 0x42, 0x42, 0x22, 0x1C, 0x00, 0x00,),
-    '7': (0x00, 0x00, 0x00, 0x7E, 0x42, 0x04, 0x04, 0x08, 0x08, 0x10, 0x10, 0x10, 0x10, 0x10, 0x00, 0x00,),
-    '8': (0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x42, 0x24, 0x18, 0x24, 0x42, 0x42, 0x42, 0x3C, 0x00, 0x00,),
-    '9': (0x00, 0x00, 0x00, 0x38, 0x44, 0x42, 0x42, 0x42, 0x46, 0x3A, 0x02, 0x02, 0x24, 0x18, 0x00, 0x00,),
-    ':': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18, 0x18, 0x00, 0x00, 0x00, 0x00, 0x18, 0x18, 0x00, 0x00,),
-    ';': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x10, 0x10,),
-    '<': (0x00, 0x00, 0x00, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x00, 0x00,),
-    '=': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 0x00, 0x00, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '>': (0x00, 0x00, 0x00, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x00, 0x00,),
-    '?': (0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x62, 0x04, 0x08, 0x08, 0x08, 0x00, 0x18, 0x18, 0x00, 0x00,),
-    '@': (0x00, 0x00, 0x00, 0x38, 0x44, 0x5A, 0xAA, 0xAA, 0xAA, 0xAA, 0xAA, 0x5C, 0x42, 0x3C, 0x00, 0x00,),
-    'A': (0x00, 0x00, 0x00, 0x10, 0x10, 0x18, 0x28, 0x28, 0x24, 0x3C, 0x44, 0x42, 0x42, 0xE7, 0x00, 0x00,),
-    'B': (0x00, 0x00, 0x00, 0xF8, 0x44, 0x44, 0x44, 0x78, 0x44, 0x42, 0x42, 0x42, 0x44, 0xF8, 0x00, 0x00,),
-    'C': (0x00, 0x00, 0x00, 0x3E, 0x42, 0x42, 0x80, 0x80, 0x80, 0x80, 0x80, 0x42, 0x44, 0x38, 0x00, 0x00,),
-    'D': (0x00, 0x00, 0x00, 0xF8, 0x44, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x44, 0xF8, 0x00, 0x00,),
-    'E': (0x00, 0x00, 0x00, 0xFC, 0x42, 0x48, 0x48, 0x78, 0x48, 0x48, 0x40, 0x42, 0x42, 0xFC, 0x00, 0x00,),
-    'F': (0x00, 0x00, 0x00, 0xFC, 0x42, 0x48, 0x48, 0x78, 0x48, 0x48, 0x40, 0x40, 0x40, 0xE0, 0x00, 0x00,),
-    'G': (0x00, 0x00, 0x00, 0x3C, 0x44, 0x44, 0x80, 0x80, 0x80, 0x8E, 0x84, 0x44, 0x44, 0x38, 0x00, 0x00,),
-    'H': (0x00, 0x00, 0x00, 0xE7, 0x42, 0x42, 0x42, 0x42, 0x7E, 0x42, 0x42, 0x42, 0x42, 0xE7, 0x00, 0x00,),
-    'I': (0x00, 0x00, 0x00, 0x7C, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x7C, 0x00, 0x00,),
-    'J': (0x00, 0x00, 0x00, 0x3E, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x88, 0xF0,),
-    'K': (0x00, 0x00, 0x00, 0xEE, 0x44, 0x48, 0x50, 0x70, 0x50, 0x48, 0x48, 0x44, 0x44, 0xEE, 0x00, 0x00,),
-    'L': (0x00, 0x00, 0x00, 0xE0, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x42, 0xFE, 0x00, 0x00,),
-    'M': (0x00, 0x00, 0x00, 0xEE, 0x6C, 0x6C, 0x6C, 0x6C, 0x6C, 0x54, 0x54, 0x54, 0x54, 0xD6, 0x00, 0x00,),
-    'N': (0x00, 0x00, 0x00, 0xC7, 0x62, 0x62, 0x52, 0x52, 0x4A, 0x4A, 0x4A, 0x46, 0x46, 0xE2, 0x00, 0x00,),
-    'O': (0x00, 0x00, 0x00, 0x38, 0x44, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0x44, 0x38, 0x00, 0x00,),
-    'P': (0x00, 0x00, 0x00, 0xFC, 0x42, 0x42, 0x42, 0x42, 0x7C, 0x40, 0x40, 0x40, 0x40, 0xE0, 0x00, 0x00,),
-    'Q': (0x00, 0x00, 0x00, 0x38, 0x44, 0x82, 0x82, 0x82, 0x82, 0x82, 0x82, 0xB2, 0x4C, 0x38, 0x06, 0x00,),
-    'R': (0x00, 0x00, 0x00, 0xFC, 0x42, 0x42, 0x42, 0x7C, 0x48, 0x48, 0x44, 0x44, 0x42, 0xE3, 0x00, 0x00,),
-    'S': (0x00, 0x00, 0x00, 0x3E, 0x42, 0x42, 0x40, 0x20, 0x18, 0x04, 0x02, 0x42, 0x42, 0x7C, 0x00, 0x00,),
-    'T': (0x00, 0x00, 0x00, 0xFE, 0x92, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x38, 0x00, 0x00,),
-    'U': (0x00, 0x00, 0x00, 0xE7, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x42, 0x3C, 0x00, 0x00,),
-    'V': (0x00, 0x00, 0x00, 0xE7, 0x42, 0x42, 0x44, 0x24, 0x24, 0x28, 0x28, 0x18, 0x10, 0x10, 0x00, 0x00,),
-    'W': (0x00, 0x00, 0x00, 0xD6, 0x54, 0x54, 0x54, 0x54, 0x54, 0x6C, 0x28, 0x28, 0x28, 0x28, 0x00, 0x00,),
-    'X': (0x00, 0x00, 0x00, 0xE7, 0x42, 0x24, 0x24, 0x18, 0x18, 0x18, 0x24, 0x24, 0x42, 0xE7, 0x00, 0x00,),
-    'Y': (0x00, 0x00, 0x00, 0xEE, 0x44, 0x44, 0x28, 0x28, 0x10, 0x10, 0x10, 0x10, 0x10, 0x38, 0x00, 0x00,),
-    'Z': (0x00, 0x00, 0x00, 0x7E, 0x84, 0x04, 0x08, 0x08, 0x10, 0x20, 0x20, 0x42, 0x42, 0xFC, 0x00, 0x00,),
-    '[': (0x00, 0x1E, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1E, 0x00,),
-    '\\': (0x00, 0x00, 0x40, 0x20, 0x20, 0x20, 0x10, 0x10, 0x10, 0x08, 0x08, 0x04, 0x04, 0x04, 0x02, 0x02,),
-    ']': (0x00, 0x78, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x78, 0x00,),
-    '^': (0x00, 0x18, 0x24, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    '_': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF,),
-    '`': (0x00, 0x60, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-    'a': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x44, 0x0C, 0x34, 0x44, 0x4C, 0x36, 0x00, 0x00,),
-    'b': (0x00, 0x00, 0x00, 0x00, 0xC0, 0x40, 0x40, 0x58, 0x64, 0x42, 0x42, 0x42, 0x64, 0x58, 0x00, 0x00,),
-    'c': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1C, 0x22, 0x40, 0x40, 0x40, 0x22, 0x1C, 0x00, 0x00,),
-    'd': (0x00, 0x00, 0x00, 0x00, 0x06, 0x02, 0x02, 0x3E, 0x42, 0x42, 0x42, 0x42, 0x46, 0x3B, 0x00, 0x00,),
-    'e': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x7E, 0x40, 0x42, 0x3C, 0x00, 0x00,),
-    'f': (0x00, 0x00, 0x00, 0x00, 0x0C, 0x12, 0x10, 0x7C, 0x10, 0x10, 0x10, 0x10, 0x10, 0x7C, 0x00, 0x00,),
-    'g': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3E, 0x44, 0x44, 0x38, 0x40, 0x3C, 0x42, 0x42, 0x3C,),
-    'h': (0x00, 0x00, 0x00, 0x00, 0xC0, 0x40, 0x40, 0x5C, 0x62, 0x42, 0x42, 0x42, 0x42, 0xE7, 0x00, 0x00,),
-    'i': (0x00, 0x00, 0x00, 0x30, 0x30, 0x00, 0x00, 0x70, 0x10, 0x10, 0x10, 0x10, 0x10, 0x7C, 0x00, 0x00,),
-    'j': (0x00, 0x00, 0x00, 0x0C, 0x0C, 0x00, 0x00, 0x1C, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x44, 0x78,),
-    'k': (0x00, 0x00, 0x00, 0x00, 0xC0, 0x40, 0x40, 0x4E, 0x48, 0x50, 0x70, 0x48, 0x44, 0xEE, 0x00, 0x00,),
-    'l': (0x00, 0x00, 0x00, 0x10, 0x70, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x7C, 0x00, 0x00,),
-    'm': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFE, 0x49, 0x49, 0x49, 0x49, 0x49, 0xED, 0x00, 0x00,),
-    'n': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xDC, 0x62, 0x42, 0x42, 0x42, 0x42, 0xE7, 0x00, 0x00,),
-    'o': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3C, 0x42, 0x42, 0x42, 0x42, 0x42, 0x3C, 0x00, 0x00,),
-    'p': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xD8, 0x64, 0x42, 0x42, 0x42, 0x64, 0x58, 0x40, 0xE0,),
-    'q': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1A, 0x26, 0x42, 0x42, 0x42, 0x26, 0x1A, 0x02, 0x07,),
-    'r': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xEE, 0x32, 0x20, 0x20, 0x20, 0x20, 0xF8, 0x00, 0x00,),
-    's': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3E, 0x42, 0x40, 0x3C, 0x02, 0x42, 0x7C, 0x00, 0x00,),
-    't': (0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x10, 0x7C, 0x10, 0x10, 0x10, 0x10, 0x12, 0x0C, 0x00, 0x00,),
-    'u': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC6, 0x42, 0x42, 0x42, 0x42, 0x46, 0x3B, 0x00, 0x00,),
-    'v': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xEE, 0x44, 0x44, 0x28, 0x28, 0x10, 0x10, 0x00, 0x00,),
-    'w': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xDB, 0x89, 0x4A, 0x5A, 0x54, 0x24, 0x24, 0x00, 0x00,),
-    'x': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x76, 0x24, 0x18, 0x18, 0x18, 0x24, 0x6E, 0x00, 0x00,),
-    'y': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x42, 0x24, 0x24, 0x18, 0x18, 0x10, 0x10, 0x60,),
-    'z': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7E, 0x44, 0x08, 0x10, 0x10, 0x22, 0x7E, 0x00, 0x00,),
-    '{': (0x00, 0x03, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04, 0x08, 0x04, 0x04, 0x04, 0x04, 0x04, 0x03, 0x00,),
-    '|': (0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08, 0x08,),
-    '}': (0x00, 0xC0, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x10, 0x20, 0x20, 0x20, 0x20, 0x20, 0xC0, 0x00,),
-    '~': (0x20, 0x5A, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
-}
-
-# 常用ASCII字符集
-# 字宽：16   【实际取模时，字宽设置为32，对应英文字宽则为16】
-# 字高：24
-# 宋体、阴码，逐行式，顺向（高位在前）
-ascii_16x24_dict = {
-    ' ': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '!': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x03, 0xC0, 0x01, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '"': (0x00, 0x00, 0x00, 0x00, 0x03, 0x18, 0x07, 0x38, 0x0E, 0x70, 0x18, 0xC0, 0x10, 0x80, 0x21, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '#': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x08, 0x04, 0x08, 0x04, 0x18, 0x0C, 0x10,
-          0x7F, 0xFE, 0x7F, 0xFE, 0x08, 0x10, 0x08, 0x10, 0x08, 0x10, 0x08, 0x10, 0x08, 0x10, 0x7F, 0xFE,
-          0x7F, 0xFE, 0x18, 0x20, 0x10, 0x20, 0x10, 0x20, 0x10, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '$': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x01, 0xC0, 0x07, 0xB0, 0x19, 0x98, 0x19, 0x98,
-          0x19, 0xB8, 0x1D, 0x80, 0x0F, 0x80, 0x07, 0x80, 0x01, 0xC0, 0x01, 0xF0, 0x01, 0xB8, 0x01, 0x98,
-          0x39, 0x98, 0x39, 0x98, 0x31, 0x98, 0x19, 0xB0, 0x07, 0xC0, 0x01, 0x80, 0x01, 0x80, 0x00, 0x00),
-    '%': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18, 0x00, 0x64, 0x10, 0x46, 0x10, 0xC6, 0x20,
-          0xC6, 0x40, 0xC6, 0x40, 0x46, 0x80, 0x44, 0x80, 0x3D, 0x18, 0x01, 0x64, 0x02, 0x46, 0x02, 0x42,
-          0x04, 0x42, 0x04, 0x42, 0x08, 0x46, 0x10, 0x64, 0x10, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '&': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x08, 0x80, 0x10, 0xC0, 0x10, 0xC0,
-          0x10, 0xC0, 0x19, 0x80, 0x19, 0x00, 0x1E, 0x20, 0x1C, 0x18, 0x2E, 0x10, 0x46, 0x10, 0x43, 0x10,
-          0xC3, 0xA0, 0xC1, 0xE0, 0x60, 0xE1, 0x31, 0xF2, 0x1E, 0x1C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    "'": (0x00, 0x00, 0x00, 0x00, 0x3C, 0x00, 0x3C, 0x00, 0x0C, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x20, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '(': (0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x08, 0x00, 0x30, 0x00, 0x20, 0x00, 0x40, 0x00, 0xC0,
-          0x00, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x00, 0xC0, 0x00, 0xC0, 0x00, 0x60, 0x00, 0x20, 0x00, 0x10, 0x00, 0x08, 0x00, 0x04, 0x00, 0x00),
-    ')': (0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x10, 0x00, 0x08, 0x00, 0x04, 0x00, 0x06, 0x00, 0x03, 0x00,
-          0x03, 0x00, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x00,
-          0x03, 0x00, 0x03, 0x00, 0x06, 0x00, 0x04, 0x00, 0x08, 0x00, 0x10, 0x00, 0x60, 0x00, 0x00, 0x00),
-    '*': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x71, 0x8E, 0x79, 0xBC, 0x0F, 0x60, 0x01, 0x80, 0x0F, 0x70, 0x79, 0x9E, 0x61, 0x8E,
-          0x01, 0x80, 0x01, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '+': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x00, 0x80,
-          0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80, 0x7F, 0xFE, 0x00, 0x80, 0x00, 0x80, 0x00, 0x80,
-          0x00, 0x80, 0x00, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    ',': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x3C, 0x00, 0x3C, 0x00, 0x0C, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x20, 0x00),
-    '-': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7F, 0xFE, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '.': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x18, 0x00, 0x3C, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '/': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x04, 0x00, 0x08, 0x00, 0x10, 0x00, 0x10,
-          0x00, 0x20, 0x00, 0x40, 0x00, 0x40, 0x00, 0x80, 0x01, 0x80, 0x01, 0x00, 0x02, 0x00, 0x02, 0x00,
-          0x04, 0x00, 0x08, 0x00, 0x08, 0x00, 0x10, 0x00, 0x20, 0x00, 0x20, 0x00, 0x40, 0x00, 0x00, 0x00),
-    '0': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x06, 0x60, 0x1C, 0x18, 0x18, 0x18,
-          0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C,
-          0x30, 0x0C, 0x18, 0x18, 0x18, 0x18, 0x0C, 0x30, 0x03, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '1': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x01, 0x80, 0x07, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0xC0, 0x0F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '2': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC0, 0x0C, 0x30, 0x10, 0x18, 0x30, 0x0C,
-          0x38, 0x0C, 0x38, 0x1C, 0x00, 0x18, 0x00, 0x30, 0x00, 0x60, 0x00, 0xC0, 0x01, 0x80, 0x02, 0x00,
-          0x04, 0x00, 0x18, 0x04, 0x30, 0x0C, 0x3F, 0xF8, 0x3F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '3': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x80, 0x08, 0x70, 0x10, 0x38, 0x38, 0x18,
-          0x18, 0x18, 0x00, 0x18, 0x00, 0x30, 0x00, 0xE0, 0x01, 0xE0, 0x00, 0x18, 0x00, 0x18, 0x00, 0x0C,
-          0x10, 0x0C, 0x38, 0x0C, 0x30, 0x18, 0x18, 0x30, 0x07, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '4': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x70, 0x00, 0xF0, 0x00, 0xF0,
-          0x01, 0x70, 0x02, 0x70, 0x04, 0x70, 0x08, 0x70, 0x18, 0x70, 0x10, 0x70, 0x20, 0x70, 0x7F, 0xFE,
-          0x00, 0x70, 0x00, 0x70, 0x00, 0x70, 0x00, 0x70, 0x03, 0xFE, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '5': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0xF8, 0x10, 0x00, 0x10, 0x00,
-          0x10, 0x00, 0x10, 0x00, 0x13, 0xC0, 0x1C, 0x30, 0x10, 0x18, 0x00, 0x0C, 0x00, 0x0C, 0x00, 0x0C,
-          0x38, 0x0C, 0x38, 0x0C, 0x30, 0x18, 0x18, 0x30, 0x07, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '6': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xE0, 0x06, 0x18, 0x08, 0x18, 0x18, 0x18,
-          0x30, 0x00, 0x30, 0x00, 0x30, 0xC0, 0x37, 0x38, 0x38, 0x1C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0C, 0x18, 0x08, 0x0C, 0x10, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '7': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0xFC, 0x30, 0x08, 0x20, 0x10,
-          0x20, 0x10, 0x00, 0x20, 0x00, 0x40, 0x00, 0x40, 0x00, 0x80, 0x01, 0x80, 0x01, 0x80, 0x03, 0x00,
-          0x03, 0x00, 0x03, 0x00, 0x03, 0x80, 0x03, 0x80, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '8': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC0, 0x0C, 0x30, 0x30, 0x08, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0C, 0x1C, 0x18, 0x0F, 0x20, 0x07, 0xE0, 0x18, 0x70, 0x30, 0x18, 0x20, 0x0C,
-          0x60, 0x0C, 0x60, 0x0C, 0x30, 0x0C, 0x18, 0x18, 0x07, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '9': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x80, 0x0C, 0x70, 0x30, 0x18, 0x30, 0x18,
-          0x70, 0x0C, 0x70, 0x0C, 0x70, 0x0C, 0x30, 0x1C, 0x30, 0x3C, 0x1C, 0x6C, 0x07, 0x8C, 0x00, 0x1C,
-          0x00, 0x18, 0x00, 0x18, 0x18, 0x30, 0x18, 0x60, 0x0F, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    ':': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x01, 0x00, 0x03, 0x80, 0x03, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x03, 0x80, 0x03, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    ';': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x03, 0x80, 0x03, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x80, 0x03, 0x80, 0x01, 0x80, 0x01, 0x00, 0x00, 0x00),
-    '<': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x20, 0x00, 0xC0,
-          0x01, 0x80, 0x02, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x30, 0x00, 0x18, 0x00, 0x04, 0x00, 0x03, 0x00,
-          0x01, 0x80, 0x00, 0x40, 0x00, 0x30, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '=': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x3F, 0xFC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7F, 0xFE, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '>': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x00, 0x18, 0x00, 0x04, 0x00, 0x03, 0x00,
-          0x01, 0x80, 0x00, 0x40, 0x00, 0x30, 0x00, 0x18, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x20, 0x00, 0xC0,
-          0x01, 0x80, 0x02, 0x00, 0x0C, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '?': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xE0, 0x18, 0x18, 0x30, 0x0C, 0x20, 0x0C,
-          0x30, 0x0C, 0x38, 0x0C, 0x00, 0x1C, 0x00, 0x38, 0x00, 0xE0, 0x01, 0x80, 0x01, 0x00, 0x01, 0x00,
-          0x01, 0x00, 0x00, 0x00, 0x01, 0x80, 0x03, 0x80, 0x03, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '@': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xE0, 0x06, 0x18, 0x08, 0x04, 0x10, 0x7E,
-          0x31, 0x92, 0x23, 0x12, 0x62, 0x32, 0x66, 0x32, 0x66, 0x32, 0x64, 0x22, 0x64, 0x62, 0x24, 0x64,
-          0x33, 0xB8, 0x30, 0x02, 0x18, 0x04, 0x0C, 0x18, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'A': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x01, 0x80, 0x02, 0x80, 0x02, 0xC0,
-          0x02, 0xC0, 0x04, 0x40, 0x04, 0x60, 0x04, 0x60, 0x08, 0x60, 0x08, 0x30, 0x0F, 0xF0, 0x10, 0x30,
-          0x10, 0x18, 0x10, 0x18, 0x20, 0x18, 0x20, 0x1C, 0xF8, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'B': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xF0, 0x18, 0x18, 0x18, 0x0C,
-          0x18, 0x0C, 0x18, 0x0C, 0x18, 0x18, 0x18, 0x60, 0x1F, 0xB0, 0x18, 0x0C, 0x18, 0x0C, 0x18, 0x0E,
-          0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0C, 0x18, 0x18, 0xFF, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'C': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xE0, 0x06, 0x1C, 0x18, 0x04, 0x18, 0x06,
-          0x30, 0x02, 0x30, 0x00, 0x70, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x70, 0x00,
-          0x30, 0x02, 0x30, 0x04, 0x18, 0x04, 0x0C, 0x18, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'D': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xE0, 0x18, 0x18, 0x18, 0x1C,
-          0x18, 0x0C, 0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0E, 0x18, 0x0C,
-          0x18, 0x0C, 0x18, 0x1C, 0x18, 0x18, 0x18, 0x60, 0x7F, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'E': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xFC, 0x18, 0x04, 0x18, 0x02,
-          0x18, 0x00, 0x18, 0x10, 0x18, 0x10, 0x18, 0x30, 0x1F, 0xF0, 0x18, 0x10, 0x18, 0x10, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x02, 0x18, 0x04, 0x18, 0x0C, 0x7F, 0xFC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'F': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xFC, 0x18, 0x06, 0x18, 0x02,
-          0x18, 0x00, 0x18, 0x00, 0x18, 0x10, 0x18, 0x10, 0x1F, 0xF0, 0x18, 0x10, 0x18, 0x10, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'G': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xC8, 0x0E, 0x38, 0x18, 0x18, 0x30, 0x08,
-          0x30, 0x04, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x20, 0x60, 0x1C, 0x60, 0x18,
-          0x30, 0x18, 0x30, 0x18, 0x18, 0x18, 0x0C, 0x18, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'H': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x1C, 0x30, 0x0C, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x3F, 0xFC, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0xFC, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'I': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0xF0, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x1F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'J': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xFC, 0x00, 0x60, 0x00, 0x60,
-          0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60,
-          0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x70, 0x40, 0x71, 0x80, 0x1E, 0x00),
-    'K': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3C, 0x3C, 0x18, 0x30, 0x18, 0x20,
-          0x18, 0x40, 0x18, 0x80, 0x19, 0x00, 0x1B, 0x80, 0x1D, 0x80, 0x18, 0xC0, 0x18, 0xC0, 0x18, 0x60,
-          0x18, 0x30, 0x18, 0x30, 0x18, 0x18, 0x18, 0x1C, 0x7E, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'L': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3C, 0x00, 0x18, 0x00, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x02, 0x18, 0x06, 0x18, 0x0C, 0x7F, 0xFC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'M': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x70, 0x1E, 0x30, 0x1C, 0x38, 0x1C,
-          0x38, 0x2C, 0x28, 0x2C, 0x2C, 0x2C, 0x2C, 0x4C, 0x2C, 0x4C, 0x24, 0x4C, 0x26, 0x8C, 0x26, 0x8C,
-          0x22, 0x8C, 0x23, 0x0C, 0x23, 0x0C, 0x23, 0x0C, 0xF1, 0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'N': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x0E, 0x38, 0x04, 0x2C, 0x04,
-          0x26, 0x04, 0x27, 0x04, 0x23, 0x04, 0x21, 0x84, 0x21, 0xC4, 0x20, 0xC4, 0x20, 0x64, 0x20, 0x74,
-          0x20, 0x34, 0x20, 0x1C, 0x20, 0x1C, 0x20, 0x0C, 0xF8, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'O': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC0, 0x0C, 0x30, 0x18, 0x18, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0E, 0x70, 0x06, 0x70, 0x06, 0x70, 0x06, 0x70, 0x06, 0x70, 0x06, 0x30, 0x06,
-          0x30, 0x0C, 0x30, 0x0C, 0x18, 0x08, 0x0C, 0x30, 0x03, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'P': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xF8, 0x18, 0x0C, 0x18, 0x0E,
-          0x18, 0x06, 0x18, 0x06, 0x18, 0x0C, 0x18, 0x0C, 0x1F, 0xF0, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'Q': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC0, 0x0C, 0x30, 0x18, 0x18, 0x30, 0x0C,
-          0x30, 0x0C, 0x70, 0x0E, 0x60, 0x06, 0x60, 0x06, 0x60, 0x06, 0x60, 0x06, 0x60, 0x06, 0x70, 0x0E,
-          0x37, 0x8C, 0x38, 0xCC, 0x18, 0x78, 0x0C, 0x70, 0x03, 0xF0, 0x00, 0x3C, 0x00, 0x18, 0x00, 0x00),
-    'R': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xF8, 0x18, 0x1C, 0x18, 0x0C,
-          0x18, 0x0C, 0x18, 0x0C, 0x18, 0x18, 0x18, 0x30, 0x1F, 0xC0, 0x18, 0xC0, 0x18, 0x60, 0x18, 0x60,
-          0x18, 0x30, 0x18, 0x30, 0x18, 0x18, 0x18, 0x18, 0x7E, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'S': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0xC0, 0x18, 0x38, 0x30, 0x18, 0x20, 0x08,
-          0x20, 0x00, 0x30, 0x00, 0x38, 0x00, 0x0F, 0x00, 0x03, 0xE0, 0x00, 0x78, 0x00, 0x18, 0x00, 0x0C,
-          0x40, 0x0C, 0x20, 0x0C, 0x30, 0x08, 0x38, 0x18, 0x27, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'T': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x3F, 0xFC, 0x61, 0x84, 0x41, 0x82,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x07, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'U': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x0C, 0x30, 0x08, 0x30, 0x08,
-          0x30, 0x08, 0x30, 0x08, 0x30, 0x08, 0x30, 0x08, 0x30, 0x08, 0x30, 0x08, 0x30, 0x08, 0x30, 0x08,
-          0x30, 0x08, 0x30, 0x08, 0x18, 0x08, 0x18, 0x30, 0x07, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'V': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x0C, 0x18, 0x08, 0x18, 0x08,
-          0x18, 0x10, 0x1C, 0x10, 0x0C, 0x10, 0x0C, 0x20, 0x0E, 0x20, 0x06, 0x40, 0x06, 0x40, 0x06, 0x40,
-          0x03, 0x80, 0x03, 0x80, 0x03, 0x80, 0x01, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'W': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x71, 0x86, 0x21, 0x84, 0x31, 0x84,
-          0x30, 0x84, 0x31, 0xC4, 0x31, 0xC8, 0x11, 0xC8, 0x1A, 0xC8, 0x1A, 0x48, 0x1A, 0x70, 0x1A, 0x70,
-          0x0C, 0x70, 0x0C, 0x70, 0x0C, 0x20, 0x0C, 0x20, 0x08, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'X': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x1C, 0x18, 0x10, 0x0C, 0x10,
-          0x06, 0x20, 0x06, 0x40, 0x03, 0x40, 0x03, 0x80, 0x01, 0x80, 0x01, 0xC0, 0x02, 0xC0, 0x02, 0x60,
-          0x04, 0x70, 0x08, 0x30, 0x08, 0x18, 0x10, 0x1C, 0x7C, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'Y': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x1C, 0x18, 0x08, 0x18, 0x10,
-          0x0C, 0x10, 0x0C, 0x20, 0x06, 0x20, 0x06, 0x40, 0x03, 0x40, 0x03, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x07, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'Z': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F, 0xFC, 0x30, 0x18, 0x20, 0x38,
-          0x00, 0x30, 0x00, 0x60, 0x00, 0xC0, 0x00, 0xC0, 0x01, 0x80, 0x03, 0x00, 0x07, 0x00, 0x06, 0x00,
-          0x0C, 0x00, 0x18, 0x04, 0x18, 0x04, 0x30, 0x1C, 0x7F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '[': (0x00, 0x00, 0x00, 0x00, 0x03, 0xFC, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00,
-          0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00,
-          0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0xFC, 0x00, 0x00),
-    '\\': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x18, 0x00, 0x08, 0x00, 0x0C, 0x00,
-           0x06, 0x00, 0x02, 0x00, 0x03, 0x00, 0x01, 0x00, 0x01, 0x80, 0x00, 0x80, 0x00, 0xC0, 0x00, 0x40,
-           0x00, 0x60, 0x00, 0x20, 0x00, 0x30, 0x00, 0x10, 0x00, 0x18, 0x00, 0x08, 0x00, 0x0C, 0x00, 0x04),
-    ']': (0x00, 0x00, 0x00, 0x00, 0x3F, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0,
-          0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0,
-          0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x00, 0xC0, 0x3F, 0xC0, 0x00, 0x00),
-    '^': (0x00, 0x00, 0x00, 0x00, 0x03, 0xC0, 0x0C, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '_': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF, 0xFF),
-    '`': (0x00, 0x00, 0x00, 0x00, 0x0E, 0x00, 0x01, 0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'a': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x0F, 0xE0, 0x30, 0x10, 0x30, 0x18, 0x00, 0x18, 0x03, 0xF8, 0x1C, 0x18,
-          0x30, 0x18, 0x70, 0x18, 0x70, 0x18, 0x30, 0x7A, 0x0F, 0x8C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'b': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x30, 0x00, 0x10, 0x00, 0x10, 0x00,
-          0x10, 0x00, 0x10, 0x00, 0x13, 0xF0, 0x14, 0x18, 0x18, 0x0C, 0x18, 0x0C, 0x10, 0x0C, 0x10, 0x0C,
-          0x10, 0x0C, 0x10, 0x0C, 0x18, 0x08, 0x1C, 0x10, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'c': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xE0, 0x0C, 0x18, 0x18, 0x18, 0x30, 0x00, 0x30, 0x00, 0x30, 0x00,
-          0x30, 0x00, 0x30, 0x04, 0x18, 0x08, 0x0C, 0x18, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'd': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x28, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18,
-          0x00, 0x18, 0x00, 0x18, 0x07, 0xD8, 0x0C, 0x38, 0x18, 0x18, 0x30, 0x18, 0x30, 0x18, 0x30, 0x18,
-          0x30, 0x18, 0x30, 0x18, 0x18, 0x18, 0x0C, 0x7E, 0x03, 0x90, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'e': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xE0, 0x08, 0x18, 0x18, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x3F, 0xF0,
-          0x30, 0x00, 0x30, 0x00, 0x18, 0x08, 0x0C, 0x10, 0x03, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'f': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xFE, 0x03, 0x06, 0x02, 0x00,
-          0x02, 0x00, 0x02, 0x00, 0x3F, 0xF8, 0x02, 0x00, 0x02, 0x00, 0x02, 0x00, 0x02, 0x00, 0x02, 0x00,
-          0x02, 0x00, 0x02, 0x00, 0x02, 0x00, 0x02, 0x00, 0x3F, 0xF0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'g': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xCE, 0x08, 0x36, 0x18, 0x10, 0x10, 0x18, 0x18, 0x10, 0x08, 0x30,
-          0x0F, 0xC0, 0x10, 0x00, 0x1F, 0x80, 0x0B, 0xF8, 0x30, 0x0C, 0x20, 0x0C, 0x30, 0x0C, 0x0F, 0xF0),
-    'h': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x00, 0x1B, 0xF0, 0x1C, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18,
-          0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x7C, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'i': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x80, 0x01, 0xC0, 0x01, 0x80, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x1F, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x1F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'j': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x38, 0x00, 0x30, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x01, 0xF0, 0x00, 0x10, 0x00, 0x10, 0x00, 0x10, 0x00, 0x10, 0x00, 0x10,
-          0x00, 0x10, 0x00, 0x10, 0x00, 0x10, 0x00, 0x10, 0x00, 0x10, 0x00, 0x30, 0x38, 0x20, 0x1F, 0xC0),
-    'k': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x00, 0x18, 0x00, 0x18, 0x00, 0x18, 0x00,
-          0x18, 0x00, 0x18, 0x00, 0x18, 0x7C, 0x18, 0x20, 0x18, 0x40, 0x19, 0x80, 0x1B, 0x80, 0x1C, 0xC0,
-          0x18, 0x60, 0x18, 0x60, 0x18, 0x30, 0x18, 0x18, 0x7C, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'l': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80,
-          0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x01, 0x80, 0x1F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'm': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0xEF, 0x3C, 0x31, 0xC6, 0x21, 0x86, 0x21, 0x86, 0x21, 0x86, 0x21, 0x86,
-          0x21, 0x86, 0x21, 0x86, 0x21, 0x86, 0x21, 0x86, 0xFB, 0xCF, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'n': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x7B, 0xF0, 0x1C, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18,
-          0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x7C, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'o': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xE0, 0x18, 0x18, 0x10, 0x0C, 0x30, 0x0C, 0x30, 0x0C, 0x30, 0x0C,
-          0x30, 0x0C, 0x30, 0x0C, 0x10, 0x08, 0x08, 0x10, 0x07, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'p': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x7B, 0xE0, 0x1C, 0x18, 0x18, 0x0C, 0x18, 0x0C, 0x18, 0x0C, 0x18, 0x0C,
-          0x18, 0x0C, 0x18, 0x0C, 0x18, 0x0C, 0x1C, 0x38, 0x1B, 0xC0, 0x18, 0x00, 0x18, 0x00, 0x3C, 0x00),
-    'q': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xC8, 0x18, 0x38, 0x30, 0x18, 0x30, 0x18, 0x30, 0x18, 0x30, 0x18,
-          0x30, 0x18, 0x30, 0x18, 0x30, 0x18, 0x18, 0x38, 0x07, 0xD8, 0x00, 0x18, 0x00, 0x18, 0x00, 0x3C),
-    'r': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x7C, 0x7C, 0x04, 0x8E, 0x05, 0x00, 0x06, 0x00, 0x04, 0x00, 0x04, 0x00,
-          0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x7F, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    's': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x07, 0xF8, 0x08, 0x18, 0x18, 0x08, 0x18, 0x00, 0x0F, 0x00, 0x01, 0xF0,
-          0x00, 0x38, 0x00, 0x0C, 0x10, 0x0C, 0x18, 0x18, 0x17, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    't': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00,
-          0x03, 0x00, 0x07, 0x00, 0x3F, 0xF8, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00, 0x03, 0x00,
-          0x03, 0x00, 0x03, 0x00, 0x03, 0x04, 0x03, 0x18, 0x00, 0xE0, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'u': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x70, 0x78, 0x10, 0x18, 0x10, 0x18, 0x10, 0x18, 0x10, 0x18, 0x10, 0x18,
-          0x10, 0x18, 0x10, 0x18, 0x18, 0x18, 0x1C, 0x7E, 0x07, 0x90, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'v': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x7E, 0x3E, 0x18, 0x08, 0x08, 0x10, 0x0C, 0x10, 0x0C, 0x20, 0x06, 0x20,
-          0x06, 0x40, 0x03, 0x40, 0x03, 0x80, 0x01, 0x80, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'w': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0xFB, 0xCF, 0x21, 0x84, 0x31, 0x84, 0x31, 0x88, 0x11, 0xC8, 0x1A, 0xC8,
-          0x1A, 0x50, 0x0A, 0x70, 0x0C, 0x70, 0x0C, 0x20, 0x04, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'x': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x3E, 0x7C, 0x0C, 0x10, 0x06, 0x20, 0x03, 0x40, 0x01, 0x80, 0x01, 0x80,
-          0x02, 0xC0, 0x04, 0x60, 0x0C, 0x30, 0x18, 0x18, 0x7C, 0x7E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    'y': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x7E, 0x3E, 0x18, 0x18, 0x0C, 0x10, 0x0C, 0x30, 0x06, 0x20, 0x06, 0x20,
-          0x03, 0x40, 0x03, 0x40, 0x01, 0x80, 0x01, 0x80, 0x01, 0x00, 0x01, 0x00, 0x12, 0x00, 0x3C, 0x00),
-    'z': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x1F, 0xF8, 0x10, 0x30, 0x20, 0x60, 0x00, 0xC0, 0x01, 0x80, 0x03, 0x00,
-          0x06, 0x00, 0x06, 0x04, 0x0C, 0x08, 0x18, 0x18, 0x3F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-    '{': (0x00, 0x00, 0x00, 0x00, 0x00, 0x18, 0x00, 0x20, 0x00, 0x20, 0x00, 0x60, 0x00, 0x60, 0x00, 0x60,
-          0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0xC0, 0x01, 0x80, 0x00, 0x40, 0x00, 0x60, 0x00, 0x60,
-          0x00, 0x60, 0x00, 0x60, 0x00, 0x60, 0x00, 0x20, 0x00, 0x20, 0x00, 0x20, 0x00, 0x1C, 0x00, 0x00),
-    '|': (0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00,
-          0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00,
-          0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00, 0x01, 0x00),
-    '}': (0x00, 0x00, 0x00, 0x00, 0x18, 0x00, 0x04, 0x00, 0x04, 0x00, 0x06, 0x00, 0x06, 0x00, 0x06, 0x00,
-          0x06, 0x00, 0x06, 0x00, 0x06, 0x00, 0x03, 0x00, 0x01, 0x80, 0x02, 0x00, 0x06, 0x00, 0x06, 0x00,
-          0x06, 0x00, 0x06, 0x00, 0x06, 0x00, 0x04, 0x00, 0x04, 0x00, 0x04, 0x00, 0x38, 0x00, 0x00, 0x00),
-    '~': (0x00, 0x00, 0x1E, 0x00, 0x21, 0x82, 0x40, 0xC4, 0x00, 0x78, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
-}
-
 
+def __getattr__(name):
+    '''
+    字库已拆分到按尺寸划分的font_*模块中,由LCD.py首次使用时加载;
+    这里保留旧的LCDPublic.xxx_dict访问方式(需要固件支持模块级__getattr__)
+    '''
+    if name == 'hanzi_16x16_dict':
+        from usr.font_hanzi_16x16 import hanzi_16x16_dict
+        return hanzi_16x16_dict
+    if name == 'hanzi_16x24_dict':
+        from usr.font_hanzi_16x24 import hanzi_16x24_dict
+        return hanzi_16x24_dict
+    if name == 'hanzi_24x24_dict':
+        from usr.font_hanzi_24x24 import hanzi_24x24_dict
+        return hanzi_24x24_dict
+    if name == 'ascii_8x16_dict':
+        from usr.font_ascii_8x16 import ascii_8x16_dict
+        return ascii_8x16_dict
+    if name == 'ascii_16x24_dict':
+        from usr.font_ascii_16x24 import ascii_16x24_dict
+        return ascii_16x24_dict
+    raise AttributeError(name)
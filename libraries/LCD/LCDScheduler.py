@@ -0,0 +1,218 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+渲染调度线程
+
+RenderScheduler独占LCD:各业务线程不再直接调用lcd_write,而是把绘制命令投递到有界队列,
+由调度线程按不超过max_fps的帧率批量执行,每帧结束后flush(帧缓冲模式)。
+投递带区域的命令时,队列中被新命令完全覆盖的同区域命令直接丢弃(同一区域以最后一次写入为准),
+因此高频刷新的数值、状态栏不会堆积成重绘风暴;队列满时按投递参数阻塞等待或丢弃,并记录统计信息。
+'''
+
+import _thread
+import utime
+from usr.LCD import _text_width, _TEXT_FONTS
+
+
+class RenderScheduler(object):
+    '''
+    渲染调度器
+    '''
+    def __init__(self, lcd, max_fps=30, max_pending=32):
+        '''
+        :param lcd: Peripheral_LCD子类实例
+        :param max_fps: 最大帧率
+        :param max_pending: 队列中最多缓存的命令数
+        '''
+        self.lcd = lcd
+        self.max_pending = max_pending
+        self._period = 1000 // max_fps if max_fps > 0 else 0
+        self._lock = _thread.allocate_lock()
+        self._pending = []      # [(region, fn, args), ...],region为None的命令不参与合并
+        self._running = False
+        self._busy = False
+        self._last_frame = None
+        self._stats = {
+            'posted': 0,        # 投递的命令数
+            'merged': 0,        # 被新命令覆盖而丢弃的命令数
+            'dropped': 0,       # 队列满时丢弃的命令数
+            'blocked': 0,       # 队列满时等待的次数
+            'executed': 0,      # 执行的命令数
+            'frames': 0,        # 渲染的帧数
+            'max_depth': 0,     # 队列的最大深度
+            'frame_ms': 0,      # 最近一帧的渲染耗时
+        }
+
+    def start(self, stack_size=0x4000):
+        '''
+        启动调度线程
+        '''
+        if self._running:
+            return
+        self._running = True
+        if stack_size:
+            _thread.stack_size(stack_size)
+        _thread.start_new_thread(self._loop, ())
+
+    def stop(self):
+        '''
+        停止调度线程,线程在当前帧结束后退出,队列中剩余的命令不再执行
+        '''
+        self._running = False
+
+    def post(self, fn, args=(), region=None, block=True, timeout=1000):
+        '''
+        投递绘制命令
+        :param fn: 在调度线程中执行的绘制函数,如lcd.Fill
+        :param args: fn的参数元组
+        :param region: 命令完整覆盖的区域(x0, y0, x1, y1),队列中被该区域包含的命令会被丢弃;为None时不合并
+        :param block: 队列满时是否等待
+        :param timeout: 等待的最长时间(毫秒)
+        :return: 命令进入队列时返回True,队列满而被丢弃时返回False
+        '''
+        start = utime.ticks_ms()
+        waited = False
+        while True:
+            self._lock.acquire()
+            try:
+                if self._enqueue(fn, args, region):
+                    return True
+            finally:
+                self._lock.release()
+            if not block or utime.ticks_diff(utime.ticks_ms(), start) >= timeout:
+                self._count('dropped')
+                return False
+            if not waited:
+                waited = True
+                self._count('blocked')
+            utime.sleep_ms(max(1, self._period // 2))
+
+    def _enqueue(self, fn, args, region):
+        '''
+        在持有锁时调用:先丢弃被新命令区域包含的命令,再放入队列,队列已满时返回False
+        '''
+        pending = self._pending
+        if region is not None:
+            x0, y0, x1, y1 = region
+            keep = []
+            for cmd in pending:
+                r = cmd[0]
+                if r is not None and x0 <= r[0] and y0 <= r[1] and r[2] <= x1 and r[3] <= y1:
+                    self._stats['merged'] += 1
+                else:
+                    keep.append(cmd)
+            if len(keep) != len(pending):
+                self._pending = pending = keep
+        if len(pending) >= self.max_pending:
+            return False
+        pending.append((region, fn, args))
+        self._stats['posted'] += 1
+        if len(pending) > self._stats['max_depth']:
+            self._stats['max_depth'] = len(pending)
+        return True
+
+    def _count(self, key, n=1):
+        self._lock.acquire()
+        self._stats[key] += n
+        self._lock.release()
+
+    def fill(self, x0, y0, x1, y1, color, block=True):
+        '''
+        投递矩形填充,区域为填充的矩形
+        '''
+        return self.post(self.lcd.Fill, (x0, y0, x1, y1, color), (x0, y0, x1, y1), block)
+
+    def text(self, x, y, text, fc, bc, size=16, width=None, block=True):
+        '''
+        投递单行文字(ShowText),width不为None时用背景色补齐到该宽度,使同一位置的新文字完全覆盖旧文字
+        '''
+        if width is None:
+            width = _text_width(text, size)
+        else:
+            text = text + ' ' * (width // _TEXT_FONTS[size][0][0] + 1)
+        return self.post(self.lcd.ShowText, (x, y, text, fc, bc, size, width),
+                         (x, y, x + width - 1, y + size - 1), block)
+
+    def image(self, data, x, y, width, height, block=True):
+        '''
+        投递RGB565图片(lcd_show_image)
+        '''
+        return self.post(self.lcd.lcd_show_image, (data, x, y, width, height),
+                         (x, y, x + width - 1, y + height - 1), block)
+
+    def run_once(self):
+        '''
+        执行一帧:取出队列中的全部命令依次执行,然后flush
+        :return: 执行的命令数
+        '''
+        self._lock.acquire()
+        cmds = self._pending
+        self._pending = []
+        self._busy = bool(cmds)
+        self._lock.release()
+        if not cmds:
+            return 0
+        t = utime.ticks_ms()
+        try:
+            for region, fn, args in cmds:
+                fn(*args)
+            self.lcd.flush()
+        finally:
+            self._lock.acquire()
+            self._busy = False
+            self._stats['executed'] += len(cmds)
+            self._stats['frames'] += 1
+            self._stats['frame_ms'] = utime.ticks_diff(utime.ticks_ms(), t)
+            self._lock.release()
+        return len(cmds)
+
+    def _loop(self):
+        while self._running:
+            now = utime.ticks_ms()
+            if self._last_frame is not None:
+                wait = self._period - utime.ticks_diff(now, self._last_frame)
+                if wait > 0:
+                    utime.sleep_ms(wait)
+                    continue
+            if self.run_once():
+                self._last_frame = utime.ticks_ms()
+            else:
+                utime.sleep_ms(max(1, self._period))
+
+    def sync(self, timeout=1000):
+        '''
+        等待队列中的命令全部执行完
+        :return: 在超时前执行完时返回True
+        '''
+        start = utime.ticks_ms()
+        while self._pending or self._busy:
+            if utime.ticks_diff(utime.ticks_ms(), start) >= timeout:
+                return False
+            utime.sleep_ms(max(1, self._period // 2))
+        return True
+
+    def stats(self, reset=False):
+        '''
+        获取统计信息: posted、merged、dropped、blocked、executed、frames、max_depth、frame_ms,以及当前队列深度depth
+        :param reset: 为True时读取后清零计数
+        '''
+        self._lock.acquire()
+        s = dict(self._stats)
+        s['depth'] = len(self._pending)
+        if reset:
+            for k in self._stats:
+                self._stats[k] = 0
+        self._lock.release()
+        return s
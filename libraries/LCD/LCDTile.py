@@ -0,0 +1,293 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+分块局部刷新
+
+大分辨率屏(如MIPI接口的JD9365 800x1280、ST7701 480x800)整帧RGB565需要MB级内存,无法整帧缓存。
+TileRenderer把屏幕划分为固定大小的块,画面由一组图元(纯色矩形、图片、文字)描述;
+每帧按块计算覆盖该块的图元状态的哈希,只有哈希与上次发送时不同的块才渲染到块缓冲并发送。
+内存只需一个块缓冲(默认64x64,8KB),画面局部变化时总线流量与变化面积成正比。
+'''
+
+from usr.LCD import CustomError, GlyphCache, _fill16, _builtin_font, _chars, _compose_run, _TEXT_FONTS
+
+_HASH_MASK = 0x3FFFFFFF
+_glyphs = None      # 不指定lcd的TextItem共用的字形缓存,第一次使用时创建
+
+
+def _text_glyphs():
+    global _glyphs
+    if _glyphs is None:
+        _glyphs = GlyphCache()
+    return _glyphs
+
+
+class TileItem(object):
+    '''
+    图元基类,子类提供矩形范围(x0, y0, x1, y1)、状态签名sig()和绘制方法paint()
+    基类本身是不绘制内容的空图元,可以占住一块区域:区域改变时覆盖的块会重新发送
+    '''
+    def __init__(self):
+        self.x0 = 0
+        self.y0 = 0
+        self.x1 = -1
+        self.y1 = -1
+        self.visible = True
+
+    def sig(self):
+        '''
+        图元状态签名,影响绘制结果的属性改变时签名也要改变
+        '''
+        return (0, self.x0, self.y0, self.x1, self.y1)
+
+    def paint(self, mv, tx, ty, tw, th):
+        '''
+        把图元与块(tx, ty, tw, th)相交的部分画到块缓冲mv中,mv按行存放,每行tw * 2字节
+        '''
+        pass
+
+    def _overlap(self, tx, ty, tw, th):
+        '''
+        图元与块相交部分在块内的坐标,不相交时返回None
+        '''
+        x0 = max(self.x0, tx)
+        y0 = max(self.y0, ty)
+        x1 = min(self.x1, tx + tw - 1)
+        y1 = min(self.y1, ty + th - 1)
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0 - tx, y0 - ty, x1 - tx, y1 - ty
+
+
+class FillItem(TileItem):
+    '''
+    纯色矩形
+    '''
+    def __init__(self, x0, y0, x1, y1, color):
+        super().__init__()
+        self.set(x0, y0, x1, y1, color)
+
+    def set(self, x0, y0, x1, y1, color):
+        self.x0 = min(x0, x1)
+        self.y0 = min(y0, y1)
+        self.x1 = max(x0, x1)
+        self.y1 = max(y0, y1)
+        self.color = color
+
+    def sig(self):
+        return (1, self.x0, self.y0, self.x1, self.y1, self.color)
+
+    def paint(self, mv, tx, ty, tw, th):
+        r = self._overlap(tx, ty, tw, th)
+        if r is None:
+            return
+        x0, y0, x1, y1 = r
+        n = (x1 - x0 + 1) * 2
+        first = (y0 * tw + x0) * 2
+        _fill16(mv[first:first + n], self.color, n)
+        for y in range(y0 + 1, y1 + 1):
+            s = (y * tw + x0) * 2
+            mv[s:s + n] = mv[first:first + n]
+
+
+class ImageItem(TileItem):
+    '''
+    RGB565图片(低字节在前,按行存放),原地修改data后需调用touch()
+    '''
+    def __init__(self, x, y, width, height, data):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.data = data
+        self.version = 0
+        self.move(x, y)
+
+    def move(self, x, y):
+        self.x0 = x
+        self.y0 = y
+        self.x1 = x + self.width - 1
+        self.y1 = y + self.height - 1
+
+    def touch(self):
+        '''
+        图片数据被原地修改后调用,使覆盖的块在下一帧重新发送
+        '''
+        self.version += 1
+
+    def sig(self):
+        return (2, self.x0, self.y0, self.width, self.height, id(self.data), self.version)
+
+    def paint(self, mv, tx, ty, tw, th):
+        r = self._overlap(tx, ty, tw, th)
+        if r is None:
+            return
+        x0, y0, x1, y1 = r
+        n = (x1 - x0 + 1) * 2
+        src = memoryview(self.data)
+        sx = tx + x0 - self.x0
+        for y in range(y0, y1 + 1):
+            s = ((ty + y - self.y0) * self.width + sx) * 2
+            d = (y * tw + x0) * 2
+            mv[d:d + n] = src[s:s + n]
+
+
+class TextItem(ImageItem):
+    '''
+    单行文字,ASCII与汉字混合,文字改变时整行重新渲染为一块图片
+    字形的渲染与Peripheral_LCD.ShowText相同,字库中没有的字符显示为背景色
+    '''
+    def __init__(self, x, y, text, fc, bc, size=16, lcd=None):
+        '''
+        :param lcd: Peripheral_LCD对象,使用它通过SetFont注册的字库(包括4bpp抗锯齿字库)和字形缓存;
+                    为None时使用内置字库和模块共用的字形缓存
+        '''
+        sizes = _TEXT_FONTS.get(size)
+        if sizes is None:
+            raise CustomError('unsupported text size {}'.format(size))
+        self.size = size
+        self.fc = fc
+        self.bc = bc
+        self.text = None
+        self._lcd = lcd
+        super().__init__(x, y, 0, size, b'')
+        self.set_text(text)
+
+    def set_text(self, text):
+        if text == self.text:
+            return
+        self.text = text
+        size = self.size
+        aw, hw = _TEXT_FONTS[size][0][0], _TEXT_FONTS[size][1][0]
+        lcd = self._lcd
+        if lcd is None:
+            afont = _builtin_font(('ascii', aw, size))
+            hfont = _builtin_font(('hanzi', hw, size))
+            cache = _text_glyphs()
+        else:
+            afont = lcd._ascii_font(aw, size)
+            hfont = lcd._hanzi_font(hw, size)
+            cache = lcd._glyphs
+        glyphs = []
+        width = 0
+        for ch in _chars(text):
+            if len(ch) == 1 and ord(ch) < 0x80:
+                glyphs.append((afont, ch, aw))
+                width += aw
+            else:
+                glyphs.append((hfont, ch, hw))
+                width += hw
+        buf, width = _compose_run(glyphs, size, width, self.fc, self.bc, cache)
+        self.width = width
+        self.data = b'' if buf is None else buf
+        self.version += 1
+        self.move(self.x0, self.y0)
+
+    def sig(self):
+        return (3, self.x0, self.y0, self.text, self.fc, self.bc, self.size)
+
+
+class TileRenderer(object):
+    '''
+    分块渲染器
+    '''
+    def __init__(self, lcd, width, height, tile_w=64, tile_h=64, bg=0x0000):
+        '''
+        :param lcd: machine.LCD对象(或提供lcd_write的对象)
+        :param width: 屏幕宽度
+        :param height: 屏幕高度
+        :param tile_w: 块宽度
+        :param tile_h: 块高度
+        :param bg: 没有图元覆盖处的背景色
+        '''
+        self._lcd = lcd
+        self.width = width
+        self.height = height
+        self.tile_w = tile_w
+        self.tile_h = tile_h
+        self.bg = bg
+        self.cols = (width + tile_w - 1) // tile_w
+        self.rows = (height + tile_h - 1) // tile_h
+        self._items = []
+        self._sent = [None] * (self.cols * self.rows)
+        self._bufs = {}     # 块缓冲,按大小缓存(只有右边缘、下边缘和右下角的块大小不同)
+        self.tiles_sent = 0     # 最近一帧发送的块数
+
+    def add(self, item):
+        '''
+        添加图元,后添加的图元画在上层
+        '''
+        self._items.append(item)
+        return item
+
+    def remove(self, item):
+        self._items.remove(item)
+
+    def invalidate(self, x0=None, y0=None, x1=None, y1=None):
+        '''
+        使区域内的块在下一帧重新发送,用于屏幕内容被渲染器以外的代码改写之后,不带参数时整屏重发
+        '''
+        if x0 is None:
+            self._sent = [None] * (self.cols * self.rows)
+            return
+        for i in self._tiles(x0, y0, x1, y1):
+            self._sent[i] = None
+
+    def _tiles(self, x0, y0, x1, y1):
+        c0 = max(x0, 0) // self.tile_w
+        c1 = min(x1, self.width - 1) // self.tile_w
+        r0 = max(y0, 0) // self.tile_h
+        r1 = min(y1, self.height - 1) // self.tile_h
+        for r in range(r0, r1 + 1):
+            base = r * self.cols
+            for c in range(c0, c1 + 1):
+                yield base + c
+
+    def _buffer(self, tw, th):
+        buf = self._bufs.get((tw, th))
+        if buf is None:
+            buf = bytearray(tw * th * 2)
+            self._bufs[(tw, th)] = buf
+        return buf
+
+    def render(self):
+        '''
+        渲染一帧:计算各块的签名,只渲染和发送签名变化的块
+        :return: 发送的块数
+        '''
+        sigs = [self.bg] * (self.cols * self.rows)
+        items = [item for item in self._items if item.visible and item.x0 <= item.x1]
+        for item in items:
+            h = hash(item.sig())
+            for i in self._tiles(item.x0, item.y0, item.x1, item.y1):
+                sigs[i] = ((sigs[i] * 1000003) ^ h) & _HASH_MASK
+        sent = 0
+        for i in range(len(sigs)):
+            if sigs[i] == self._sent[i]:
+                continue
+            tx = (i % self.cols) * self.tile_w
+            ty = (i // self.cols) * self.tile_h
+            tw = min(self.tile_w, self.width - tx)
+            th = min(self.tile_h, self.height - ty)
+            buf = self._buffer(tw, th)
+            mv = memoryview(buf)
+            _fill16(mv, self.bg, len(buf))
+            for item in items:
+                if item.x0 < tx + tw and item.x1 >= tx and item.y0 < ty + th and item.y1 >= ty:
+                    item.paint(mv, tx, ty, tw, th)
+            self._lcd.lcd_write(buf, tx, ty, tx + tw - 1, ty + th - 1)
+            self._sent[i] = sigs[i]
+            sent += 1
+        self.tiles_sent = sent
+        return sent
@@ -0,0 +1,401 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+保留模式的界面控件
+
+控件记录自己的矩形范围和上次绘制的状态,只有值变化时才标记为需要重绘;
+Screen.render()遍历控件树,只重绘需要重绘的控件,并且尽量只重绘变化的部分
+(如进度条只填充增减的一段、仪表只擦除和重画指针、列表只重画选中状态变化的行)。
+画面静止时render()不产生任何总线传输。
+'''
+
+import math
+from usr.LCD import CustomError, _text_width, _TEXT_FONTS
+
+
+class Widget(object):
+    '''
+    控件基类
+    子类重写draw(lcd, full): full为True时完整绘制,否则只重绘自上次绘制以来变化的部分
+    基类本身不绘制内容,可作为占位控件:隐藏时仍会用背景色擦除自己的范围
+    '''
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.visible = True
+        self._dirty = True
+        self._full = True       # 下次绘制是否需要完整绘制
+        self._erase = False     # 隐藏后需要用背景色擦除
+
+    def bbox(self):
+        return self.x, self.y, self.x + self.w - 1, self.y + self.h - 1
+
+    def invalidate(self, full=True):
+        '''
+        标记需要重绘,full为True时下次完整绘制
+        '''
+        self._dirty = True
+        if full:
+            self._full = True
+
+    def set_visible(self, visible):
+        if visible == self.visible:
+            return
+        self.visible = visible
+        if visible:
+            self._erase = False
+            self.invalidate()
+        else:
+            self._erase = True
+            self._dirty = True
+
+    def draw(self, lcd, full):
+        pass
+
+    def _render(self, lcd, bg):
+        '''
+        需要时重绘控件,返回重绘的控件数
+        '''
+        if not self._dirty:
+            return 0
+        self._dirty = False
+        if self._erase:
+            self._erase = False
+            x0, y0, x1, y1 = self.bbox()
+            lcd.Fill(x0, y0, x1, y1, bg)
+            self._full = True
+            return 1
+        if not self.visible:
+            return 0
+        full = self._full
+        self._full = False
+        self.draw(lcd, full)
+        return 1
+
+
+class Group(Widget):
+    '''
+    控件组,范围为子控件的并集,隐藏控件组时隐藏全部子控件
+    '''
+    def __init__(self, *children):
+        super().__init__(0, 0, 0, 0)
+        self.children = []
+        self._removed = []      # 已移除、还需要擦除一次的控件
+        for child in children:
+            self.add(child)
+
+    def add(self, widget):
+        self.children.append(widget)
+        self._dirty = True
+        return widget
+
+    def remove(self, widget):
+        self.children.remove(widget)
+        widget.set_visible(False)
+        self._removed.append(widget)
+        self._dirty = True
+
+    def bbox(self):
+        boxes = [c.bbox() for c in self.children]
+        if not boxes:
+            return 0, 0, -1, -1
+        return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+    def invalidate(self, full=True):
+        self._dirty = True
+        for child in self.children:
+            child.invalidate(full)
+
+    def set_visible(self, visible):
+        if visible == self.visible:
+            return
+        self.visible = visible
+        for child in self.children:
+            child.set_visible(visible)
+        self._dirty = True
+
+    def _render(self, lcd, bg):
+        n = 0
+        if self._removed:
+            for widget in self._removed:
+                n += widget._render(lcd, bg)
+            self._removed = []
+        for child in self.children:
+            if child._dirty or isinstance(child, Group):
+                n += child._render(lcd, bg)
+        self._dirty = False
+        return n
+
+
+class Screen(Group):
+    '''
+    控件树的根,持有LCD对象(Peripheral_LCD子类实例)和背景色
+    '''
+    def __init__(self, lcd, bg=0x0000):
+        super().__init__()
+        self.lcd = lcd
+        self.bg = bg
+
+    def render(self, clear=False):
+        '''
+        重绘需要重绘的控件,帧缓冲模式下随后flush
+        :param clear: 为True时先用背景色清屏并完整重绘所有控件
+        :return: 重绘的控件数
+        '''
+        if clear:
+            self.lcd.Clear(self.bg)
+            self.invalidate()
+        n = self._render(self.lcd, self.bg)
+        if n:
+            self.lcd.flush()
+        return n
+
+
+class Label(Widget):
+    '''
+    单行文字,宽度固定,较短的文字用背景色补齐,超出宽度的部分被裁剪
+    '''
+    def __init__(self, x, y, text, fc=0xFFFF, bc=0x0000, size=16, width=None):
+        '''
+        :param width: 宽度(像素),默认为初始文字的宽度
+        '''
+        if size not in _TEXT_FONTS:
+            raise CustomError('unsupported text size {}'.format(size))
+        if width is None:
+            width = _text_width(text, size)
+        super().__init__(x, y, width, size)
+        self.text = text
+        self.fc = fc
+        self.bc = bc
+        self.size = size
+        self._pad = ' ' * (width // _TEXT_FONTS[size][0][0] + 1)
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.invalidate()
+
+    def set_color(self, fc, bc=None):
+        if bc is None:
+            bc = self.bc
+        if fc != self.fc or bc != self.bc:
+            self.fc = fc
+            self.bc = bc
+            self.invalidate()
+
+    def draw(self, lcd, full):
+        # 用空格补齐到控件宽度,一次写入同时擦除旧文字
+        lcd.ShowText(self.x, self.y, self.text + self._pad, self.fc, self.bc, self.size, width=self.w)
+
+
+class Number(Label):
+    '''
+    数值,按fmt格式化后显示,格式化结果不变时不重绘
+    '''
+    def __init__(self, x, y, value, fmt='{}', fc=0xFFFF, bc=0x0000, size=16, width=None):
+        self.fmt = fmt
+        self.value = value
+        super().__init__(x, y, fmt.format(value), fc, bc, size, width)
+
+    def set_value(self, value):
+        self.value = value
+        self.set_text(self.fmt.format(value))
+
+
+class Bar(Widget):
+    '''
+    水平进度条,值变化时只填充增加或减少的一段
+    '''
+    def __init__(self, x, y, w, h, value=0, max_value=100, fc=0x07E0, bc=0x0000, border=None):
+        '''
+        :param border: 边框颜色,为None时没有边框
+        '''
+        super().__init__(x, y, w, h)
+        self.max_value = max_value
+        self.fc = fc
+        self.bc = bc
+        self.border = border
+        self.value = value
+        self._drawn = 0     # 已填充的像素宽度
+
+    def _inner(self):
+        if self.border is None:
+            return self.x, self.y, self.w, self.h
+        return self.x + 1, self.y + 1, self.w - 2, self.h - 2
+
+    def _fill_width(self):
+        v = max(0, min(self.value, self.max_value))
+        return self._inner()[2] * v // self.max_value if self.max_value else 0
+
+    def set_value(self, value):
+        self.value = value
+        if self._fill_width() != self._drawn:
+            self.invalidate(False)
+
+    def draw(self, lcd, full):
+        x, y, w, h = self._inner()
+        fill = self._fill_width()
+        if w <= 0 or h <= 0:
+            return
+        if full:
+            if self.border is not None:
+                lcd.DrawRectangle(self.x, self.y, self.x + self.w - 1, self.y + self.h - 1, self.border)
+            if fill > 0:
+                lcd.Fill(x, y, x + fill - 1, y + h - 1, self.fc)
+            if fill < w:
+                lcd.Fill(x + fill, y, x + w - 1, y + h - 1, self.bc)
+        elif fill > self._drawn:
+            lcd.Fill(x + self._drawn, y, x + fill - 1, y + h - 1, self.fc)
+        elif fill < self._drawn:
+            lcd.Fill(x + fill, y, x + self._drawn - 1, y + h - 1, self.bc)
+        self._drawn = fill
+
+
+class Icon(Widget):
+    '''
+    图标,在一组同样大小的RGB565图片之间切换(如信号格、电量),状态不变时不重绘
+    '''
+    def __init__(self, x, y, w, h, images, state=0):
+        '''
+        :param images: RGB565图片数据的列表,每张 w * h * 2 字节,低字节在前
+        '''
+        super().__init__(x, y, w, h)
+        self.images = images
+        self.state = state
+
+    def set_state(self, state):
+        if state != self.state:
+            self.state = state
+            self.invalidate()
+
+    def draw(self, lcd, full):
+        lcd.lcd_show_image(self.images[self.state], self.x, self.y, self.w, self.h)
+
+
+class Gauge(Widget):
+    '''
+    指针式仪表,刻度盘从左下方顺时针转过270度到右下方;值变化时只擦除旧指针并画新指针
+    '''
+    def __init__(self, cx, cy, r, value=0, max_value=100, fc=0xFFFF, bc=0x0000, needle=0xF800):
+        super().__init__(cx - r, cy - r, 2 * r + 1, 2 * r + 1)
+        self.cx = cx
+        self.cy = cy
+        self.r = r
+        self.max_value = max_value
+        self.fc = fc
+        self.bc = bc
+        self.needle = needle
+        self.value = value
+        self._tip = None    # 已绘制指针的端点
+
+    def _needle_tip(self):
+        v = max(0, min(self.value, self.max_value))
+        a = math.radians(135 + 270 * v / self.max_value) if self.max_value else math.radians(135)
+        length = self.r - 3
+        return (self.cx + int(round(length * math.cos(a))),
+                self.cy + int(round(length * math.sin(a))))
+
+    def set_value(self, value):
+        self.value = value
+        if self._needle_tip() != self._tip:
+            self.invalidate(False)
+
+    def draw(self, lcd, full):
+        tip = self._needle_tip()
+        if full:
+            lcd.FillCircle(self.cx, self.cy, self.r, self.bc)
+            lcd.DrawCircle(self.cx, self.cy, self.r, self.fc)
+        elif self._tip is not None:
+            lcd.DrawLine(self.cx, self.cy, self._tip[0], self._tip[1], self.bc)
+        lcd.DrawLine(self.cx, self.cy, tip[0], tip[1], self.needle)
+        lcd.FillCircle(self.cx, self.cy, 2, self.fc)
+        self._tip = tip
+
+
+class List(Widget):
+    '''
+    文字列表,显示rows行并高亮选中项;选中项变化时只重画新旧两行,需要翻页时重画整个列表
+    '''
+    def __init__(self, x, y, w, items, rows=None, size=16, fc=0xFFFF, bc=0x0000, sel_fc=0x0000, sel_bc=0xFFFF):
+        if size not in _TEXT_FONTS:
+            raise CustomError('unsupported text size {}'.format(size))
+        if rows is None:
+            rows = len(items)
+        super().__init__(x, y, w, rows * size)
+        self.items = list(items)
+        self.rows = rows
+        self.size = size
+        self.fc = fc
+        self.bc = bc
+        self.sel_fc = sel_fc
+        self.sel_bc = sel_bc
+        self.selected = 0
+        self.top = 0        # 第一行显示的列表项
+        self._rows = set()  # 需要重画的列表项
+        self._pad = ' ' * (w // _TEXT_FONTS[size][0][0] + 1)
+
+    def _mark(self, index):
+        if self.top <= index < self.top + self.rows:
+            self._rows.add(index)
+            self.invalidate(False)
+
+    def select(self, index):
+        if not self.items:
+            return
+        index = max(0, min(index, len(self.items) - 1))
+        if index == self.selected:
+            return
+        old = self.selected
+        self.selected = index
+        if index < self.top:
+            self.top = index
+            self.invalidate()
+        elif index >= self.top + self.rows:
+            self.top = index - self.rows + 1
+            self.invalidate()
+        else:
+            self._mark(old)
+            self._mark(index)
+
+    def set_item(self, index, text):
+        if self.items[index] != text:
+            self.items[index] = text
+            self._mark(index)
+
+    def set_items(self, items):
+        self.items = list(items)
+        self.selected = min(self.selected, max(len(self.items) - 1, 0))
+        self.top = min(self.top, self.selected)
+        self.invalidate()
+
+    def draw(self, lcd, full):
+        if full:
+            rows = range(self.top, self.top + self.rows)
+        else:
+            rows = sorted(self._rows)
+        self._rows = set()
+        for i in rows:
+            y = self.y + (i - self.top) * self.size
+            if i >= len(self.items):
+                lcd.Fill(self.x, y, self.x + self.w - 1, y + self.size - 1, self.bc)
+                continue
+            if i == self.selected:
+                fc, bc = self.sel_fc, self.sel_bc
+            else:
+                fc, bc = self.fc, self.bc
+            lcd.ShowText(self.x, y, self.items[i] + self._pad, fc, bc, self.size, width=self.w)
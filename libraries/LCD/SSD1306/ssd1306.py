@@ -15,9 +15,11 @@
 import utime
 from machine import LCD,Pin
 import utime as time
+from usr.LCDMono import Peripheral_MonoLCD
+from usr import LCDPublic
 
 
-class Ssd1306():
+class Ssd1306(Peripheral_MonoLCD):
     def __init__(self, width, height, clk, InitData=None):
         self._lcd_w = width
         self._lcd_h = height
@@ -82,13 +84,14 @@ class Ssd1306():
             0,0,0xaf,
             )
 
+        # 列地址和页地址由lcd_write的窗口参数(起始列, 起始页, 结束列, 结束页)填入
         invalid = (
             0, 0, 0x21,
-            0, 0, 0x00,
-            0, 0, 0x7F,
+            0, 0, LCDPublic.XSTART_L,
+            0, 0, LCDPublic.XEND_L,
             0, 0, 0x22,
-            0, 0, 0x00,
-            0, 0, 0x07,
+            0, 0, LCDPublic.YSTART_L,
+            0, 0, LCDPublic.YEND_L,
             )
 
         if InitData is None:
@@ -110,6 +113,8 @@ class Ssd1306():
                            None,
                            None,
                            None)
+        self._lcd = self.lcd
+        super().__init__(self)
 
 
 if __name__ == '__main__':
@@ -118,6 +123,11 @@ if __name__ == '__main__':
     lcd.lcd.lcd_clear(0xffff)
     utime.sleep(1)
     lcd.lcd.lcd_clear(0x0000)
+    utime.sleep(1)
+    lcd.DrawRectangle(0, 0, 127, 63, 0xffff)
+    lcd.FillCircle(64, 32, 20, 0xffff)
+    lcd.ShowAsciiStr(8, 24, 8, 16, 'QUECTEL', 0xffff, 0x0000)
+    lcd.flush()
 
 
 
@@ -65,3 +65,12 @@ from machine import LCD
 mipilcd = LCD()
 mipilcd.mipi_init(initbuf=bytearray(init_st7701s), width=480,hight=800, DataLane=2, VBP=4, VFP=12, HSync=15, HBP=15, HFP=15)
 mipilcd.lcd_clear(0xf800)
+
+# 分块局部刷新:只有计数所在的块每帧重新发送
+from usr.LCDTile import TileRenderer, TextItem
+
+tiles = TileRenderer(mipilcd, 480, 800, bg=0xf800)
+counter = tiles.add(TextItem(16, 16, '', 0xffff, 0xf800, 24))
+for n in range(1000):
+    counter.set_text('count {}'.format(n))
+    tiles.render()
@@ -65,6 +65,9 @@ class St7735(Peripheral_LCD):
                 self._lcd_w = height
                 self._lcd_h = width
 
+        # 硬件垂直滚动按显存行进行(162行),交换行列或倒转行序的方向下不可用
+        self._scroll_lines = 0 if regval & 0xA0 else 162
+
         init_data = (
             0, 0, 0x11,
             2, 0, 120,
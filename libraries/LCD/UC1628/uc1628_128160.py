@@ -13,10 +13,13 @@
 # limitations under the License.
 
 from machine import LCD
-from usr.LCD import Peripheral_LCD
+from usr.LCDMono import Peripheral_MonoLCD
 import utime as time
 
-class Uc1628(Peripheral_LCD):
+class Uc1628(Peripheral_MonoLCD):
+    # 地址命令固定从原点开始,不能按窗口局部刷新
+    _full_flush = True
+
     def __init__(self, InitData, width, height, clk):
         self._lcd_w = width
         self._lcd_h = height
@@ -360,7 +363,8 @@ image_data = [
 if __name__ == '__main__':
     lcd = Uc1628(None,163,256,13000)
     image_test = bytearray(image_data)
-    lcd.lcd_write(image_test,0,0,127,19)
+    lcd.ShowPages(image_test, 0, 0, 128, 20)
+    lcd.flush()
 
 
 
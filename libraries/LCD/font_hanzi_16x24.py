@@ -0,0 +1,30 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# 16 x 24 汉字字库
+# 宋体、阴码，逐行式，顺向（高位在前）
+hanzi_16x24_dict = {
+    '移': (0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x0E, 0x60, 0x38, 0x44, 0x08, 0x7C, 0x08, 0xCC, 0x09, 0x68,
+          0x0A, 0x30, 0x7C, 0x10, 0x08, 0x20, 0x18, 0x50, 0x1C, 0xB0, 0x1B, 0x22, 0x2A, 0x5E, 0x28, 0x44,
+          0x28, 0xC4, 0x49, 0x28, 0x08, 0x28, 0x08, 0x10, 0x08, 0x20, 0x08, 0xC0, 0x0F, 0x00, 0x00, 0x00,),
+    '远': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x08, 0x13, 0xF8, 0x10, 0x00, 0x10, 0x00, 0x00, 0x04,
+          0x03, 0x5C, 0x00, 0xA0, 0x70, 0xA0, 0x11, 0x20, 0x11, 0x20, 0x11, 0x20, 0x11, 0x20, 0x11, 0x24,
+          0x12, 0x24, 0x12, 0x36, 0x14, 0x1C, 0x68, 0x00, 0x46, 0x00, 0x43, 0xFC, 0x00, 0x00, 0x00, 0x00,),
+    '通': (0x00, 0x00, 0x00, 0x00, 0x01, 0xF8, 0x20, 0x08, 0x10, 0x90, 0x10, 0x60, 0x00, 0x44, 0x03, 0xFC,
+          0x02, 0x44, 0x12, 0x44, 0x73, 0xFC, 0x12, 0x44, 0x12, 0x44, 0x12, 0x44, 0x13, 0xFC, 0x12, 0x44,
+          0x12, 0x44, 0x12, 0x44, 0x12, 0x4C, 0x28, 0x00, 0x46, 0x00, 0x43, 0xFE, 0x00, 0x00, 0x00, 0x00,),
+    '信': (0x00, 0x00, 0x08, 0x00, 0x0C, 0x40, 0x08, 0x40, 0x08, 0x20, 0x17, 0xFE, 0x10, 0x00, 0x10, 0x00,
+          0x10, 0x08, 0x31, 0xF0, 0x30, 0x00, 0x50, 0x00, 0x53, 0xFC, 0x10, 0x00, 0x10, 0x00, 0x10, 0xFC,
+          0x11, 0x04, 0x11, 0x04, 0x11, 0x04, 0x11, 0x04, 0x11, 0xF8, 0x11, 0x04, 0x10, 0x00, 0x00, 0x00,),
+}
@@ -0,0 +1,38 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# 24 x 24 汉字字库
+# 宋体、阴码，逐行式，顺向（高位在前）
+hanzi_24x24_dict = {
+    '移': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x01, 0xC3, 0x00, 0x1F, 0x02, 0x00, 0x02,
+          0x07, 0xF8, 0x02, 0x04, 0x18, 0x02, 0x0A, 0x30, 0x02, 0x53, 0x60, 0x7F, 0xE1, 0xC0, 0x06, 0x01,
+          0x80, 0x06, 0x03, 0xC0, 0x07, 0x0D, 0x80, 0x0E, 0xF3, 0xFC, 0x0A, 0x46, 0x0C, 0x12, 0x4C, 0x08,
+          0x12, 0x12, 0x10, 0x22, 0x21, 0x30, 0x42, 0x01, 0x60, 0x02, 0x00, 0x80, 0x02, 0x03, 0x00, 0x02,
+          0x1C, 0x00, 0x02, 0xE0, 0x00, 0x00, 0x00, 0x00,),
+    '远': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x00, 0x20, 0x08, 0x7F, 0xF0, 0x0C, 0x00, 0x00, 0x04,
+          0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x01, 0xFF, 0xFC, 0x00, 0x18, 0x80, 0x7E, 0x18,
+          0x80, 0x04, 0x18, 0x80, 0x04, 0x10, 0x80, 0x04, 0x10, 0x80, 0x04, 0x10, 0x88, 0x04, 0x20, 0x88,
+          0x04, 0x60, 0x8C, 0x04, 0xC0, 0xFC, 0x1B, 0x00, 0x00, 0x31, 0x00, 0x00, 0x60, 0xFF, 0xFE, 0x00,
+          0x1F, 0xF8, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,),
+    '通': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x7F, 0xE0, 0x10, 0x00, 0x30, 0x08, 0x08, 0xC0, 0x0C,
+          0x07, 0x00, 0x0C, 0x03, 0x00, 0x00, 0x7F, 0xF8, 0x00, 0x42, 0x08, 0x00, 0x42, 0x08, 0x7C, 0x7F,
+          0xF8, 0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x7F, 0xF8, 0x04, 0x42, 0x08,
+          0x04, 0x42, 0x08, 0x04, 0x42, 0x08, 0x04, 0x42, 0x18, 0x1A, 0x42, 0x38, 0x31, 0x80, 0x10, 0x60,
+          0xFF, 0xFC, 0x00, 0x1F, 0xF8, 0x00, 0x00, 0x00,),
+    '信': (0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x03, 0x02, 0x00, 0x02, 0x03, 0x00, 0x02, 0x03, 0x08, 0x04,
+          0xFF, 0xFC, 0x04, 0x00, 0x00, 0x08, 0x00, 0x10, 0x0C, 0x7F, 0xF8, 0x14, 0x00, 0x00, 0x14, 0x00,
+          0x10, 0x24, 0x7F, 0xF8, 0x44, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x3F, 0xF8,
+          0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x20, 0x10, 0x04, 0x3F, 0xF0, 0x04,
+          0x20, 0x10, 0x04, 0x20, 0x10, 0x00, 0x00, 0x00,),
+}
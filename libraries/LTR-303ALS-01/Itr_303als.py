@@ -27,9 +27,11 @@ from machine import I2C
 #from machine import I2C_simulation
 import utime as time
 from machine import ExtInt
+from usr.regmap import RegMap, u16le
+from usr.busmgr import get_i2c, share, HIGH
 
 
-class itl_303als():
+class itl_303als(RegMap):
     i2c_log = None
     i2c_dev = None
     i2c_addre = 0x29
@@ -58,79 +60,76 @@ class itl_303als():
     THRES_UP_HIGH_ADDR = 0x98
     INTERRUPT_PERSIST_ADDR = 0x9E
 
-    def __init__(self, GPIOn, threshod, user_cb, intr_output_mode=IRQ_RISING):
+    def __init__(self, GPIOn, threshod, user_cb, intr_output_mode=IRQ_RISING, i2c=None):
+        '''
+        :param i2c: busmgr句柄或busmgr创建的i2c对象,为None时使用busmgr管理的I2C0,与同一总线上的其他驱动共用
+        '''
         self.cb = user_cb
         self.up_threshod = threshod
         #self.i2c_log = log.getLogger(Alise)
-        self.i2c_dev = I2C(I2C.I2C0, I2C.FAST_MODE)  # 返回i2c对象
+        if i2c is None:
+            i2c = get_i2c(I2C.I2C0, I2C.FAST_MODE, 'ltr303als')
+        else:
+            i2c = share(i2c, 'ltr303als')
+        super().__init__(i2c, self.i2c_addre, 4)  # i2c对象
+        self.i2c_dev = self._i2c
         
         if intr_output_mode == 0:
             self.extint = ExtInt(GPIOn, ExtInt.IRQ_RISING , ExtInt.PULL_DISABLE , self.ext_cb)
             # Enable Interrupt,INT pin is considered active when it is a logic 1
             print('INTERRUPT_ADDR: {}'.format([0x0E]))
-            self._write([self.INTERRUPT_ADDR], [0x0E])
+            self._write(self.INTERRUPT_ADDR, 0x0E)
            
         elif intr_output_mode == 1:
             self.extint = ExtInt(GPIOn, ExtInt.IRQ_FALLING , ExtInt.PULL_PU , self.ext_cb)
             # Enable Interrupt,INT pin is considered active when it is a logic 0
             print('INTERRUPT_ADDR: {}'.format([0x0A]))
-            self._write([self.INTERRUPT_ADDR], [0x0A])
+            self._write(self.INTERRUPT_ADDR, 0x0A)
         else:
             raise Exception('set gpio trigger mode fault')
         self.extint.enable()        
         # Enable ALS
-        self._write([self.CONTR_ADDR], [0x01])
+        self._write(self.CONTR_ADDR, 0x01)
         time.sleep_ms(20)  # at last 10ms
         
         # Set ALS Integration Time 200ms, Repeat Rate 200ms
-        self._write([self.MEAS_RATE_ADDR], [0x12])
+        self._write(self.MEAS_RATE_ADDR, 0x12)
         # Setthe upper limit of the interrupt threshold value 0x5DC 
-        self._write([self.THRES_UP_LOW_ADDR], [self.up_threshod])
-        self._write([self.THRES_UP_HIGH_ADDR], [self.up_threshod >> 8])
+        self._write(self.THRES_UP_LOW_ADDR, self.up_threshod)
+        self._write(self.THRES_UP_HIGH_ADDR, self.up_threshod >> 8)
         # 10 consecutive ALS values out of threshold range
-        self._write([self.INTERRUPT_PERSIST_ADDR], [0x0A])
+        self._write(self.INTERRUPT_PERSIST_ADDR, 0x0A)
 
     def _write(self, reg_addr, data):
-        ret = self.i2c_dev.write(self.i2c_addre,
-                           bytearray(reg_addr), 1,
-                           bytearray(data), len(data))
+        ret = self.write_u8(reg_addr, data)
         print('ret: {}'.format(ret))
 
-    def _read(self, reg_addr, length):
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self.i2c_dev.read(self.i2c_addre,
-                            bytearray(reg_addr), 1,
-                            r_data, length,
-                            0)
-        if ret == -1:
-            return []
-        else:
-            return list(r_data)
-
     def ext_cb(self, args):
-        self.cb(self.read())
+        # 中断服务优先于其他线程的轮询获得总线
+        with self._i2c.batch(HIGH):
+            light = self.read()
+        self.cb(light)
 
     def reset(self):
-        self._write([self.CONTR_ADDR], [0x02])
+        self._write(self.CONTR_ADDR, 0x02)
         time.sleep_ms(20)  # at last 20ms
 
     def read(self):
-        # Judge ALS data valid
-        als_sta = self._read([self.STATUS_ADDR], 1)
-        if len(als_sta) != 0 and (als_sta[0] & 0x80 == 0):
-            data0 = self._read([self.DATA_CH1_LOW_ADDR], 1)
-            data1 = self._read([self.DATA_CH1_HIGH_ADDR], 1)
-            data2 = self._read([self.DATA_CH0_LOW_ADDR], 1)
-            data3 = self._read([self.DATA_CH0_HIGH_ADDR], 1)
-            if len(data0) != 0 and len(data1) != 0 and len(data2) != 0 and len(data3) != 0:
-                self.light_value[0] = (data1[0] << 8) | data0[0]
-                self.light_value[1] = (data3[0] << 8) | data2[0]
-                return self.light_value
+        # 状态和数据在一次加锁内读出并解码
+        with self._i2c:
+            # Judge ALS data valid
+            als_sta = self.read_u8(self.STATUS_ADDR)
+            if als_sta is not None and (als_sta & 0x80 == 0):
+                # CH1 low/high and CH0 low/high in one burst, as the datasheet recommends
+                data = self.read_regs(self.DATA_CH1_LOW_ADDR, 4)
+                if data is not None:
+                    self.light_value[0] = u16le(data, 0)
+                    self.light_value[1] = u16le(data, 2)
+                    return self.light_value
+                else:
+                    return []
             else:
                 return []
-        else:
-            return []
 
 def user_cb_test(light):
     print('light over interrupt  {}'.format(light))
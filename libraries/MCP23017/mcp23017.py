@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from usr.regmap import RegCache
+
 # register addresses in port=0, bank=1 mode (easier maths to convert)
 _MCP_IOCON_DEFAULT = 0x0A    # R/W Configuration Register 初始为0x0A
 
@@ -36,6 +38,9 @@ _MCP_IOCON_SEQOP  = 32
 _MCP_IOCON_MIRROR = 64
 _MCP_IOCON_BANK   = 128
 
+# registers the chip never changes by itself, eligible for the shadow cache
+_MCP_CACHED = (_MCP_IODIR, _MCP_IPOL, _MCP_GPINTEN, _MCP_DEFVAL, _MCP_INTCON, _MCP_IOCON, _MCP_GPPU, _MCP_OLAT)
+
 
 class Port():
     # 表示两个8位端口之一
@@ -44,33 +49,52 @@ class Port():
         self._mcp = mcp
 
     def _which_reg(self, reg):
-        if self._mcp._config & 0x80 == 0x80:
-            # bank = 1
-            return reg | (self._port << 4)
-        else:
-            # bank = 0
-            return (reg << 1) + self._port
+        return self._mcp._reg_addr(reg, self._port)
 
     def _flip_property_bit(self, reg, condition, bit):
-        if condition:
-            setattr(self, reg, getattr(self, reg) | bit)
-        else:
-            setattr(self, reg, getattr(self, reg) & ~bit)
+        old = getattr(self, reg)
+        new = old | bit if condition else old & ~bit
+        # 开启缓存时值未变化则不写入
+        if new != old or self._mcp._shadow is None:
+            setattr(self, reg, new)
 
     def _read(self, reg):
-        r_data = bytearray(1)
-        self._mcp._i2c.read(self._mcp._address, bytearray([self._which_reg(reg)]),1 , r_data, 1, 0)
-        return list(r_data)[0]
+        mcp = self._mcp
+        if mcp._shadow is not None:
+            val = mcp._shadow.get(self._which_reg(reg))
+        else:
+            val = mcp._read_reg(self._which_reg(reg))
+        return 0 if val is None else val
         #return self._mcp._i2c.readfrom_mem(self._mcp._address, self._which_reg(reg), 1)[0]
 
     def _write(self, reg, val):
         val &= 0xff
-        self._mcp._i2c.write(self._mcp._address, bytearray([self._which_reg(reg)]), 1, bytearray([val]),1)
+        mcp = self._mcp
+        addr = self._which_reg(reg)
+        ret = mcp._i2c.write(mcp._address, bytearray([addr]), 1, bytearray([val]),1)
         #self._mcp._i2c.writeto_mem(self._mcp._address, self._which_reg(reg), bytearray([val]))
         # if writing to the config register, make a copy in mcp so that it knows
         # which bank you're using for subsequent writes
+        bank_changed = False
         if reg == _MCP_IOCON:
-            self._mcp._config = val
+            bank_changed = (mcp._config ^ val) & _MCP_IOCON_BANK
+            mcp._config = val
+        if mcp._shadow is None:
+            return
+        if bank_changed:
+            # register addresses moved, start over with the new layout
+            mcp._shadow_map()
+        elif ret != 0:
+            mcp._shadow.invalidate(addr)
+        elif reg == _MCP_IOCON:
+            # IOCON is shared by both ports
+            mcp._shadow.store(mcp._reg_addr(reg, 0), val)
+            mcp._shadow.store(mcp._reg_addr(reg, 1), val)
+        else:
+            mcp._shadow.store(addr, val)
+            if reg == _MCP_GPIO:
+                # writing GPIO also writes OLAT
+                mcp._shadow.store(self._which_reg(_MCP_OLAT), val)
 
     @property
     def mode(self):
@@ -152,19 +176,54 @@ class Port():
 
 
 class Mcp23017():
-    def __init__(self, i2c, address=0x20, bank=1):
+    def __init__(self, i2c, address=0x20, bank=1, cache=False):
+        '''
+        :param cache: 为True时开启寄存器影子缓存,方向、上拉、中断等配置寄存器的读-改-写不再读取芯片
+        '''
         self._i2c = i2c
         self._address = address
         self._config = 0x00
         self._virtual_pins = {}
+        self._abuf = bytearray(1)
+        self._rbuf = bytearray(1)
+        self._shadow = None
         if self._i2c.write(self._address, bytearray([0x05]), 1, bytearray([0]), 1) == -1:
             raise OSError('MCP23017 not found at I2C address {0}'.format(self._address))
 
         if bank == 1:
             #往IOCON.bank写入bank,如果没找到i2c从设备地址
             self._i2c.write(self._address, bytearray([_MCP_IOCON_DEFAULT]), 1, bytearray([_MCP_IOCON_BANK]), 1)
+            # the chip now uses the bank=1 layout, the IOCON write in init() must be addressed accordingly
+            self._config = _MCP_IOCON_BANK
+        if cache:
+            self._shadow_map()
         self.init(bank)
 
+    def _reg_addr(self, reg, port):
+        if self._config & 0x80 == 0x80:
+            # bank = 1
+            return reg | (port << 4)
+        else:
+            # bank = 0
+            return (reg << 1) + port
+
+    def _read_reg(self, addr):
+        self._abuf[0] = addr
+        if self._i2c.read(self._address, self._abuf, 1, self._rbuf, 1, 0) != 0:
+            return None
+        return self._rbuf[0]
+
+    def _shadow_map(self):
+        self._shadow = RegCache(self._read_reg, [self._reg_addr(reg, port) for reg in _MCP_CACHED for port in (0, 1)])
+
+    def resync(self):
+        '''
+        从芯片重新读取影子缓存(芯片复位或被其他主机改写后调用),未开启缓存时直接返回0
+        '''
+        if self._shadow is None:
+            return 0
+        return self._shadow.resync()
+
     def init(self,bank):
 
         self.porta = Port(0, self)
@@ -245,7 +304,8 @@ class Mcp23017():
         if value is not None:
             # 0: 引脚设置为逻辑低
             # 1: 引脚设置为逻辑高
-            port._flip_property_bit('gpio', value & 1, bit)
+            # 开启缓存时基于缓存的OLAT修改,写入结果与写GPIO相同
+            port._flip_property_bit('gpio' if self._shadow is None else 'output_latch', value & 1, bit)
         if pullup is not None:
             # 0: 弱上拉100k欧姆电阻器禁用
             # 1: 弱上拉100k欧姆电阻器启用
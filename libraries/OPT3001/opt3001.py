@@ -21,6 +21,7 @@ Copyright 2022 - 2023 quectel
 '''
 from machine import I2C
 import utime
+from usr.regmap import RegMap, u16be
 
 I2C_ADDR = 0x44          #addr pin -GND
 # I2C_ADDR = 0x45          #addr pin -VDD
@@ -44,48 +45,35 @@ SHUT_DOWN_MODE = 0
 ONT_SHOT_MODE = 1
 CONTINU_MODE = 2
 
-class Opt3001(object):
+class Opt3001(RegMap):
     def __init__(self,i2c,dev_addr=I2C_ADDR):
-        self._i2c = i2c
+        super().__init__(i2c, dev_addr, 2)
         self._i2c_addr = dev_addr
 
-        manu_id = self._read_data(I2C_LS_REG_MANUFACTURERID, 2)
-        manu_id = (manu_id[0] << 8)  | manu_id[1]
+        manu_id = self.read_u16(I2C_LS_REG_MANUFACTURERID, 'big')
         print(manu_id)
         if manu_id != 0x5449:
             raise Exception("OPT3001 manu id err.")
 
-        self._write_data(I2C_LS_REG_CONFIG, [0xcc,0x10])
+        self.write_u16(I2C_LS_REG_CONFIG, I2C_LS_CONFIG_CONT_FULL_800MS, 'big')
         utime.sleep_ms(15)
         print("sensor init complete.")
 
-    def _write_data(self, reg, data):
-        self._i2c.write(self._i2c_addr,
-                        bytearray([reg]), len([reg]),
-                        bytearray(data), len(data))
-    def _read_data(self, reg, length):
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self._i2c.read(self._i2c_addr,
-                             bytearray([reg]), len([reg]),
-                             r_data, length,
-                             0)
-        return list(r_data)
-
     def set_measure_mode(self,mode=CONTINU_MODE):
         '''
         Set the measurement mode, continuous measurement and single measurement or shutdown
         :param mode: measurement mode 0-off 1-single 2-continuous
-        :return: 0-success -1-mode wrong selection
+        :return: 0-success -1-mode wrong selection or read failed
         '''
         if mode not in range(3):
             return -1
-        r_data = self._read_data(I2C_LS_REG_CONFIG, 2)
-        r_data = (r_data[0] << 8) | r_data[1]
+        r_data = self.read_u16(I2C_LS_REG_CONFIG, 'big')
         print(r_data)
+        if r_data is None:
+            return -1
         w_data = (r_data & 0xf9ff) | (mode << 9)
         print(w_data)
-        self._write_data(I2C_LS_REG_CONFIG, [(w_data >> 8), (w_data & 0xff)])
+        self.write_u16(I2C_LS_REG_CONFIG, w_data, 'big')
         utime.sleep_ms(20)
         return 0
 
@@ -96,10 +84,14 @@ class Opt3001(object):
         @return: illuminance value，Unit:lux
         '''
         while 1:
-            r_data = self._read_data(I2C_LS_REG_CONFIG, 2)[1]
-            if (r_data & (1 << 7)):            #converted flag
-                lux_ori = self._read_data(I2C_LS_REG_RESULT,2)
-                lux_ori = (lux_ori[0] << 8) | lux_ori[1]
+            r_data = self.read_regs(I2C_LS_REG_CONFIG, 2)
+            if r_data is None:
+                raise Exception("OPT3001 read err.")
+            if (r_data[1] & (1 << 7)):            #converted flag
+                r_data = self.read_regs(I2C_LS_REG_RESULT, 2)
+                if r_data is None:
+                    raise Exception("OPT3001 read err.")
+                lux_ori = u16be(r_data)
                 #convert illuminance value
                 mantisse = lux_ori & 0x0fff
                 exponent = (lux_ori & 0xf000) >> 12
@@ -28,12 +28,14 @@ from machine import ExtInt
 from machine import Pin
 #from machine import I2C_simulation
 import utime as time
+from usr.regmap import RegMap, u16le
+from usr.busmgr import get_i2c, share, HIGH
 
 # TODO:AD0脚LSB of I2C address, or SDO of 4WSPI 当AD0接地时 IIC从机地址为0x12，当AD0接到VDDIO时从机地址为0x13；
 # TODO：IIC支持快速和标准模式，100kHz到400kHz
 
 
-class qma7981():
+class qma7981(RegMap):
     i2c_log = None
     i2c_dev = None
     i2c_addre = 0x12
@@ -99,61 +101,46 @@ class qma7981():
     ANY_MOT_TH_ADDR = 0x2E
     SIG_MOT_CONF_ADDR = 0x2F
     RAISE_WAKE_PERIOD_ADDR = 0x35
-    
-
-    def _write(self, reg_addr, data):
-        self.i2c_dev.write(self.i2c_addre,
-                           bytearray(reg_addr), 1,
-                           bytearray(data), len(data))
 
-    def _read(self, reg_addr, length):
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self.i2c_dev.read(self.i2c_addre,
-                          bytearray(reg_addr), 1,
-                          r_data, length,
-                          0)
-        if ret == -1:
-            return []
-        else:
-            return list(r_data)
+    # 芯片不会自行改变的中断使能、映射及配置寄存器,cache=True时读-改-写不再读取
+    CACHED = (INT_EN0_ADDR, INT_EN1_ADDR, INT_EN2_ADDR,
+              INT_MAP0_ADDR, INT_MAP1_ADDR, INT_MAP2_ADDR, INT_MAP3_ADDR,
+              INTPIN_CONF_ADDR, INT_CFG_ADDR, MOT_CONF0_ADDR, DOWN_WAKE_ADDR)
 
-    def __init__(self, user_cb, INT1=None, INT2=None, INT1_output_mode=1, INT2_output_mode=1):
+    def __init__(self, user_cb, INT1=None, INT2=None, INT1_output_mode=1, INT2_output_mode=1, cache=False, i2c=None):
+        '''
+        :param i2c: busmgr句柄或busmgr创建的i2c对象,为None时使用busmgr管理的I2C0,与同一总线上的其他驱动共用
+        '''
         self.cb = user_cb
-        self.i2c_dev = I2C(I2C.I2C0, I2C.FAST_MODE)  # 返回i2c对象
+        if i2c is None:
+            i2c = get_i2c(I2C.I2C0, I2C.FAST_MODE, 'qma7981')
+        else:
+            i2c = share(i2c, 'qma7981')
+        super().__init__(i2c, self.i2c_addre, 6)  # i2c对象
+        self.i2c_dev = self._i2c
+        if cache:
+            self.shadow()
         self.event = None
         self.data = None
         self.gpio_set_state = 0 # gpio设置的状态，用于分配中断对应引脚
         # set device into active mode
-        self._write([self.PM_ADDR], [0xC0])
+        self.write_u8(self.PM_ADDR, 0xC0)
         if INT1 != None:
             if INT1_output_mode == 0:
                 self.extint = ExtInt(INT1, ExtInt.IRQ_RISING, ExtInt.PULL_PD, self.ext_cb)
-                data = self._read([self.INTPIN_CONF_ADDR], 1)
-                data[0] |= 0x01
-                print('INTPIN_CONF_ADDR: {}'.format(data))
-                self._write([self.INTPIN_CONF_ADDR], [data[0]])
+                self.set_bits(self.INTPIN_CONF_ADDR, 0x01)
             elif INT1_output_mode == 1:
                 self.extint = ExtInt(INT1, ExtInt.IRQ_FALLING, ExtInt.PULL_PU, self.ext_cb)
-                data = self._read([self.INTPIN_CONF_ADDR], 1)
-                data[0] &= 0xFE
-                print('INTPIN_CONF_ADDR: {}'.format(data))
-                self._write([self.INTPIN_CONF_ADDR], [data[0]])
+                self.clear_bits(self.INTPIN_CONF_ADDR, 0x01)
             else:
                 raise Exception('set gpio1 trigger mode fault')
             self.extint.enable()
         if INT2 != None:
             if INT2_output_mode == 0:
                 self.extint = ExtInt(INT2, ExtInt.IRQ_RISING , ExtInt.PULL_PD , self.ext_cb)
-                data = self._read([self.INTPIN_CONF_ADDR], 1)
-                data[0] |= 0x04
-                print('INTPIN_CONF_ADDR: {}'.format(data))
-                self._write([self.INTPIN_CONF_ADDR], [data[0]])
+                self.set_bits(self.INTPIN_CONF_ADDR, 0x04)
             elif INT2_output_mode == 1:
-                data = self._read([self.INTPIN_CONF_ADDR], 1)
-                data[0] &= 0xFB
-                print('INTPIN_CONF_ADDR: {}'.format(data))
-                self._write([self.INTPIN_CONF_ADDR], [data[0]])
+                self.clear_bits(self.INTPIN_CONF_ADDR, 0x04)
                 self.extint = ExtInt(INT2, ExtInt.IRQ_FALLING, ExtInt.PULL_PU, self.ext_cb)
             else:
                 raise Exception('set gpio2 trigger mode fault')
@@ -165,14 +152,24 @@ class qma7981():
         elif INT2 != None:
             self.gpio_set_state = 2
 
-        self._write([self.FSR_REG_ADDR], [0xF8])
+        self.write_u8(self.FSR_REG_ADDR, 0xF8)
         # interrupt is in latch mode
-        self._write([self.INT_CFG_ADDR], [0x1F])
+        self.write_u8(self.INT_CFG_ADDR, 0x1F)
         time.sleep_ms(10) 
 
     def ext_cb(self, args):
-        data = self._read([self.INT_ST0_ADDR], 3)
-        direction = data[0] & 0x08
+        # 中断服务优先于其他线程的轮询获得总线,状态和数据在一次加锁内读出
+        with self._i2c.batch(HIGH):
+            if not self._read_event():
+                return
+        self.cb(self.event, self.data)
+
+    def _read_event(self):
+        data = self.read_regs(self.INT_ST0_ADDR, 3)
+        if data is None:
+            return False
+        # the read buffer is reused by readacc()/readstep(), keep the status bytes
+        data = (data[0], data[1], data[2])
         print('state {}'.format(data))
         if data[1] & 0x01:
             self.event = self.SIG_MOT_INT # significant interrupt is active
@@ -196,152 +193,99 @@ class qma7981():
         elif data[1] & 0x48:
             self.data = self.readstep()
             print('step {}'.format(self.readstep))
-        self.cb(self.event, self.data)
+        return True
     
     def set_any_motion_intr(self, en, threshod=0, sample_times=1):
         if en == True:
             # set any motion interrupt consecutive times 
-            data = self._read([self.MOT_CONF0_ADDR], 1)
-            data[0] &= 0xFC
-            if sample_times <= 3:
-                data[0] |= sample_times 
-            else:
-                data[0] |= 0x01 # 2 times
-            self._write([self.MOT_CONF0_ADDR], [data[0]]) 
+            self.update_bits(self.MOT_CONF0_ADDR, 0x03, sample_times if sample_times <= 3 else 0x01) # 0x01: 2 times
             # set the full of accelerometer 0xF8==>Acceleration range:16g; Resolution:1.95mg/LSB
-            self._write([self.FSR_REG_ADDR], [0xF8])
+            self.write_u8(self.FSR_REG_ADDR, 0xF8)
             # set any motion interrupt threshod value 
             threshod = threshod // 31 # 1.95mg * 16
             print('threshod{}'.format(threshod))
-            self._write([self.ANY_MOT_TH_ADDR], [threshod]) # 16 / bits
-            self._write([self.SIG_MOT_CONF_ADDR], [0x00])
+            self.write_u8(self.ANY_MOT_TH_ADDR, threshod) # 16 / bits
+            self.write_u8(self.SIG_MOT_CONF_ADDR, 0x00)
             # 使能中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] |= 0x07
-            print('intr_en{}'.format(intr_en))
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+            self.set_bits(self.INT_EN2_ADDR, 0x07)
             # 设置中断脚
             if self.gpio_set_state & 0x01:
-                intr_map = self._read([self.INT_MAP1_ADDR], 1)
-                intr_map[0] |= 0x01
-                print('intr_map{}'.format(intr_map))
-                self._write([self.INT_MAP1_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP1_ADDR, 0x01)
             elif self.gpio_set_state & 0x02:
-                intr_map = self._read([self.INT_MAP3_ADDR], 1)
-                intr_map[0] |= 0x01
-                self._write([self.INT_MAP3_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP3_ADDR, 0x01)
         else:
             # 取消中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] &= 0xF8
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+            self.clear_bits(self.INT_EN2_ADDR, 0x07)
 
     def set_sig_motion_intr(self, en, threshod=0,  sample_times=1, axis_direction=0):
         if en == True:
             # set any motion interrupt consecutive times 
-            data = self._read([self.MOT_CONF0_ADDR], 1)
-            data[0] &= 0xFC
-            if sample_times <= 3:
-                data[0] |= sample_times 
-            else:
-                data[0] |= 0x01 # 2 times
-            self._write([self.MOT_CONF0_ADDR], [data[0]]) 
+            self.update_bits(self.MOT_CONF0_ADDR, 0x03, sample_times if sample_times <= 3 else 0x01) # 0x01: 2 times
             # set the full of accelerometer 0xF8==>Acceleration range:16g; Resolution:1.95mg/LSB
-            self._write([self.FSR_REG_ADDR], [0xF8])
+            self.write_u8(self.FSR_REG_ADDR, 0xF8)
             # set any motion interrupt threshod value 
             threshod = threshod // 31 # 1.95mg * 16
-            self._write([self.ANY_MOT_TH_ADDR], [threshod]) # 16 / bits
-            self._write([self.SIG_MOT_CONF_ADDR], [0x01])
+            self.write_u8(self.ANY_MOT_TH_ADDR, threshod) # 16 / bits
+            self.write_u8(self.SIG_MOT_CONF_ADDR, 0x01)
             # 使能中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] &= 0xF8
+            intr_en = 0
             if axis_direction == 0:
-                intr_en[0] |= 0x01
+                intr_en = 0x01
             elif axis_direction == 1:
-                intr_en[0] |= 0x02
+                intr_en = 0x02
             elif axis_direction == 2:
-                intr_en[0] |= 0x04
-            print('intr_en{}'.format(intr_en))
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+                intr_en = 0x04
+            self.update_bits(self.INT_EN2_ADDR, 0x07, intr_en)
             # 设置中断脚
             if self.gpio_set_state & 0x01:
-                intr_map = self._read([self.INT_MAP0_ADDR], 1)
-                intr_map[0] |= 0x01
-                self._write([self.INT_MAP0_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP0_ADDR, 0x01)
             elif self.gpio_set_state & 0x02:
-                intr_map = self._read([self.INT_MAP2_ADDR], 1)
-                intr_map[0] |= 0x01
-                self._write([self.INT_MAP2_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP2_ADDR, 0x01)
         else:
             # 取消中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] &= 0xF8
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+            self.clear_bits(self.INT_EN2_ADDR, 0x07)
     
     def set_no_motion_intr(self, en, threshod, duration_time = 10, axis_direction=0x03):
         if en == True:
            # set no motion interrupt consecutive times 
-            data = self._read([self.MOT_CONF0_ADDR], 1)
-            data[0] &= 0x03
-            data[0] |= (duration_time << 2)
-            print('MOT_CONF0_ADDR:{}'.format(data))
-            self._write([self.MOT_CONF0_ADDR], [data[0]]) 
+            self.update_bits(self.MOT_CONF0_ADDR, 0xFC, duration_time << 2)
             # set no motion interrupt threshod value 
             threshod = threshod // 31 # 1.95mg * 16
-            self._write([self.NO_MOT_TH_ADDR], [threshod]) # 16 / bits
-            self._write([self.SIG_MOT_CONF_ADDR], [0x01])
+            self.write_u8(self.NO_MOT_TH_ADDR, threshod) # 16 / bits
+            self.write_u8(self.SIG_MOT_CONF_ADDR, 0x01)
             # 使能中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] &= 0x1F
+            intr_en = 0
             if axis_direction & 0x01:
-                intr_en[0] |= 0x20
+                intr_en |= 0x20
             if axis_direction & 0x02:
-                intr_en[0] |= 0x40
+                intr_en |= 0x40
             if axis_direction & 0x04:
-                intr_en[0] |= 0x80
-            print('INT_EN2_ADDR:{}'.format(intr_en))
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+                intr_en |= 0x80
+            self.update_bits(self.INT_EN2_ADDR, 0xE0, intr_en)
             # 设置中断脚
             if self.gpio_set_state & 0x01:
-                intr_map = self._read([self.INT_MAP1_ADDR], 1)
-                intr_map[0] |= 0x80
-                self._write([self.INT_MAP1_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP1_ADDR, 0x80)
             elif self.gpio_set_state & 0x02:
-                intr_map = self._read([self.INT_MAP3_ADDR], 1)
-                intr_map[0] |= 0x80
-                self._write([self.INT_MAP3_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP3_ADDR, 0x80)
         else:
             # 取消中断
-            intr_en = self._read([self.INT_EN2_ADDR], 1)
-            intr_en[0] &= 0x1F
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+            self.clear_bits(self.INT_EN2_ADDR, 0xE0)
 
 
     def set_step_intr(self, intr_type, en, threshod=0, axis_direction = 0):
         if en == True:
             # enable step counter
-            self._write([self.STEP_CFG_ADDR], [0x8C])
+            self.write_u8(self.STEP_CFG_ADDR, 0x8C)
             # 使能中断
-            intr_en = self._read([self.INT_EN0_ADDR], 1)
-            intr_en[0] |= 0x08
-            print('intr_en{}'.format(intr_en))
-            self._write([self.INT_EN0_ADDR], [intr_en[0]])
+            self.set_bits(self.INT_EN0_ADDR, 0x08)
             # 设置中断脚
             if self.gpio_set_state & 0x02:
-                intr_map = self._read([self.INT_MAP2_ADDR], 1)
-                intr_map[0] |= 0x08
-                print('intr_map{}'.format(intr_map))
-                self._write([self.INT_MAP2_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP2_ADDR, 0x08)
             elif self.gpio_set_state & 0x01:
-                intr_map = self._read([self.INT_MAP0_ADDR], 1)
-                intr_map[0] |= 0x08
-                print('intr_map{}'.format(intr_map))
-                self._write([self.INT_MAP0_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP0_ADDR, 0x08)
         else:
             # 取消中断
-            intr_en = self._read([self.INT_EN0_ADDR], 1)
-            intr_en[0] &= 0xF7
-            self._write([self.INT_EN2_ADDR], [intr_en[0]])
+            self.clear_bits(self.INT_EN0_ADDR, 0x08)
     
     def set_raise_intr(self, en, wake_sum_th=10, wake_diff_th=1.0):
         if en:
@@ -350,79 +294,63 @@ class qma7981():
                 wake_diff_th = int((wake_diff_th - 0.2)*10)
                 data = (wake_sum_th & 0x3F) | ((wake_diff_th & 0x03)<<6)
                 print('RAISE_WAKE_ADDR:{}'.format(data))
-                self._write([self.RAISE_WAKE_ADDR], [data])
+                self.write_u8(self.RAISE_WAKE_ADDR, data)
 
                 data = wake_diff_th >> 2
-                read_data = self._read([self.DOWN_WAKE_ADDR], 1)
-                data = (read_data[0] & 0xFC) | data
-                print('DOWN_WAKE_ADDR:{}'.format(data))
-                self._write([self.DOWN_WAKE_ADDR], [data])
+                self.update_bits(self.DOWN_WAKE_ADDR, 0x03, data)
 
             # 使能中断
-                intr_en = self._read([self.INT_EN0_ADDR], 1)
-                intr_en[0] |= 0x02
-                print('intr_en{}'.format(intr_en))
-                self._write([self.INT_EN0_ADDR], [intr_en[0]])
+                self.set_bits(self.INT_EN0_ADDR, 0x02)
         
             # 设置中断脚
             if self.gpio_set_state & 0x02:
-                intr_map = self._read([self.INT_MAP2_ADDR], 1)
-                intr_map[0] |= 0x02
-                print('intr_map INT_MAP2_ADDR:{}'.format(intr_map))
-                self._write([self.INT_MAP2_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP2_ADDR, 0x02)
             elif self.gpio_set_state & 0x01:
-                intr_map = self._read([self.INT_MAP0_ADDR], 1)
-                intr_map[0] |= 0x02
-                print('intr_map INT_MAP0_ADDR:{}'.format(intr_map))
-                self._write([self.INT_MAP0_ADDR], [intr_map[0]])
+                self.set_bits(self.INT_MAP0_ADDR, 0x02)
         else:
-            intr_en = self._read([self.INT_EN0_ADDR], 1)
-            intr_en[0] &= 0xFD
-            print('intr_en{}'.format(intr_en))
-            self._write([self.INT_EN0_ADDR], [intr_en[0]])
+            self.clear_bits(self.INT_EN0_ADDR, 0x02)
         
     def readstep(self):
-        data0 = self._read([self.STEPCNT_L_ADDR], 1)
-        data1 = self._read([self.STEPCNT_M_ADDR], 1)
-        data2 = self._read([self.STEPCNT_H_ADDR], 1)
-        if data0[0] != -1 and data1[0] != -1 and data2[0] != -1:
-            self.step = (data2[0] << 8) | (data1[0] << 8) | data0[0]
+        # STEP_CNT[15:0] is in 0x07~0x08, STEP_CNT[23:16] in 0x0E
+        with self._i2c:
+            data = self.read_regs(self.STEPCNT_L_ADDR, 2)
+            if data is not None:
+                low = u16le(data)
+                high = self.read_u8(self.STEPCNT_H_ADDR)
+                if high is not None:
+                    self.step = (high << 16) | low
         return self.step
 
     def readacc(self):
-        data = self._read([self.ACC_X_L_ADDR], 6)
-        print('acc data{}'.format(data))
+        # 读出后在锁内解码,避免中断服务的读取覆盖读缓冲
+        with self._i2c:
+            data = self.read_regs(self.ACC_X_L_ADDR, 6)
     
-        if len(data) != 0:
-            if data[1] & 0x80:
-                self.acc[0] = (0x4000 - ((data[0]|(data[1]<<8)) >> 2)) * -1.95
-            else:
-                self.acc[0] = ((data[0]|(data[1]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
-            if data[3] & 0x80:
-                self.acc[1] = (0x4000 - ((data[2]|(data[3]<<8)) >> 2)) * -1.95
-            else:
-                self.acc[1] = ((data[2]|(data[3]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
-            if data[5] & 0x80:
-                self.acc[2] = (0x4000 - ((data[4]|(data[5]<<8)) >> 2)) * -1.95
-            else:
-                self.acc[2] = ((data[4]|(data[5]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
-            print('acc value{}'.format(self.acc))
+            if data is not None:
+                if data[1] & 0x80:
+                    self.acc[0] = (0x4000 - ((data[0]|(data[1]<<8)) >> 2)) * -1.95
+                else:
+                    self.acc[0] = ((data[0]|(data[1]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
+                if data[3] & 0x80:
+                    self.acc[1] = (0x4000 - ((data[2]|(data[3]<<8)) >> 2)) * -1.95
+                else:
+                    self.acc[1] = ((data[2]|(data[3]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
+                if data[5] & 0x80:
+                    self.acc[2] = (0x4000 - ((data[4]|(data[5]<<8)) >> 2)) * -1.95
+                else:
+                    self.acc[2] = ((data[4]|(data[5]<<8)) >> 2) * 1.95 # 根据数据QMA7981_FSR_REG寄存器计算
+                print('acc value{}'.format(self.acc))
         return self.acc
 
     def read_sta_reg(self):
-        data = qma7981_dev._read([qma7981_dev.INT_ST0_ADDR], 3)
-        print('INT_ST0:{}'.format(data))
-        data = qma7981_dev._read([qma7981_dev.INT_EN0_ADDR], 3)
-        print('INT_EN0:{}'.format(data))
-        data = qma7981_dev._read([qma7981_dev.INT_MAP0_ADDR], 4)
-        print('INT_MAP0:{}'.format(data))
-        data = self._read([self.ACC_X_L_ADDR], 6)
-        print('acc data{}'.format(data))
-        data = qma7981_dev._read([qma7981_dev.INTPIN_CONF_ADDR], 1)
-        print('INTPIN_CONF_ADDR:{}'.format(data))
+        for name, reg, n in (('INT_ST0', self.INT_ST0_ADDR, 3), ('INT_EN0', self.INT_EN0_ADDR, 3),
+                             ('INT_MAP0', self.INT_MAP0_ADDR, 4), ('acc data', self.ACC_X_L_ADDR, 6),
+                             ('INTPIN_CONF_ADDR', self.INTPIN_CONF_ADDR, 1)):
+            data = self.read_regs(reg, n)
+            print('{}:{}'.format(name, None if data is None else list(data[:n])))
 
     def clearstep(self):
-        self._write([self.STEP_CLR_ADDR], [0xFF])
+        self.write_u8(self.STEP_CLR_ADDR, 0xFF)
         
 
 qma7981_dev = None
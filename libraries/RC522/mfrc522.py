@@ -25,6 +25,7 @@ from machine import SPI
 import utime
 from machine import ExtInt
 import _thread
+from usr.regmap import RegCache
 
 
 class Mfrc522(object):
@@ -134,13 +135,54 @@ class Mfrc522(object):
     KEY = [0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]
     BLOCK_ADDRS = [8, 9, 10]
 
-    def __init__(self):
+    # 芯片不会自行改变的寄存器,开启缓存后_SetBitMask/_ClearBitMask对它们不再读取
+    CACHED = (TxControlReg, BitFramingReg, ModeReg, TxAutoReg, RxSelReg, RFCfgReg,
+              TModeReg, TPrescalerReg, TReloadRegH, TReloadRegL)
+    _shadow = None
 
+    def __init__(self, cache=False):
+        '''
+        :param cache: 为True时开启寄存器影子缓存
+        '''
+        if cache:
+            self._shadow = RegCache(self._Read_Mfrc522, self.CACHED)
         self.Mfrc522_Init()
 
 
     def _Mfrc522_Reset(self):
-        self._Write_Mfrc522(self.CommandReg, self.PCD_RESETPHASE)
+        self._WriteReg(self.CommandReg, self.PCD_RESETPHASE)
+        if self._shadow is not None:
+            # 软复位后寄存器恢复默认值
+            self._shadow.invalidate()
+
+    def _WriteReg(self, addr, val):
+        '''
+        写寄存器,并更新影子缓存;写入失败时丢弃该寄存器的缓存值
+        :return: spi.write的返回值,成功为0
+        '''
+        ret = self._Write_Mfrc522(addr, val)
+        if self._shadow is not None:
+            if ret == 0:
+                self._shadow.store(addr, val)
+            else:
+                self._shadow.invalidate(addr)
+        return ret
+
+    def _ReadReg(self, addr):
+        '''
+        读寄存器,可缓存的寄存器从影子缓存读取
+        '''
+        if self._shadow is not None:
+            return self._shadow.get(addr)
+        return self._Read_Mfrc522(addr)
+
+    def resync(self):
+        '''
+        从芯片重新读取影子缓存,未开启缓存时直接返回0
+        '''
+        if self._shadow is None:
+            return 0
+        return self._shadow.resync()
 
     def _Write_Mfrc522(self, addr, val):
         print("this bug write")
@@ -154,21 +196,21 @@ class Mfrc522(object):
         raise NotImplementedError
 
     def _SetBitMask(self, reg, mask):
-        tmp = self._Read_Mfrc522(reg)
-        self._Write_Mfrc522(reg, tmp | mask)
+        tmp = self._ReadReg(reg)
+        self._WriteReg(reg, tmp | mask)
 
     def _ClearBitMask(self, reg, mask):
         '''
         寄存器清位
         '''
-        tmp = self._Read_Mfrc522(reg)
-        self._Write_Mfrc522(reg, tmp & (~mask))
+        tmp = self._ReadReg(reg)
+        self._WriteReg(reg, tmp & (~mask))
 
     def AntennaOn(self):
         '''
         开启天线
         '''
-        temp = self._Read_Mfrc522(self.TxControlReg)
+        temp = self._ReadReg(self.TxControlReg)
         if (~(temp & 0x03)):
             self._SetBitMask(self.TxControlReg, 0x03)
 
@@ -191,16 +233,16 @@ class Mfrc522(object):
             irqEn = 0x77
             waitIRq = 0x30
 
-        self._Write_Mfrc522(self.CommIEnReg, irqEn | 0x80)
+        self._WriteReg(self.CommIEnReg, irqEn | 0x80)
         self._ClearBitMask(self.CommIrqReg, 0x80)
         self._SetBitMask(self.FIFOLevelReg, 0x80)
 
-        self._Write_Mfrc522(self.CommandReg, self.PCD_IDLE)
+        self._WriteReg(self.CommandReg, self.PCD_IDLE)
 
         for i in range(len(sendData)):
-            self._Write_Mfrc522(self.FIFODataReg, sendData[i])
+            self._WriteReg(self.FIFODataReg, sendData[i])
 
-        self._Write_Mfrc522(self.CommandReg, command)
+        self._WriteReg(self.CommandReg, command)
 
         if command == self.PCD_TRANSCEIVE:
             self._SetBitMask(self.BitFramingReg, 0x80)
@@ -245,7 +287,7 @@ class Mfrc522(object):
         '''
         TagType = []
 
-        self._Write_Mfrc522(self.BitFramingReg, 0x07)
+        self._WriteReg(self.BitFramingReg, 0x07)
 
         TagType.append(reqMode)
         (status, backData, backBits) = self._Mfrc522_ToCard(
@@ -264,7 +306,7 @@ class Mfrc522(object):
 
         serNum = []
 
-        self._Write_Mfrc522(self.BitFramingReg, 0x00)
+        self._WriteReg(self.BitFramingReg, 0x00)
 
         serNum.append(self.PICC_ANTICOLL)
         serNum.append(0x20)
@@ -289,9 +331,9 @@ class Mfrc522(object):
         self._SetBitMask(self.FIFOLevelReg, 0x80)
 
         for i in range(len(pIndata)):
-            self._Write_Mfrc522(self.FIFODataReg, pIndata[i])
+            self._WriteReg(self.FIFODataReg, pIndata[i])
 
-        self._Write_Mfrc522(self.CommandReg, self.PCD_CALCCRC)
+        self._WriteReg(self.CommandReg, self.PCD_CALCCRC)
         i = 0xFF
         while True:
             n = self._Read_Mfrc522(self.DivIrqReg)
@@ -428,13 +470,13 @@ class Mfrc522(object):
     def Mfrc522_Init(self):
         self._Mfrc522_Reset()
 
-        self._Write_Mfrc522(self.TModeReg, 0x8D)
-        self._Write_Mfrc522(self.TPrescalerReg, 0x3E)
-        self._Write_Mfrc522(self.TReloadRegL, 30)
-        self._Write_Mfrc522(self.TReloadRegH, 0)
+        self._WriteReg(self.TModeReg, 0x8D)
+        self._WriteReg(self.TPrescalerReg, 0x3E)
+        self._WriteReg(self.TReloadRegL, 30)
+        self._WriteReg(self.TReloadRegH, 0)
 
-        self._Write_Mfrc522(self.TxAutoReg, 0x40)
-        self._Write_Mfrc522(self.ModeReg, 0x3D)
+        self._WriteReg(self.TxAutoReg, 0x40)
+        self._WriteReg(self.ModeReg, 0x3D)
         self.AntennaOff()
         self.AntennaOn()
         self.M500PcdConfigISOType('A')
@@ -443,13 +485,13 @@ class Mfrc522(object):
 
         if type == 'A':
             self._ClearBitMask(self.Status2Reg, 0x08)
-            self._Write_Mfrc522(self.ModeReg, 0x3D)
-            self._Write_Mfrc522(self.RxSelReg, 0x86)
-            self._Write_Mfrc522(self.RFCfgReg, 0x7F)
-            self._Write_Mfrc522(self.TReloadRegL, 30)
-            self._Write_Mfrc522(self.TReloadRegH, 0)
-            self._Write_Mfrc522(self.TModeReg, 0x8D)
-            self._Write_Mfrc522(self.TPrescalerReg, 0x3E)
+            self._WriteReg(self.ModeReg, 0x3D)
+            self._WriteReg(self.RxSelReg, 0x86)
+            self._WriteReg(self.RFCfgReg, 0x7F)
+            self._WriteReg(self.TReloadRegL, 30)
+            self._WriteReg(self.TReloadRegH, 0)
+            self._WriteReg(self.TModeReg, 0x8D)
+            self._WriteReg(self.TPrescalerReg, 0x3E)
             utime.sleep_us(1000)
             self.AntennaOn()
         else:
@@ -549,9 +591,9 @@ class Mfrc522(object):
             return
 
         regVal = 0
-        # self._Write_Mfrc522(self.CommIEnReg, regVal)
-        self._Write_Mfrc522(self.CommIEnReg, regVal | 0x20)
-        self._Write_Mfrc522(self.DivlEnReg, 0x90)
+        # self._WriteReg(self.CommIEnReg, regVal)
+        self._WriteReg(self.CommIEnReg, regVal | 0x20)
+        self._WriteReg(self.DivlEnReg, 0x90)
 
         print("get enreg:",self._Read_Mfrc522(self.CommIEnReg))
 
@@ -567,7 +609,7 @@ class Mfrc522(object):
 
 class Mfrc522_spi(Mfrc522):
 
-    def __init__(self, spi=None, *, spi_no=1, spi_mode=0, spi_clk=0, pin_rst, pin_irq=None, irq_cb=None):
+    def __init__(self, spi=None, *, spi_no=1, spi_mode=0, spi_clk=0, pin_rst, pin_irq=None, irq_cb=None, cache=False):
         if spi is None:
             self._spi = SPI(spi_no, spi_mode, spi_clk)
         else:
@@ -578,12 +620,12 @@ class Mfrc522_spi(Mfrc522):
         if pin_irq != None:
             self._irq_set(pin_irq, irq_cb)
 
-        super().__init__()
+        super().__init__(cache)
 
     def _Write_Mfrc522(self, addr, val):
         write_buf = bytearray([(addr << 1) & 0x7E, val])
         # print("write_buf:",write_buf)
-        self._spi.write(write_buf, len(write_buf))
+        return self._spi.write(write_buf, len(write_buf))
 
     def _Read_Mfrc522(self, addr):
         write_buf = bytearray([((addr << 1) & 0x7E) | 0x80, 0])
@@ -37,13 +37,12 @@ class Aht10(HtSensor):
         '''
         initialize the sensor
         '''
-        self.i2c_dev = I2C(I2C.I2C1, I2C.FAST_MODE)
-        self.i2c_addre = addre
+        super()._attach(I2C(I2C.I2C1, I2C.FAST_MODE), addre)
         self.init_data = [0x08, 0x00]
 
         # print("sensor init begin.")
 
-        super()._write_data([self.AHT10_CALIBRATION_CMD], self.init_data)
+        self.write_regs(self.AHT10_CALIBRATION_CMD, bytearray(self.init_data))
         time.sleep_ms(300)  # at last 300ms
 
         # print("sensor init complete.")
@@ -27,41 +27,35 @@ Copyright 2022 - 2022 quectel
 
 from machine import I2C
 import utime as time
+from usr.regmap import RegMap
 
+_NO_DATA = b''
+_MEASURE_ARGS = b'\x33\x00'
 
-class HtSensor(object):
+
+class HtSensor(RegMap):
     '''
     General class of temperature and humidity sensors
+    The AHT sensors take commands instead of register addresses: the command byte is sent as the
+    register address, and measurement results are read without one.
     '''
     def __init__(self,child):
         self._child=child
 
-    def _write_data(self, reg, data):
-        '''
-        i2c write data
-        '''
-        self._child.i2c_dev.write(self._child.i2c_addre,
-                           bytearray(reg), len(reg),
-                           bytearray(data), len(data))
-
-    def _read_data(self,reg, length):
+    def _attach(self, i2c_dev, addre):
         '''
-        i2c read data
+        bind the i2c bus and slave address, called by the child class once they are known
         '''
-        r_data = [0x00 for i in range(length)]
-        r_data = bytearray(r_data)
-        ret = self._child.i2c_dev.read(self._child.i2c_addre,
-                          bytearray(reg), len(reg),
-                          r_data, length,
-                          0)
-        return list(r_data)
+        RegMap.__init__(self, i2c_dev, addre, 6)
+        self.i2c_dev = i2c_dev
+        self.i2c_addre = addre
 
 
     def ht_sensor_reset(self):
         '''
         reset
         '''
-        self._write_data([self._child.AHT20_RESET_CMD],[])
+        self.write_regs(self._child.AHT20_RESET_CMD, _NO_DATA)
         time.sleep_ms(20)  # at last 20ms
         print("reset complete. ")
 
@@ -69,12 +63,14 @@ class HtSensor(object):
         '''
         Trigger measurement data conversion
         '''
-        self._write_data([self._child.AHT20_START_MEASURMENT_CMD], [0x33, 0x00])
+        self.write_regs(self._child.AHT20_START_MEASURMENT_CMD, _MEASURE_ARGS)
         time.sleep_ms(200)  # at last delay 75ms
         # check success or not
-        r_data = self._read_data([],6)
+        r_data = self.read_regs(None, 6)
+        if r_data is None:
+            print("Read measurement failed")
         # check bit7
-        if (r_data[0] >> 7) != 0x0:
+        elif (r_data[0] >> 7) != 0x0:
             print("Conversion has error")
         else:
             return r_data[1:6]
@@ -21,6 +21,7 @@ Copyright 2022 - 2023 quectel
 '''
 import utime
 from machine import I2C
+from usr.regmap import RegMap
 
 # I2C address of the device
 DEFAULT_ADDRESS = 0x19
@@ -98,20 +99,22 @@ class CustomError(Exception):
         return self.errorinfo
 
 
-class Bma250(object):
+class Bma250(RegMap):
     '''
     BMA250 class
     API：set_range(range),set_hz(hz),read_accl(),int_enable(int_code),int_check()
     '''
+    READ_DELAY = 1
+
     def __init__(self,i2c,dev_addr=0x19):
-        self._i2c = i2c
+        super().__init__(i2c, dev_addr, 6)
         self._dev_addr = dev_addr
-        self._read_data(RESET_REG,1)
+        self.read_u8(RESET_REG)
         self.reset()
-        id_read = self._read_data(CHIP_ID_REG,1)[0]
+        id_read = self.read_u8(CHIP_ID_REG)
         if id_read != DEVICE_ID:
             raise CustomError("device id err")
-        self._read_data(CHIP_ID_REG, 1)
+        self.read_u8(CHIP_ID_REG)
         self.set_range()
         self.set_hz()
         self._int_latch() # initialize latch_level default 50ms
@@ -119,30 +122,7 @@ class Bma250(object):
         # print('init suceess! ')
 
     def reset(self):
-        self._write_data(RESET_REG,RESET_CMD)
-
-    def _read_data(self, regaddr, datalen):
-        '''
-        i2c read data
-        :param regaddr: register address
-        :param datalen: read data length
-        :return: data
-        '''
-        r_data = bytearray(datalen)
-        reg_addres = bytearray([regaddr])
-        self._i2c.read(self._dev_addr, reg_addres, 1, r_data, datalen, 1)
-        ret_data = list(r_data)
-        return ret_data
-
-    def _write_data(self, regaddr, data):
-        '''
-        i2c write data
-        :param regaddr: register address
-        :param datalen: data to write
-        '''
-        addr = bytearray([regaddr])
-        w_data = bytearray([data])
-        self._i2c.write(self._dev_addr, addr, len(addr), w_data, len(w_data))
+        self.write_u8(RESET_REG,RESET_CMD)
 
     def set_range(self,range=RANGE_SEL_2G):
         '''
@@ -150,9 +130,9 @@ class Bma250(object):
         :param range: acceleration range, default 2g
         '''
         if range in (RANGE_SEL_2G,RANGE_SEL_4G,RANGE_SEL_8G,RANGE_SEL_16G):
-            if self._write_data(RANGE_SEL_REG,range):
+            if self.write_u8(RANGE_SEL_REG,range):
                 raise CustomError("range select failed.")
-            # print("量程寄存器 {}".format(self._read_data(RANGE_SEL_REG, 1)[0]))
+            # print("量程寄存器 {}".format(self.read_u8(RANGE_SEL_REG)))
         else:
             raise CustomError("range select err")
 
@@ -163,24 +143,25 @@ class Bma250(object):
         """
         if hz in (BW_SEL_7_81,BW_SEL_15_63,BW_SEL_31_25,BW_SEL_62_5,
                      BW_SEL_125,BW_SEL_250,BW_SEL_500,BW_SEL_1000):
-            if self._write_data(BW_SEL_REG,hz):
+            if self.write_u8(BW_SEL_REG,hz):
                 raise CustomError("bandwidth select failed.")
         else:
             raise CustomError("bandwidth select err")
 
     def _int_latch(self,latch_level=0x0E):
-        if self._write_data(LATCH_INT_REG, latch_level):
+        if self.write_u8(LATCH_INT_REG, latch_level):
             raise CustomError("int latch set failed.")
         # print('latch set suceess! ')
 
     @property
     def _resolution(self):
-        return self._read_data(RANGE_SEL_REG,1)[0]
+        return self.read_u8(RANGE_SEL_REG)
 
     def read_acceleration(self):
-        data = self._read_data(X_AXIS_LSB_REG,6)
-        #print(data)
         accel_range = self._resolution
+        data = self.read_regs(X_AXIS_LSB_REG, 6)
+        if data is None:
+            raise CustomError("read acceleration failed.")
         # Convert the data to 10 bits
         if accel_range == 12:        #range_16_G
             divider = 8
@@ -222,32 +203,29 @@ class Bma250(object):
         @param int_code: value to write into the interrupt enable register
         @return:  -1:fail  0:success
         '''
-        r_data = self._read_data(INT_EN1_REG, 1)[0]
-        # print(r_data)
-        w_data = r_data | int_code
         if int_code == s_tap_en:
-            self._write_data(0x2B, tap_thr)
+            self.write_u8(0x2B, tap_thr)
             # self._int_latch(latch_level=0x02)
             # print('single_tap set suceess! ')
         elif int_code == d_tap_en:
-            self._write_data(0x2B, tap_thr)
-            self._write_data(0x2A, tap_dur)
+            self.write_u8(0x2B, tap_thr)
+            self.write_u8(0x2A, tap_dur)
             # print('double_tap set suceess! ')
         elif int_code in range(1,8):
             #设置阈值
-            self._write_data(SLOPE_TH_REG, slop_thr)
-            self._write_data(0x27, slop_dur)
+            self.write_u8(SLOPE_TH_REG, slop_thr)
+            self.write_u8(0x27, slop_dur)
             # print('slop int set suceess! ')
         elif int_code == orient_en:
             self._int_latch(latch_level=0x0E)  # Datasheet recommends not locking or locking for 50ms
             # print('orient_int set suceess! ')
         elif int_code == flat_en:
-            self._write_data(0x2f, flat_hold_time)  # default 0x10 ：512ms
+            self.write_u8(0x2f, flat_hold_time)  # default 0x10 ：512ms
             # print('inact_int set suceess! ')
         else:
             # print('int enable failed.check int_code.')
             return -1
-        if self._write_data(INT_EN1_REG,w_data):
+        if self.set_bits(INT_EN1_REG, int_code):
             raise CustomError("int enable failed.")
         return 0
 
@@ -257,48 +235,46 @@ class Bma250(object):
         @param int_code: value to write into the interrupt enable register
         @return:  -1:fail  0:success
         '''
-        r_data = self._read_data(INT_EN2_REG, 1)[0]
-        w_data = r_data | int_code
         #low_g int 0x04
         if int_code == low_g_en:
-            self._write_data(0x24, low_mode)
-            self._write_data(0x22, low_dur)
-            self._write_data(0x23, low_th)
+            self.write_u8(0x24, low_mode)
+            self.write_u8(0x22, low_dur)
+            self.write_u8(0x23, low_th)
         #high_g int 0x01-0x07
         elif int_code in range(1,8):
-            self._write_data(0x25, high_dur)
-            self._write_data(0x26, high_th)
+            self.write_u8(0x25, high_dur)
+            self.write_u8(0x26, high_th)
         else:
             # print('int enable failed.check int_code.')
             return -1
-        if self._write_data(INT_EN2_REG,w_data):
+        if self.set_bits(INT_EN2_REG, int_code):
             raise CustomError("int enable failed.")
         return 0
 
     def process_single_tap(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0   # a failed read counts as no flag, keep polling
             if r_data & (1<<5):
                 return 1
             utime.sleep_ms(5)
 
     def process_double_tap(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             if r_data & (1<<4):
                 return 1
             utime.sleep_ms(5)
 
     def process_slope(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             if r_data & (1<<2):
                 return 1
             utime.sleep_ms(20)
 
     def process_orient(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             # print(r_data)
             if r_data & (1<<6):
                 return 1
@@ -306,21 +282,21 @@ class Bma250(object):
 
     def process_flat(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             if r_data & (1<<7):
                 return 1
             utime.sleep_ms(20)
 
     def process_low_g(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             if r_data & 1:
                 return 1
             utime.sleep_ms(20)
 
     def process_high_g(self):
         while 1:
-            r_data = self._read_data(STATUS1_REG, 1)[0]
+            r_data = self.read_u8(STATUS1_REG) or 0
             if r_data & (1<<1):
                 return 1
             utime.sleep_ms(20)
@@ -0,0 +1,379 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+共享总线管理
+
+同一个I2C/SPI外设上挂多个芯片、驱动运行在不同线程(主循环、中断回调、工作线程)时,
+各驱动通过BusHandle访问总线,每次传输持有该总线的锁,传输不会交错:
+
+    acc = qma7981(cb, INT1=ExtInt.GPIO33)                   # 默认使用busmgr.get_i2c(I2C.I2C0)
+    als = itl_303als(ExtInt.GPIO32, 100, cb)                # 与qma7981共用同一个I2C0对象和锁
+    io = AW9523(busmgr.get_i2c(I2C.I2C1, name='aw9523'))
+
+    with handle.batch():                                    # 连续多次传输只加锁一次,期间其他线程不能插入
+        status = handle.read(...)
+        handle.write(...)
+
+锁按物理总线(类型和编号)分配,按传输(或batch)持有,不同总线的锁互不影响,不需要全局锁。
+编号在get_i2c/get_spi创建总线对象时记下;自行创建的总线对象用share(bus, name, port=I2C.I2C1)给出编号,
+编号未知的对象share()时抛出ValueError,不会得到一把只属于它自己的锁。
+包装对象(如bustrace.TracedI2C)通过bus属性取到被包装的对象,包装后仍使用原总线的锁。
+等待中的线程按优先级获得总线: HIGH(中断服务) > NORMAL > LOW(后台轮询),同一优先级先到先得。
+锁可重入,batch中的传输及嵌套的batch不再等待。
+每条总线及总线上的每个驱动名统计传输次数、发生等待的次数和等待时间(utime.ticks_us),用于判断总线争用。
+模块只为每个编号保存一个总线对象和一把锁,不保存句柄,统计按驱动名记在总线的BusArbiter上,反复创建驱动不会增加内存占用。
+'''
+
+import utime
+import _thread
+from machine import I2C, SPI
+
+HIGH = 0        # 中断服务
+NORMAL = 1
+LOW = 2         # 后台轮询
+_PRIORITIES = 3
+
+
+class BusArbiter(object):
+    '''
+    一条总线的锁: 可重入,释放时直接交给等待中优先级最高的线程
+    只使用_thread.allocate_lock,每个等待过的线程有一把自己的锁,释放者通过释放它唤醒该线程
+    '''
+    def __init__(self, name):
+        self.name = name
+        self._mutex = _thread.allocate_lock()
+        self._owner = None
+        self._depth = 0
+        self._since = 0
+        self._waiters = [[] for _ in range(_PRIORITIES)]
+        self._wake = {}     # {线程id: 该线程等待用的锁}
+        self._names = {}    # {驱动名: [transactions, contended, wait_us, max_wait_us]}
+        self.reset_stats()
+
+    def counters(self, name):
+        '''
+        返回驱动名在本总线上的统计列表,同名的句柄共用一份
+        '''
+        c = self._names.get(name)
+        if c is None:
+            c = [0, 0, 0, 0]
+            self._names[name] = c
+        return c
+
+    def reset_stats(self):
+        self.transactions = 0
+        self.contended = 0
+        self.wait_us = 0
+        self.max_wait_us = 0
+        self.hold_us = 0
+        self.prio_wait_us = [0] * _PRIORITIES
+        for c in self._names.values():
+            _clear(c)
+
+    def acquire(self, priority=NORMAL):
+        '''
+        获得总线,总线被其他线程占用时阻塞
+        :return: 等待的时间,微秒;本线程已持有总线(嵌套)时返回None
+        '''
+        me = _thread.get_ident()
+        start = utime.ticks_us()
+        self._mutex.acquire()
+        if self._owner == me:
+            self._depth += 1
+            self._mutex.release()
+            return None
+        if self._owner is None:
+            self._owner = me
+            self._depth = 1
+            self.transactions += 1
+            self._since = start
+            self._mutex.release()
+            return 0
+        wake = self._wake.get(me)
+        if wake is None:
+            wake = _thread.allocate_lock()
+            wake.acquire()
+            self._wake[me] = wake
+        self._waiters[priority].append(me)
+        self.contended += 1
+        self._mutex.release()
+        wake.acquire()      # release()把总线交给本线程后返回
+        waited = utime.ticks_diff(utime.ticks_us(), start)
+        self._mutex.acquire()
+        self.wait_us += waited
+        self.prio_wait_us[priority] += waited
+        if waited > self.max_wait_us:
+            self.max_wait_us = waited
+        self._mutex.release()
+        return waited
+
+    def release(self):
+        now = utime.ticks_us()
+        self._mutex.acquire()
+        self._depth -= 1
+        if self._depth:
+            self._mutex.release()
+            return
+        self.hold_us += utime.ticks_diff(now, self._since)
+        self._owner = None
+        for q in self._waiters:
+            if q:
+                # 直接交给下一个线程,避免释放后被刚到达的低优先级线程抢走
+                self._owner = q.pop(0)
+                self._depth = 1
+                self.transactions += 1
+                self._since = now
+                self._wake[self._owner].release()
+                break
+        self._mutex.release()
+
+    def stats(self):
+        '''
+        :return: {'transactions', 'contended', 'wait_us', 'max_wait_us', 'hold_us', 'prio_wait_us'}
+        transactions为加锁次数(batch计一次),contended为其中需要等待的次数,hold_us为总线被占用的总时间
+        '''
+        return {'transactions': self.transactions, 'contended': self.contended, 'wait_us': self.wait_us,
+                'max_wait_us': self.max_wait_us, 'hold_us': self.hold_us, 'prio_wait_us': self.prio_wait_us[:]}
+
+
+def _clear(c):
+    c[0] = 0
+    c[1] = 0
+    c[2] = 0
+    c[3] = 0
+
+
+def _counter_stats(c):
+    return {'transactions': c[0], 'contended': c[1], 'wait_us': c[2], 'max_wait_us': c[3]}
+
+
+class _Batch(object):
+    def __init__(self, handle, priority):
+        self._handle = handle
+        self._priority = priority
+
+    def __enter__(self):
+        self._handle._acquire(self._priority)
+        return self._handle
+
+    def __exit__(self, *args):
+        self._handle._arb.release()
+
+
+class BusHandle(object):
+    '''
+    驱动使用的总线句柄,接口与machine.I2C/SPI相同,每次传输持有总线的锁
+    同一条总线可以有多个句柄(每个驱动一个),共用一个BusArbiter;统计按驱动名记在BusArbiter上
+    '''
+    def __init__(self, bus, arbiter, name=None, priority=NORMAL):
+        '''
+        :param bus: 传输使用的对象: machine.I2C/SPI对象或其包装(如bustrace.TracedI2C)
+        :param arbiter: 该总线的BusArbiter
+        :param name: 驱动名,用于统计
+        :param priority: 本句柄传输的默认优先级
+        '''
+        self._bus = bus
+        self._arb = arbiter
+        self.name = name
+        self.priority = priority
+        self._counts = arbiter.counters(name)
+
+    def _acquire(self, priority):
+        waited = self._arb.acquire(self.priority if priority is None else priority)
+        if waited is None:
+            return
+        # 已持有总线,计数不需要另外加锁
+        c = self._counts
+        c[0] += 1
+        if waited:
+            c[1] += 1
+            c[2] += waited
+            if waited > c[3]:
+                c[3] = waited
+
+    def batch(self, priority=None):
+        '''
+        在with块内持有总线,块内的多次传输只加锁一次且不会被其他线程插入,用于读-改-写和读后解码共用缓冲的情况
+        :param priority: 获得总线时使用的优先级,默认为句柄的优先级;中断服务中使用HIGH
+        '''
+        return _Batch(self, priority)
+
+    def __enter__(self):
+        self._acquire(None)
+        return self
+
+    def __exit__(self, *args):
+        self._arb.release()
+
+    def read(self, *args):
+        self._acquire(None)
+        try:
+            return self._bus.read(*args)
+        finally:
+            self._arb.release()
+
+    def write(self, *args):
+        self._acquire(None)
+        try:
+            return self._bus.write(*args)
+        finally:
+            self._arb.release()
+
+    def write_read(self, *args):
+        self._acquire(None)
+        try:
+            return self._bus.write_read(*args)
+        finally:
+            self._arb.release()
+
+    def stats(self):
+        '''
+        :return: {'transactions', 'contended', 'wait_us', 'max_wait_us'},本总线上同名句柄的合计
+        '''
+        return _counter_stats(self._counts)
+
+    def reset_stats(self):
+        _clear(self._counts)
+
+    def __getattr__(self, name):
+        return getattr(self._bus, name)
+
+
+_lock = _thread.allocate_lock()
+_ports = {}     # {('i2c' | 'spi', 编号): [总线对象, BusArbiter]},reset()后总线对象为None,锁保留
+
+
+def _unwrap(bus):
+    '''
+    包装对象(如bustrace.TracedI2C)通过bus属性给出被包装的对象,逐层取到BusHandle或machine.I2C/SPI
+    '''
+    while not isinstance(bus, (BusHandle, I2C, SPI)):
+        inner = getattr(bus, 'bus', None)
+        if inner is None:
+            break
+        bus = inner
+    return bus
+
+
+def _kind(bus):
+    if isinstance(bus, I2C):
+        return 'i2c'
+    if isinstance(bus, SPI):
+        return 'spi'
+    return type(bus).__name__.lower()
+
+
+def _arbiter(bus, port):
+    '''
+    返回总线对象所在物理总线的BusArbiter,调用者持有_lock
+    编号取自get_i2c/get_spi创建对象时的记录,或由port给出;从machine.I2C/SPI对象本身无法得知编号
+    '''
+    for entry in _ports.values():
+        if entry[0] is bus:
+            return entry[1]
+    if port is None:
+        raise ValueError('bus port unknown: use get_i2c/get_spi, or share(bus, port=...)')
+    key = (_kind(bus), port)
+    entry = _ports.get(key)
+    if entry is None:
+        entry = [bus, BusArbiter('{}{}'.format(key[0], port))]
+        _ports[key] = entry
+    elif entry[0] is None:
+        entry[0] = bus
+    return entry[1]
+
+
+def share(bus, name=None, priority=NORMAL, port=None):
+    '''
+    为总线对象创建句柄;同一条物理总线上的句柄共用一把锁
+    :param bus: BusHandle、get_i2c/get_spi创建的总线对象、或以上对象的包装(如bustrace.TracedI2C)
+    :param name: 驱动名,用于统计
+    :param priority: 句柄的默认优先级
+    :param port: 自行创建的machine.I2C/SPI对象的编号(如I2C.I2C1),该编号还没有总线对象时,之后的get_i2c/get_spi也使用这个对象
+    '''
+    inner = _unwrap(bus)
+    with _lock:
+        if isinstance(inner, BusHandle):
+            arb = inner._arb
+        else:
+            arb = _arbiter(inner, port)
+        return BusHandle(bus, arb, name, priority)
+
+
+def _port(kind, n, create):
+    '''
+    返回编号对应的总线对象,不存在时调用create()创建;同一编号始终使用同一个BusArbiter
+    '''
+    key = (kind, n)
+    with _lock:
+        entry = _ports.get(key)
+        if entry is None:
+            entry = [None, BusArbiter('{}{}'.format(kind, n))]
+            _ports[key] = entry
+        if entry[0] is None:
+            entry[0] = create()
+        return entry[0]
+
+
+def get_i2c(bus_id, mode=I2C.FAST_MODE, name=None, priority=NORMAL):
+    '''
+    获取I2C总线的句柄,同一编号只创建一个machine.I2C对象,速率以第一次创建时为准
+    '''
+    return share(_port('i2c', bus_id, lambda: I2C(bus_id, mode)), name, priority)
+
+
+def get_spi(port, mode=0, clk=0, name=None, priority=NORMAL):
+    '''
+    获取SPI总线的句柄,同一端口只创建一个machine.SPI对象,模式和时钟以第一次创建时为准
+    '''
+    return share(_port('spi', port, lambda: SPI(port, mode, clk)), name, priority)
+
+
+def _arbiters():
+    with _lock:
+        return [entry[1] for entry in _ports.values()]
+
+
+def stats():
+    '''
+    :return: {总线名: 总线统计},总线统计中的'handles'为{驱动名: 该驱动在本总线上的统计}
+    '''
+    out = {}
+    for arb in _arbiters():
+        s = arb.stats()
+        with _lock:
+            names = list(arb._names.items())
+        s['handles'] = {}
+        for name, c in names:
+            s['handles'][name] = _counter_stats(c)
+        out[arb.name] = s
+    return out
+
+
+def reset_stats():
+    for arb in _arbiters():
+        arb.reset_stats()
+
+
+def reset():
+    '''
+    丢弃记录的总线对象并清零统计,之后get_i2c/get_spi重新创建总线对象(用于重新初始化外设或测试)
+    同一编号的新总线对象沿用原来的锁,已发出的句柄和旧总线对象也继续使用这把锁,一条物理总线始终只有一把锁
+    '''
+    with _lock:
+        for entry in _ports.values():
+            entry[0] = None
+    reset_stats()
@@ -0,0 +1,336 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+总线传输跟踪与统计
+
+把传给驱动的machine.I2C/SPI/UART对象换成TracedI2C/TracedSPI/TracedUART,接口不变,
+每次传输按(驱动名, 操作, 寄存器)累计调用次数、失败次数、字节数、阻塞时间和耗时分布,
+并把最近的传输记入环形缓冲,用于查找占用共享总线最多的驱动和寄存器:
+
+    tracer = BusTracer()
+    i2c = busmgr.get_i2c(I2C.I2C0)
+    acc = Bma250(busmgr.share(TracedI2C(i2c, 'bma250', tracer), 'bma250'))
+    io = Mcp23017(busmgr.share(TracedI2C(i2c, 'mcp23017', tracer), 'mcp23017'))
+    tracer.enable()
+    ...
+    tracer.dump()
+
+共用总线时包装busmgr的句柄,share()通过bus属性找到下面的总线,各驱动的包装使用同一把锁。
+关闭时每次传输只多一次属性判断;不需要跟踪时直接传原始总线对象,没有任何额外开销。
+耗时用utime.ticks_us测量,包含驱动线程在总线调用中阻塞的全部时间(含i2c.read的delay)。
+'''
+
+import utime
+import _thread
+
+HIST_BUCKETS = 16   # 耗时分布: 第k格为[2^(k-1), 2^k)微秒,第0格为0微秒,最后一格包含更长的耗时
+
+
+def _bucket(us):
+    b = 0
+    while us > 0 and b < HIST_BUCKETS - 1:
+        us >>= 1
+        b += 1
+    return b
+
+
+def bucket_label(b):
+    '''
+    耗时分布第b格的上限,如'<64us'
+    '''
+    if b == 0:
+        return '0us'
+    if b == HIST_BUCKETS - 1:
+        return '>={}us'.format(1 << (b - 1))
+    return '<{}us'.format(1 << b)
+
+
+class BusTracer(object):
+    '''
+    传输统计的收集器,可被多个驱动、多条总线共用
+    统计项: [调用次数, 失败次数, 字节数, 累计耗时us, 最长耗时us, 耗时分布]
+    '''
+    CALLS, ERRORS, BYTES, TOTAL_US, MAX_US, HIST = range(6)
+
+    def __init__(self, trace_len=64, enabled=False):
+        '''
+        :param trace_len: 环形缓冲保留的传输条数,为0时不记录明细
+        :param enabled: 是否立即开始统计
+        '''
+        self.enabled = enabled
+        self._lock = _thread.allocate_lock()
+        self._trace = [None] * trace_len
+        self._pos = 0
+        self._stats = {}
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        '''
+        清空统计和环形缓冲
+        '''
+        with self._lock:
+            self._stats = {}
+            self._trace = [None] * len(self._trace)
+            self._pos = 0
+
+    def record(self, name, op, reg, nbytes, start, us, ret=0):
+        '''
+        记录一次传输,由Traced*调用
+        :param name: 驱动名
+        :param op: 'r'读、'w'写、'x'全双工、'any'查询接收缓冲
+        :param reg: 寄存器地址,无法区分时为None
+        :param nbytes: 传输的字节数(不含I2C从机地址)
+        :param start: 开始时的utime.ticks_us()
+        :param us: 耗时,微秒
+        :param ret: 总线调用的返回值,非0计为失败(UART除外)
+        '''
+        key = (name, op, reg)
+        with self._lock:
+            s = self._stats.get(key)
+            if s is None:
+                s = [0, 0, 0, 0, 0, [0] * HIST_BUCKETS]
+                self._stats[key] = s
+            s[0] += 1
+            if ret:
+                s[1] += 1
+            s[2] += nbytes
+            s[3] += us
+            if us > s[4]:
+                s[4] = us
+            s[5][_bucket(us)] += 1
+            n = len(self._trace)
+            if n:
+                self._trace[self._pos] = (start, name, op, reg, nbytes, us, ret)
+                self._pos = (self._pos + 1) % n
+
+    def trace(self):
+        '''
+        :return: 最近的传输,从旧到新,每条为(开始ticks_us, 驱动名, 操作, 寄存器, 字节数, 耗时us, 返回值)
+        '''
+        with self._lock:
+            items = self._trace[self._pos:] + self._trace[:self._pos]
+        return [t for t in items if t is not None]
+
+    def stats(self):
+        '''
+        :return: {(驱动名, 操作, 寄存器): [调用次数, 失败次数, 字节数, 累计耗时us, 最长耗时us, 耗时分布]}的副本
+        '''
+        with self._lock:
+            return {k: v[:5] + [v[5][:]] for k, v in self._stats.items()}
+
+    def summary(self):
+        '''
+        按驱动汇总
+        :return: {驱动名: {'calls', 'errors', 'bytes', 'us', 'max_us', 'hist'}}
+        '''
+        out = {}
+        for (name, op, reg), s in self.stats().items():
+            d = out.get(name)
+            if d is None:
+                d = {'calls': 0, 'errors': 0, 'bytes': 0, 'us': 0, 'max_us': 0, 'hist': [0] * HIST_BUCKETS}
+                out[name] = d
+            d['calls'] += s[0]
+            d['errors'] += s[1]
+            d['bytes'] += s[2]
+            d['us'] += s[3]
+            if s[4] > d['max_us']:
+                d['max_us'] = s[4]
+            for i in range(HIST_BUCKETS):
+                d['hist'][i] += s[5][i]
+        return out
+
+    def dump(self, top=10):
+        '''
+        打印各驱动的汇总(按累计耗时从大到小),及每个驱动耗时最多的top个(操作, 寄存器)
+        '''
+        drivers = sorted(self.summary().items(), key=lambda item: -item[1]['us'])
+        stats = sorted(self.stats().items(), key=lambda item: -item[1][3])
+        total = sum(d['us'] for name, d in drivers) or 1
+        print('{:<16}{:>8}{:>7}{:>9}{:>11}{:>6}{:>9}'.format('driver', 'calls', 'errors', 'bytes', 'us', '%', 'max_us'))
+        for name, d in drivers:
+            print('{:<16}{:>8}{:>7}{:>9}{:>11}{:>6}{:>9}'.format(
+                name, d['calls'], d['errors'], d['bytes'], d['us'], d['us'] * 100 // total, d['max_us']))
+            print('    ' + ' '.join('{}:{}'.format(bucket_label(i), c) for i, c in enumerate(d['hist']) if c))
+            rows = [(k, s) for k, s in stats if k[0] == name][:top]
+            for (n, op, reg), s in rows:
+                print('    {:<4}{:<8}{:>8}{:>7}{:>9}{:>11}{:>6}{:>9}'.format(
+                    op, '-' if reg is None else '0x{:02X}'.format(reg), s[0], s[1], s[2], s[3], s[3] // s[0], s[4]))
+
+
+class TracedI2C(object):
+    '''
+    带统计的machine.I2C,寄存器取自寄存器地址缓冲(多字节地址按大端合并)
+    '''
+    def __init__(self, i2c, name, tracer):
+        '''
+        :param i2c: machine.I2C对象或busmgr句柄
+        :param name: 统计中使用的驱动名
+        :param tracer: BusTracer
+        '''
+        self._i2c = i2c
+        self._name = name
+        self._tracer = tracer
+
+    @staticmethod
+    def _reg(addr, addr_len):
+        if addr_len == 0:
+            return None
+        if addr_len == 1:
+            return addr[0]
+        return int.from_bytes(bytes(addr[:addr_len]), 'big')
+
+    def read(self, slaveaddress, addr, addr_len, r_data, datalen, delay=0):
+        if not self._tracer.enabled:
+            return self._i2c.read(slaveaddress, addr, addr_len, r_data, datalen, delay)
+        start = utime.ticks_us()
+        ret = self._i2c.read(slaveaddress, addr, addr_len, r_data, datalen, delay)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'r', self._reg(addr, addr_len), addr_len + datalen, start, us, ret)
+        return ret
+
+    def write(self, slaveaddress, addr, addr_len, data, datalen):
+        if not self._tracer.enabled:
+            return self._i2c.write(slaveaddress, addr, addr_len, data, datalen)
+        start = utime.ticks_us()
+        ret = self._i2c.write(slaveaddress, addr, addr_len, data, datalen)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'w', self._reg(addr, addr_len), addr_len + datalen, start, us, ret)
+        return ret
+
+    @property
+    def bus(self):
+        '''被包装的总线对象,busmgr据此找到总线的锁'''
+        return self._i2c
+
+    def __getattr__(self, name):
+        return getattr(self._i2c, name)
+
+
+class TracedSPI(object):
+    '''
+    带统计的machine.SPI,寄存器取自发送数据的第reg_index个字节
+    '''
+    def __init__(self, spi, name, tracer, reg_index=0, reg_mask=0xFF):
+        '''
+        :param spi: machine.SPI对象
+        :param name: 统计中使用的驱动名
+        :param tracer: BusTracer
+        :param reg_index: 寄存器地址在发送帧中的位置,为None时不按寄存器区分
+        :param reg_mask: 从该字节中取出寄存器地址的掩码
+        '''
+        self._spi = spi
+        self._name = name
+        self._tracer = tracer
+        self._index = reg_index
+        self._mask = reg_mask
+
+    def _reg(self, data, datalen):
+        if self._index is None or self._index >= datalen:
+            return None
+        return data[self._index] & self._mask
+
+    def write(self, data, datalen):
+        if not self._tracer.enabled:
+            return self._spi.write(data, datalen)
+        start = utime.ticks_us()
+        ret = self._spi.write(data, datalen)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'w', self._reg(data, datalen), datalen, start, us, ret)
+        return ret
+
+    def read(self, recv_data, datalen):
+        if not self._tracer.enabled:
+            return self._spi.read(recv_data, datalen)
+        start = utime.ticks_us()
+        ret = self._spi.read(recv_data, datalen)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'r', None, datalen, start, us, ret)
+        return ret
+
+    def write_read(self, r_data, data, datalen):
+        if not self._tracer.enabled:
+            return self._spi.write_read(r_data, data, datalen)
+        start = utime.ticks_us()
+        ret = self._spi.write_read(r_data, data, datalen)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'x', self._reg(data, datalen), datalen, start, us, ret)
+        return ret
+
+    @property
+    def bus(self):
+        '''被包装的总线对象,busmgr据此找到总线的锁'''
+        return self._spi
+
+    def __getattr__(self, name):
+        return getattr(self._spi, name)
+
+
+class TracedUART(object):
+    '''
+    带统计的machine.UART,寄存器取自发送帧的第reg_index个字节;
+    read及any记在最近一次发送的寄存器下,用于统计请求-应答式芯片(如HLW8110)等待应答的时间
+    '''
+    def __init__(self, uart, name, tracer, reg_index=None, reg_mask=0xFF):
+        '''
+        :param uart: machine.UART对象
+        :param name: 统计中使用的驱动名
+        :param tracer: BusTracer
+        :param reg_index: 寄存器地址在发送帧中的位置,为None时不按寄存器区分
+        :param reg_mask: 从该字节中取出寄存器地址的掩码
+        '''
+        self._uart = uart
+        self._name = name
+        self._tracer = tracer
+        self._index = reg_index
+        self._mask = reg_mask
+        self._last = None
+
+    def write(self, data):
+        if not self._tracer.enabled:
+            return self._uart.write(data)
+        if self._index is not None and self._index < len(data):
+            self._last = data[self._index] & self._mask
+        start = utime.ticks_us()
+        ret = self._uart.write(data)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'w', self._last, len(data), start, us)
+        return ret
+
+    def any(self):
+        if not self._tracer.enabled:
+            return self._uart.any()
+        start = utime.ticks_us()
+        ret = self._uart.any()
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'any', self._last, 0, start, us)
+        return ret
+
+    def read(self, nbytes):
+        if not self._tracer.enabled:
+            return self._uart.read(nbytes)
+        start = utime.ticks_us()
+        ret = self._uart.read(nbytes)
+        us = utime.ticks_diff(utime.ticks_us(), start)
+        self._tracer.record(self._name, 'r', self._last, len(ret) if ret else 0, start, us)
+        return ret
+
+    def __getattr__(self, name):
+        return getattr(self._uart, name)
@@ -23,6 +23,7 @@ Copyright 2022 - 2023 quectel
 import utime
 from machine import I2C
 from machine import ExtInt
+from usr.regmap import RegMap
 
 LIS2DH12_OUT_X_L = 0x28
 LIS2DH12_OUT_X_H = 0x29
@@ -91,59 +92,47 @@ Z_MOVE_RECOGNIZE = 0x30
 FF_RECOGNIZE = 0x95  #and zl yl xl
 
 
-class lis2dh12(object):
+class CustomError(Exception):
+    def __init__(self, ErrorInfo):
+        super().__init__(self)
+        self.errorinfo=ErrorInfo
+
+    def __str__(self):
+        return self.errorinfo
+
+
+class lis2dh12(RegMap):
     '''
     lis2dh12 class
     API：sensor_reset(),process_xyz(),int_processing_data(),resolution,
     int_enable(int_type,int_ths,time_limit,time_latency,duration),read_acceleration
     '''
+    AUTO_INC = 0x80     # multi-byte access needs the MSB of the sub-address set
+    READ_DELAY = 1
+
     def __init__(self, i2c_dev, int_pin, slave_address=0x19):
         '''
         :param i2c_dev: i2c object
         :param int_pin: gpio of pin which is connected with int1_pin
         :param slave_address: device address
         '''
+        super().__init__(i2c_dev, slave_address, 6)
         self._address = slave_address
         self._i2c_dev = i2c_dev
         self._int_pin = int_pin
         self._extint = None
         self._sensor_init()
 
-    def _read_data(self, regaddr, datalen):
-        '''
-        i2c read data
-        :param regaddr: register address
-        :param datalen: length of reading data
-        :return: data
-        '''
-        r_data = bytearray(datalen)
-        reg_addres = bytearray([regaddr])
-        self._i2c_dev.read(self._address, reg_addres, 1, r_data, datalen, 1)
-        ret_data = list(r_data)
-        return ret_data
-
-    def _write_data(self, regaddr, data):
-        '''
-        i2c write data
-        :param regaddr: register address
-        :param data: data to write
-        '''
-        addr = bytearray([regaddr])
-        w_data = bytearray([data])
-        self._i2c_dev.write(self._address, addr, len(addr), w_data, len(w_data))
-
     def sensor_reset(self):
         '''
         reset the sensor
         '''
         # 重置chip
-        self._write_data(LIS2DH12_CTRL_REG5, 0x80)
+        self.write_u8(LIS2DH12_CTRL_REG5, 0x80)
 
-        print('reboot already. {}'.format(self._read_data(LIS2DH12_CTRL_REG5,1)))
+        print('reboot already. {}'.format(self.read_u8(LIS2DH12_CTRL_REG5)))
         utime.sleep_ms(100)
-        r_data = self._read_data(LIS2DH12_WHO_AM_I, 1)
-        while r_data[0] != 0x33:
-            r_data = self._read_data(LIS2DH12_WHO_AM_I, 1)
+        while self.read_u8(LIS2DH12_WHO_AM_I) != 0x33:
             utime.sleep_ms(5)
 
     def _sensor_init(self):
@@ -152,13 +141,13 @@ class lis2dh12(object):
         '''
         self.sensor_reset()
 
-        self._write_data(LIS2DH12_CTRL_REG1, 0x77)  # set ODR 400HZ ,enable XYZ.
+        self.write_u8(LIS2DH12_CTRL_REG1, 0x77)  # set ODR 400HZ ,enable XYZ.
         utime.sleep_ms(20)  # (7/ODR) = 18ms
-        self._write_data(LIS2DH12_CTRL_REG4, 0x08)  # ±2g
+        self.write_u8(LIS2DH12_CTRL_REG4, 0x08)  # ±2g
 
-        self._write_data(LIS2DH12_CLICK_CFG, 0)  # clear click_cfg
-        self._write_data(LIS2DH12_INT1_CFG, 0)  # clear int1_cfg
-        self._write_data(LIS2DH12_INT2_CFG, 0)  # clear int2_cfg
+        self.write_u8(LIS2DH12_CLICK_CFG, 0)  # clear click_cfg
+        self.write_u8(LIS2DH12_INT1_CFG, 0)  # clear int1_cfg
+        self.write_u8(LIS2DH12_INT2_CFG, 0)  # clear int2_cfg
 
     def int_enable(self,int_type,int_ths=0x12,time_limit=0x18,time_latency=0x12,time_window=0x55,duration=0x03):
         '''
@@ -171,38 +160,38 @@ class lis2dh12(object):
         '''
         # single_click int
         if int_type in (XYZ_SINGLE_CLICK_INT, X_SINGLE_CLICK_INT, Y_SINGLE_CLICK_INT, Z_SINGLE_CLICK_INT):
-            self._write_data(LIS2DH12_CTRL_REG2, 0x07)  # Enable high pass filter for click function
-            self._write_data(LIS2DH12_CTRL_REG3, 0x80)  # Bind interrupt to INT1 pin, default high level is valid
-            self._write_data(LIS2DH12_CTRL_REG5, 0x08)  # INT1 latch
-            self._write_data(LIS2DH12_CLICK_CFG, int_type)  # enable click_int
-            self._write_data(LIS2DH12_CLICK_THS, int_ths)  # set threshold
-            self._write_data(LIS2DH12_TIME_LIMIT, time_limit)  # set time_limit
+            self.write_u8(LIS2DH12_CTRL_REG2, 0x07)  # Enable high pass filter for click function
+            self.write_u8(LIS2DH12_CTRL_REG3, 0x80)  # Bind interrupt to INT1 pin, default high level is valid
+            self.write_u8(LIS2DH12_CTRL_REG5, 0x08)  # INT1 latch
+            self.write_u8(LIS2DH12_CLICK_CFG, int_type)  # enable click_int
+            self.write_u8(LIS2DH12_CLICK_THS, int_ths)  # set threshold
+            self.write_u8(LIS2DH12_TIME_LIMIT, time_limit)  # set time_limit
         # double_click int
         elif int_type in (XYZ_DOUBLE_CLICK_INT, X_DOUBLE_CLICK_INT, Y_DOUBLE_CLICK_INT, Z_DOUBLE_CLICK_INT):
-            self._write_data(LIS2DH12_CTRL_REG2, 0x07)
-            self._write_data(LIS2DH12_CTRL_REG3, 0x80)
-            self._write_data(LIS2DH12_CTRL_REG5, 0x08)
-            self._write_data(LIS2DH12_CLICK_CFG, int_type)
-            self._write_data(LIS2DH12_CLICK_THS, int_ths)
-            self._write_data(LIS2DH12_TIME_LIMIT, time_limit)
-            self._write_data(LIS2DH12_TIME_LATENCY, time_latency)
-            self._write_data(LIS2DH12_TIME_WINDOW, time_window)
+            self.write_u8(LIS2DH12_CTRL_REG2, 0x07)
+            self.write_u8(LIS2DH12_CTRL_REG3, 0x80)
+            self.write_u8(LIS2DH12_CTRL_REG5, 0x08)
+            self.write_u8(LIS2DH12_CLICK_CFG, int_type)
+            self.write_u8(LIS2DH12_CLICK_THS, int_ths)
+            self.write_u8(LIS2DH12_TIME_LIMIT, time_limit)
+            self.write_u8(LIS2DH12_TIME_LATENCY, time_latency)
+            self.write_u8(LIS2DH12_TIME_WINDOW, time_window)
         # int
         elif int_type in (MOVE_RECOGNIZE, X_MOVE_RECOGNIZE, Y_MOVE_RECOGNIZE, Z_MOVE_RECOGNIZE,POSI_CHANGE_RECOGNIZE,
                           X_POSI_CHANGE_RECOGNIZE,Y_POSI_CHANGE_RECOGNIZE,Z_POSI_CHANGE_RECOGNIZE,FF_RECOGNIZE):
-            self._write_data(LIS2DH12_CTRL_REG2, 0x00)  # switch off the high pass filter
-            self._write_data(LIS2DH12_CTRL_REG3, 0x40)
-            self._write_data(LIS2DH12_CTRL_REG5, 0x08)
-            self._write_data(LIS2DH12_INT1_CFG, int_type)  # enable 6d int
-            self._write_data(LIS2DH12_INT1_THS, int_ths)
-            self._write_data(LIS2DH12_INT1_DURATION, duration)  # set duration
+            self.write_u8(LIS2DH12_CTRL_REG2, 0x00)  # switch off the high pass filter
+            self.write_u8(LIS2DH12_CTRL_REG3, 0x40)
+            self.write_u8(LIS2DH12_CTRL_REG5, 0x08)
+            self.write_u8(LIS2DH12_INT1_CFG, int_type)  # enable 6d int
+            self.write_u8(LIS2DH12_INT1_THS, int_ths)
+            self.write_u8(LIS2DH12_INT1_DURATION, duration)  # set duration
 
 
     def start_sensor(self):
         '''
         start the sensor
         '''
-        self._write_data(LIS2DH12_CTRL_REG1, 0x77)  # ODR 100HZ ,enable XYZ.
+        self.write_u8(LIS2DH12_CTRL_REG1, 0x77)  # ODR 100HZ ,enable XYZ.
         utime.sleep_ms(20)  # (7/ODR) = 18ms
 
     def process_xyz(self):
@@ -210,15 +199,17 @@ class lis2dh12(object):
         Read registers and convert x-axis, y-axis, and z-axis data
         :return: x,y,z data
         '''
-        data = []
-        ctl4 = self._read_data(LIS2DH12_CTRL_REG4, 1)[0]
-        big_endian = ctl4 & 0x40
-        # read xl,xh,yl,yh,zl,zh
-        for i in range(6):
-            r_data = self._read_data(LIS2DH12_OUT_X_L + i, 1)
-            data.append(r_data[0])
-
-        if big_endian:
+        return self._xyz(self.read_u8(LIS2DH12_CTRL_REG4))
+
+    def _xyz(self, ctl4):
+        '''
+        read xl,xh,yl,yh,zl,zh in one auto-increment burst
+        :param ctl4: value of CTRL_REG4, selects the data byte order
+        '''
+        data = self.read_regs(LIS2DH12_OUT_X_L, 6)
+        if ctl4 is None or data is None:
+            raise CustomError("read acceleration failed.")
+        if ctl4 & 0x40:     # big endian
             x = data[0] * 256 + data[1]
             y = data[2] * 256 + data[3]
             z = data[4] * 256 + data[5]
@@ -235,7 +226,7 @@ class lis2dh12(object):
         :return: x,y,z-axis acceleration
         '''
         acc = self.read_acceleration
-        int_src = self._read_data(LIS2DH12_INT1_SRC,1)  # read INT1_SRC，clear interrupt request
+        self.read_u8(LIS2DH12_INT1_SRC)  # read INT1_SRC，clear interrupt request
         return acc
 
     @property
@@ -244,8 +235,7 @@ class lis2dh12(object):
         resolution range.
         :return: range_2_G, range_4_G, range_8_G,, range_16_G.
         """
-        ctl4 = self._read_data(LIS2DH12_CTRL_REG4,1)[0]
-        return (ctl4 >> 4) & 0x03
+        return self.read_field(LIS2DH12_CTRL_REG4, 0x30)
 
     @property
     def _acceleration(self):
@@ -254,7 +244,10 @@ class lis2dh12(object):
         :return: x,y,z-axis acceleration
         """
         divider = 1
-        accel_range = self._resolution
+        ctl4 = self.read_u8(LIS2DH12_CTRL_REG4)
+        if ctl4 is None:
+            raise CustomError("read acceleration failed.")
+        accel_range = (ctl4 >> 4) & 0x03
         if accel_range == 3:        # range_16_G
             divider = 2048
         elif accel_range == 2:      # range_8_G
@@ -264,7 +257,7 @@ class lis2dh12(object):
         elif accel_range == 0:      # range_2_G
             divider = 16384
 
-        x, y, z = self.process_xyz()
+        x, y, z = self._xyz(ctl4)
 
         x = x / divider
         y = y / divider
@@ -301,9 +294,10 @@ class lis2dh12(object):
         '''
 
         while 1:
-            status = self._read_data(LIS2DH12_STATUS_REG,1)[0]
+            status = self.read_u8(LIS2DH12_STATUS_REG)
+            if status is None:
+                raise CustomError("read acceleration failed.")
             xyzda = status & 0x08   # if xyz data exists, set 1
-            xyzor = status & 0x80
             if not xyzda:
                 continue
             else:
@@ -318,14 +312,14 @@ class lis2dh12(object):
         :return: None
         """
         if mode == 0:
-            self._write_data(LIS2DH12_CTRL_REG1, 0x77)  # ODR 400HZ ,enable XYZ.
-            self._write_data(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， High resolution mode
+            self.write_u8(LIS2DH12_CTRL_REG1, 0x77)  # ODR 400HZ ,enable XYZ.
+            self.write_u8(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， High resolution mode
         elif mode == 1:
-            self._write_data(LIS2DH12_CTRL_REG1, 0x57)  # ODR 100HZ ,enable XYZ.
-            self._write_data(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， Normal mode
+            self.write_u8(LIS2DH12_CTRL_REG1, 0x57)  # ODR 100HZ ,enable XYZ.
+            self.write_u8(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， Normal mode
         elif mode == 2:
-            self._write_data(LIS2DH12_CTRL_REG1, 0x8f)
-            self._write_data(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， Low power mode
+            self.write_u8(LIS2DH12_CTRL_REG1, 0x8f)
+            self.write_u8(LIS2DH12_CTRL_REG4, 0x08)  # ±2g， Low power mode
         else:
             print("wrong mode.")
 
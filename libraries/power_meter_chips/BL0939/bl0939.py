@@ -49,8 +49,12 @@ class Bl0939(object):
     Bl0939计量芯片类
     开放接口：read()
     '''
-    def __init__(self, port=1, mode=1, clk=0):
-        self._spi = SPI(port, mode, clk)
+    def __init__(self, port=1, mode=1, clk=0, spi=None):
+        '''
+        :param port: spi端口号,mode、clk为spi的模式和时钟,spi为None时使用这三个参数创建SPI对象
+        :param spi: 已创建的SPI对象(或接口相同的对象,如bustrace.TracedSPI)
+        '''
+        self._spi = SPI(port, mode, clk) if spi is None else spi
         self._write_reg(SOFT_RESET, 0x5a5a5a)
 
 
@@ -83,7 +87,7 @@ class Bl0939(object):
         m_byte = (data >> 8) & 0xff
         l_byte = (data >> 0) & 0xff
 
-        check_sum = ~((0xA5 + reg + h_byte + m_byte + l_byte) & 0xFF)
+        check_sum = ~(0xA5 + reg + h_byte + m_byte + l_byte) & 0xFF
         w_data = bytearray([0xA5,reg,h_byte,m_byte,l_byte,check_sum]) #0xA5:写识别字节
         if self._spi.write(w_data, len(w_data)) == -1:
             raise CustomError("spi write err. ")
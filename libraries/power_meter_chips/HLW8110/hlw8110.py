@@ -287,8 +287,14 @@ class Hlw8110(object):
         return in_flag
 
 class Hlw8110_uart(Hlw8110):
-    def __init__(self, uart_n, databits = 8, flowctl = 0):
-        self.uart = UART(uart_n, 9600, databits, 1, 1, flowctl) #hlw8110固定9600波特率 偶校验even
+    def __init__(self, uart_n, databits = 8, flowctl = 0, uart = None):
+        '''
+        :param uart_n: uart端口号,uart为None时按hlw8110的固定参数创建UART对象
+        :param uart: 已创建的UART对象(或接口相同的对象,如bustrace.TracedUART)
+        '''
+        if uart is None:
+            uart = UART(uart_n, 9600, databits, 1, 1, flowctl) #hlw8110固定9600波特率 偶校验even
+        self.uart = uart
         super().__init__(self)
 
     def read_reg(self,reg):
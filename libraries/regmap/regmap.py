@@ -0,0 +1,326 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+I2C寄存器访问基类
+
+各传感器驱动继承RegMap,共用一套不分配内存的寄存器读写:
+    - 寄存器地址、单字节写和读缓冲在构造时分配,之后每次访问只复用这些缓冲
+    - read_regs按芯片的地址自增约定一次读出连续的多个寄存器(AUTO_INC),返回内部缓冲
+    - update_bits/set_bits/clear_bits/read_field/write_field完成位域的读-改-写
+    - u16le、s16le、u24be等函数从缓冲中按类型解码
+    - 可选的影子缓存(RegCache)记住芯片不会自行改变的寄存器,读-改-写时省去读取
+    - 总线为busmgr的共享句柄时,设置地址缓冲与传输、读-改-写都在一次加锁内完成,多个线程可以共用一个驱动对象
+
+read_regs返回的缓冲在下一次读取时会被覆盖,需要保留的数据应先解码或复制。
+i2c.read/i2c.write成功时返回0,读取失败时read_regs及read_u8等返回None,写入函数返回i2c.write的返回值。
+'''
+
+
+def u16le(buf, i=0):
+    return buf[i] | (buf[i + 1] << 8)
+
+
+def s16le(buf, i=0):
+    v = buf[i] | (buf[i + 1] << 8)
+    return v - 0x10000 if v & 0x8000 else v
+
+
+def u16be(buf, i=0):
+    return (buf[i] << 8) | buf[i + 1]
+
+
+def s16be(buf, i=0):
+    v = (buf[i] << 8) | buf[i + 1]
+    return v - 0x10000 if v & 0x8000 else v
+
+
+def u24le(buf, i=0):
+    return buf[i] | (buf[i + 1] << 8) | (buf[i + 2] << 16)
+
+
+def u24be(buf, i=0):
+    return (buf[i] << 16) | (buf[i + 1] << 8) | buf[i + 2]
+
+
+def u32le(buf, i=0):
+    return buf[i] | (buf[i + 1] << 8) | (buf[i + 2] << 16) | (buf[i + 3] << 24)
+
+
+def u32be(buf, i=0):
+    return (buf[i] << 24) | (buf[i + 1] << 16) | (buf[i + 2] << 8) | buf[i + 3]
+
+
+def signed(v, bits):
+    '''
+    将bits位的无符号数按补码转换为有符号数
+    '''
+    return v - (1 << bits) if v & (1 << (bits - 1)) else v
+
+
+class _NoLock(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+_NO_LOCK = _NoLock()
+
+
+def _shift(mask):
+    n = 0
+    while mask and not mask & 1:
+        mask >>= 1
+        n += 1
+    return n
+
+
+class RegCache(object):
+    '''
+    寄存器影子缓存(write-through)
+    只缓存芯片不会自行改变的寄存器(方向、上拉、中断使能、配置等),其余寄存器为volatile,每次都从芯片读取。
+    缓存项在第一次读取时从芯片载入,之后由写入直接更新;芯片复位或寄存器被其他途径改写后需调用resync()或invalidate()。
+    不依赖总线类型,RegMap之外的驱动(如SPI的Mfrc522)也可以直接使用。
+    '''
+    def __init__(self, read, regs=()):
+        '''
+        :param read: 从芯片读取单个寄存器的函数,read(reg)返回0~255,失败时返回None
+        :param regs: 可缓存的寄存器地址
+        '''
+        self._read = read
+        self._regs = set(regs)
+        self._vals = {}
+
+    def __contains__(self, reg):
+        return reg in self._regs
+
+    def mark(self, reg, volatile=False):
+        '''
+        将寄存器标记为可缓存或volatile
+        '''
+        if volatile:
+            self._regs.discard(reg)
+            self._vals.pop(reg, None)
+        else:
+            self._regs.add(reg)
+
+    def get(self, reg):
+        '''
+        读取寄存器,可缓存且已载入时不访问总线
+        '''
+        if reg not in self._regs:
+            return self._read(reg)
+        v = self._vals.get(reg)
+        if v is None:
+            v = self._read(reg)
+            if v is not None:
+                self._vals[reg] = v
+        return v
+
+    def store(self, reg, value):
+        '''
+        记录已成功写入芯片的值,volatile寄存器忽略
+        '''
+        if reg in self._regs:
+            self._vals[reg] = value & 0xFF
+
+    def invalidate(self, reg=None):
+        '''
+        丢弃缓存值,下次读取时从芯片重新载入;reg为None时丢弃全部
+        '''
+        if reg is None:
+            self._vals.clear()
+        else:
+            self._vals.pop(reg, None)
+
+    def resync(self, reg=None):
+        '''
+        立即从芯片重新读取缓存的寄存器;reg为None时读取全部可缓存寄存器
+        :return: 成功为0,有寄存器读取失败时为-1(失败的寄存器保持未载入)
+        '''
+        ret = 0
+        for r in (self._regs if reg is None else (reg,)):
+            self._vals.pop(r, None)
+            if r in self._regs and self.get(r) is None:
+                ret = -1
+        return ret
+
+
+class RegMap(object):
+    '''
+    I2C寄存器访问基类
+    子类通过类属性描述芯片的约定:
+        AUTO_INC: 读写多个寄存器时寄存器地址需要或上的自增标志,如LIS2DH12为0x80,地址默认自增的芯片为0
+        READ_DELAY: i2c.read的delay参数(毫秒)
+        CACHED: 调用shadow()时默认缓存的寄存器
+    '''
+    AUTO_INC = 0
+    READ_DELAY = 0
+    CACHED = ()
+    _shadow = None
+
+    def __init__(self, i2c, addr, buf_size=8):
+        '''
+        :param i2c: machine.I2C对象,或busmgr的共享句柄
+        :param addr: 从机地址
+        :param buf_size: 读缓冲大小,不小于驱动一次读取的最多字节数
+        '''
+        self._i2c = i2c
+        # 共享句柄本身可用于with加锁(可重入),地址和数据缓冲在锁内填写,不会被其他线程改掉
+        self._lock = i2c if hasattr(type(i2c), 'batch') else _NO_LOCK
+        self._addr = addr
+        self._reg = bytearray(1)
+        self._buf = bytearray(buf_size)
+        self._wbuf = bytearray(2)
+
+    def _set_reg(self, reg, n):
+        '''
+        写入寄存器地址缓冲,返回地址长度;reg为None时不发送寄存器地址(如AHT系列的命令读)
+        '''
+        if reg is None:
+            return 0
+        self._reg[0] = reg | self.AUTO_INC if n > 1 else reg
+        return 1
+
+    def read_into(self, reg, buf, n=None, delay=None):
+        '''
+        从reg开始连续读取n个字节到buf
+        :param reg: 寄存器地址,为None时不发送地址
+        :param buf: 接收缓冲,长度不小于n
+        :param n: 读取的字节数,默认为len(buf)
+        :param delay: i2c.read的delay参数,默认为READ_DELAY
+        :return: i2c.read的返回值,成功为0
+        '''
+        if n is None:
+            n = len(buf)
+        if delay is None:
+            delay = self.READ_DELAY
+        with self._lock:
+            return self._i2c.read(self._addr, self._reg, self._set_reg(reg, n), buf, n, delay)
+
+    def read_regs(self, reg, n, delay=None):
+        '''
+        从reg开始连续读取n个寄存器到内部缓冲
+        :return: 内部缓冲(前n个字节有效),读取失败时返回None
+        '''
+        if n > len(self._buf):
+            self._buf = bytearray(n)
+        if self.read_into(reg, self._buf, n, delay):
+            return None
+        return self._buf
+
+    def _read_u8(self, reg):
+        with self._lock:
+            buf = self.read_regs(reg, 1)
+            return None if buf is None else buf[0]
+
+    def read_u8(self, reg):
+        if self._shadow is not None:
+            return self._shadow.get(reg)
+        return self._read_u8(reg)
+
+    def read_u16(self, reg, order='little'):
+        with self._lock:
+            buf = self.read_regs(reg, 2)
+            if buf is None:
+                return None
+            return u16be(buf) if order == 'big' else u16le(buf)
+
+    def write_regs(self, reg, data, n=None):
+        '''
+        从reg开始连续写入data
+        :param data: bytes或bytearray
+        :param n: 写入的字节数,默认为len(data)
+        :return: i2c.write的返回值,成功为0
+        '''
+        if n is None:
+            n = len(data)
+        with self._lock:
+            ret = self._i2c.write(self._addr, self._reg, self._set_reg(reg, n), data, n)
+            if self._shadow is not None and reg is not None:
+                for i in range(n):
+                    if ret == 0:
+                        self._shadow.store(reg + i, data[i])
+                    else:
+                        self._shadow.invalidate(reg + i)
+            return ret
+
+    def write_u8(self, reg, value):
+        with self._lock:
+            self._wbuf[0] = value & 0xFF
+            return self.write_regs(reg, self._wbuf, 1)
+
+    def write_u16(self, reg, value, order='little'):
+        with self._lock:
+            if order == 'big':
+                self._wbuf[0] = (value >> 8) & 0xFF
+                self._wbuf[1] = value & 0xFF
+            else:
+                self._wbuf[0] = value & 0xFF
+                self._wbuf[1] = (value >> 8) & 0xFF
+            return self.write_regs(reg, self._wbuf, 2)
+
+    def shadow(self, regs=None):
+        '''
+        开启寄存器影子缓存,之后read_u8及update_bits等读-改-写对可缓存寄存器不再读取芯片
+        :param regs: 可缓存的寄存器,默认为CACHED
+        :return: RegCache对象,可用mark()调整单个寄存器
+        '''
+        self._shadow = RegCache(self._read_u8, self.CACHED if regs is None else regs)
+        return self._shadow
+
+    def resync(self, reg=None):
+        '''
+        从芯片重新读取影子缓存,未开启缓存时直接返回0
+        '''
+        if self._shadow is None:
+            return 0
+        return self._shadow.resync(reg)
+
+    def update_bits(self, reg, mask, value, force=False):
+        '''
+        读-改-写:将reg中mask对应的位改为value中的对应位
+        只有reg在影子缓存中、值没有变化且force为False时才省去写入;其余情况总是写入,
+        读回为1的触发位、自清零位也能再次写入
+        :return: i2c.write的返回值,读取失败时返回-1
+        '''
+        with self._lock:
+            old = self.read_u8(reg)
+            if old is None:
+                return -1
+            new = (old & ~mask) | (value & mask)
+            if new == old and not force and self._shadow is not None and reg in self._shadow:
+                return 0
+            return self.write_u8(reg, new)
+
+    def set_bits(self, reg, bits):
+        return self.update_bits(reg, bits, bits)
+
+    def clear_bits(self, reg, bits):
+        return self.update_bits(reg, bits, 0)
+
+    def read_field(self, reg, mask):
+        '''
+        读取reg中mask对应的位域,结果右移到最低位
+        '''
+        v = self.read_u8(reg)
+        return None if v is None else (v & mask) >> _shift(mask)
+
+    def write_field(self, reg, mask, value):
+        '''
+        将value左移到mask的最低位后写入reg中mask对应的位域
+        '''
+        return self.update_bits(reg, mask, value << _shift(mask))
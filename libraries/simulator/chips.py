@@ -0,0 +1,805 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+寄存器级芯片模型,挂到sim的总线上供驱动访问:
+
+    import sim, chips
+    acc = sim.i2c_bus(1).attach(chips.Lis2dh12(), 0x19)
+    acc.accel = (0.0, 0.0, 1.0)
+
+模型只实现驱动用到的寄存器和时序,测量值由测试代码设置(如accel、temperature),
+转换时间按虚拟时钟计算,驱动轮询或延时足够后才能读到结果。
+
+I2C模型实现i2c_read(reg, n)/i2c_write(reg, data),reg为驱动发送的寄存器地址字节(可能为空);
+SPI模型实现spi_transfer(data),返回等长数据;UART模型实现uart_receive(data),返回应答。
+'''
+
+import sim
+
+_TEMP_OFFSET = 40.5     # HDC2080温度换算偏移
+
+
+def _clamp(v, lo, hi):
+    return lo if v < lo else hi if v > hi else v
+
+
+class RegisterDevice(object):
+    '''
+    按8位寄存器访问的I2C芯片: 256字节寄存器文件和寄存器指针,连续读写时指针自增
+    AUTO_INC: 0表示总是自增;非0(如0x80)表示只有寄存器地址带该位时才自增,实际地址去掉该位
+    RESET: {寄存器: 复位值}
+    READ_ONLY: 忽略写入的寄存器
+    子类通过read_reg/write_reg实现寄存器的副作用,通过command处理不带寄存器地址的写入
+    '''
+    AUTO_INC = 0
+    RESET = {}
+    READ_ONLY = ()
+
+    def __init__(self):
+        self.bus = None
+        self.regs = bytearray(256)
+        self.ptr = 0
+        self.reset()
+
+    def reset(self):
+        self.regs[:] = bytes(256)
+        for reg, value in self.RESET.items():
+            self.regs[reg] = value
+
+    def _decode(self, reg):
+        r = reg[0]
+        if self.AUTO_INC:
+            return r & ~self.AUTO_INC & 0xFF, bool(r & self.AUTO_INC)
+        return r, True
+
+    def next_reg(self, reg):
+        return (reg + 1) & 0xFF
+
+    def read_reg(self, reg):
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg not in self.READ_ONLY:
+            self.regs[reg] = value
+
+    def command(self, data):
+        pass
+
+    def i2c_write(self, reg, data):
+        if not reg:
+            self.command(data)
+            return
+        r, inc = self._decode(reg)
+        for b in data:
+            self.write_reg(r, b)
+            if inc:
+                r = self.next_reg(r)
+        self.ptr = r
+
+    def i2c_read(self, reg, n):
+        if reg:
+            r, inc = self._decode(reg)
+        else:
+            r, inc = self.ptr, True
+        out = bytearray(n)
+        for i in range(n):
+            out[i] = self.read_reg(r) & 0xFF
+            if inc:
+                r = self.next_reg(r)
+        self.ptr = r
+        return out
+
+
+class Lis2dh12(RegisterDevice):
+    '''
+    LIS2DH12三轴加速度计(I2C地址0x18/0x19)
+    accel: (x, y, z),单位g;输出按CTRL_REG4的量程和字节序换算为12位左对齐的数据
+    '''
+    AUTO_INC = 0x80
+    RESET = {0x0F: 0x33, 0x20: 0x07}
+    READ_ONLY = (0x0F, 0x27, 0x28, 0x29, 0x2A, 0x2B, 0x2C, 0x2D, 0x31, 0x35, 0x39)
+
+    def __init__(self):
+        super().__init__()
+        self.accel = (0.0, 0.0, 1.0)
+
+    def _raw(self, axis):
+        ctl4 = self.regs[0x23]
+        fs = 2 << ((ctl4 >> 4) & 0x03)
+        raw = _clamp(int(round(self.accel[axis] * 32768 / fs)), -32768, 32767) & 0xFFF0
+        return raw & 0xFFFF
+
+    def read_reg(self, reg):
+        if 0x28 <= reg <= 0x2D:
+            raw = self._raw((reg - 0x28) >> 1)
+            high = reg & 1
+            if self.regs[0x23] & 0x40:      # BLE: 高字节在低地址
+                high ^= 1
+            return raw >> 8 if high else raw & 0xFF
+        if reg == 0x27:                     # STATUS_REG: ODR不为0时总有新数据
+            return 0x0F if self.regs[0x20] & 0xF0 else 0
+        if reg in (0x31, 0x35, 0x39):       # 中断源,读后清零
+            v = self.regs[reg]
+            self.regs[reg] = 0
+            return v
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg == 0x24 and value & 0x80:    # BOOT: 重新载入默认值,完成后该位自动清零
+            self.reset()
+            return
+        super().write_reg(reg, value)
+
+
+class Bmp280(RegisterDevice):
+    '''
+    BMP280气压传感器(I2C地址0x76/0x77)
+    校准参数取自数据手册的示例;set(temperature, pressure)按补偿公式反算ADC原始值,
+    也可以直接设置adc_t/adc_p。写ctrl_meas启动转换,转换期间status的measuring位为1。
+    '''
+    CALIB = (27504, 26435, -1000, 36477, -10685, 3024, 2855, 140, -7, 15500, -14600, 6000)
+    RESET = {0xD0: 0x58}
+    READ_ONLY = tuple(range(0x88, 0xA0)) + (0xD0, 0xF3, 0xF7, 0xF8, 0xF9, 0xFA, 0xFB, 0xFC)
+
+    def __init__(self):
+        super().__init__()
+        self.adc_t = 519888
+        self.adc_p = 415148
+        self._ready = 0
+
+    def reset(self):
+        super().reset()
+        for i, v in enumerate(self.CALIB):
+            v &= 0xFFFF
+            self.regs[0x88 + i * 2] = v & 0xFF
+            self.regs[0x89 + i * 2] = v >> 8
+        self._ready = 0
+
+    def _t_fine(self, adc_t):
+        t1, t2, t3 = self.CALIB[0:3]
+        var1 = (adc_t / 16384.0 - t1 / 1024.0) * t2
+        var2 = ((adc_t / 131072.0 - t1 / 8192.0) ** 2) * t3
+        return var1 + var2
+
+    def _pressure(self, adc_p, t_fine):
+        p1, p2, p3, p4, p5, p6, p7, p8, p9 = self.CALIB[3:]
+        var1 = t_fine / 2.0 - 64000.0
+        var2 = var1 * var1 * p6 / 32768.0
+        var2 = var2 + var1 * p5 * 2.0
+        var2 = var2 / 4.0 + p4 * 65536.0
+        var1 = (p3 * var1 * var1 / 524288.0 + p2 * var1) / 524288.0
+        var1 = (1.0 + var1 / 32768.0) * p1
+        p = 1048576.0 - adc_p
+        p = (p - var2 / 4096.0) * 6250.0 / var1
+        var1 = p9 * p * p / 2147483648.0
+        var2 = p * p8 / 32768.0
+        return p + (var1 + var2 + p7) / 16.0
+
+    def set(self, temperature, pressure):
+        '''
+        :param temperature: 温度,℃
+        :param pressure: 气压,Pa
+        '''
+        lo, hi = 0, (1 << 20) - 1
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self._t_fine(mid) / 5120.0 < temperature:
+                lo = mid + 1
+            else:
+                hi = mid
+        self.adc_t = lo
+        t_fine = self._t_fine(lo)
+        lo, hi = 0, (1 << 20) - 1
+        while lo < hi:          # 气压随adc_p增大而减小
+            mid = (lo + hi) >> 1
+            if self._pressure(mid, t_fine) > pressure:
+                lo = mid + 1
+            else:
+                hi = mid
+        self.adc_p = lo
+
+    def read_reg(self, reg):
+        if reg == 0xF3:
+            return 0x08 if sim.clock.now < self._ready else 0
+        if 0xF7 <= reg <= 0xFC:
+            adc = self.adc_p if reg < 0xFA else self.adc_t
+            shift = (2 - (reg - 0xF7) % 3) * 8 - 4
+            return (adc >> shift) & 0xFF if shift >= 0 else (adc << 4) & 0xF0
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg == 0xE0:
+            if value == 0xB6:
+                self.reset()
+            return
+        super().write_reg(reg, value)
+        if reg == 0xF4 and value & 0x03:
+            osrs_t = (value >> 5) & 0x07
+            osrs_p = (value >> 2) & 0x07
+            # 数据手册的最长转换时间: 1.25 + 2.3 * T过采样 + (2.3 * P过采样 + 0.575) ms
+            us = 1250 + 2300 * ((1 << osrs_t) >> 1) + 2300 * ((1 << osrs_p) >> 1) + 575
+            self._ready = sim.clock.now + us
+
+
+class Hdc2080(RegisterDevice):
+    '''
+    HDC2080温湿度传感器(I2C地址0x40/0x41)
+    temperature(℃)、humidity(%)由测试代码设置;写MEAS_TRIG后经过转换时间置位DRDY,读0x04清除DRDY
+    '''
+    RESET = {0xFC: 0x49, 0xFD: 0x54, 0xFE: 0xD0, 0xFF: 0x07}
+    READ_ONLY = (0x00, 0x01, 0x02, 0x03, 0x04, 0xFC, 0xFD, 0xFE, 0xFF)
+    CONVERSION_US = 1300    # 14位温度和湿度各一次
+
+    def __init__(self):
+        super().__init__()
+        self.temperature = 25.0
+        self.humidity = 50.0
+        self._ready = None
+
+    def _update(self):
+        if self._ready is not None and sim.clock.now >= self._ready:
+            self._ready = None
+            t = int((self.temperature + _TEMP_OFFSET) * 65536 / 165)
+            h = int(self.humidity * 65536 / 100)
+            t = _clamp(t, 0, 0xFFFF)
+            h = _clamp(h, 0, 0xFFFF)
+            self.regs[0x00:0x04] = bytes((t & 0xFF, t >> 8, h & 0xFF, h >> 8))
+            self.regs[0x04] |= 0x80
+            self.regs[0x0F] &= ~0x01
+
+    def read_reg(self, reg):
+        self._update()
+        v = self.regs[reg]
+        if reg == 0x04:
+            self.regs[0x04] &= ~0x80
+        return v
+
+    def write_reg(self, reg, value):
+        if reg == 0x0E and value & 0x80:
+            self.reset()
+            self._ready = None
+            return
+        super().write_reg(reg, value)
+        if reg == 0x0F and value & 0x01:
+            self._ready = sim.clock.now + self.CONVERSION_US
+
+
+class Aht20(RegisterDevice):
+    '''
+    AHT10/AHT20温湿度传感器(I2C地址0x38),按命令访问
+    0xAC 0x33 0x00触发测量,80ms后状态字节的忙标志清零;读取返回状态、20位湿度、20位温度及CRC
+    '''
+    MEASURE_US = 80000
+
+    def __init__(self):
+        super().__init__()
+        self.temperature = 25.0
+        self.humidity = 50.0
+        self.calibrated = False
+        self._ready = 0
+
+    def i2c_write(self, reg, data):
+        # AHT系列驱动把命令字节当作寄存器地址发送
+        self.command(bytes(reg) + bytes(data))
+
+    def command(self, data):
+        if not data:
+            return
+        cmd = data[0]
+        if cmd == 0xBA:
+            self.calibrated = False
+        elif cmd in (0xE1, 0xBE):
+            self.calibrated = True
+        elif cmd == 0xAC:
+            self._ready = sim.clock.now + self.MEASURE_US
+
+    def i2c_read(self, reg, n):
+        busy = sim.clock.now < self._ready
+        h = _clamp(int(self.humidity * (1 << 20) / 100), 0, (1 << 20) - 1)
+        t = _clamp(int((self.temperature + 50) * (1 << 20) / 200), 0, (1 << 20) - 1)
+        status = (0x80 if busy else 0) | (0x08 if self.calibrated else 0) | 0x10
+        data = bytearray((status, h >> 12, (h >> 4) & 0xFF, ((h & 0x0F) << 4) | (t >> 16), (t >> 8) & 0xFF, t & 0xFF))
+        crc = 0xFF
+        for b in data:
+            crc ^= b
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0x31) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        data.append(crc)
+        return (data + bytes(n))[:n]
+
+
+Aht10 = Aht20
+
+
+class Qma7981(RegisterDevice):
+    '''
+    QMA7981三轴加速度计(I2C地址0x12/0x13)
+    accel: (x, y, z),单位mg;输出为14位数据,按1.95mg/LSB(量程16g)换算,左移2位存放
+    '''
+    RESET = {0x00: 0xE7}
+    READ_ONLY = (0x00, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09, 0x0A, 0x0B, 0x0E)
+
+    def __init__(self):
+        super().__init__()
+        self.accel = (0.0, 0.0, 1000.0)
+        self.steps = 0
+
+    def read_reg(self, reg):
+        if 0x01 <= reg <= 0x06:
+            raw = _clamp(int(round(self.accel[(reg - 1) >> 1] / 1.95)), -8192, 8191) & 0x3FFF
+            raw <<= 2
+            return raw >> 8 if reg % 2 == 0 else raw & 0xFF
+        if reg == 0x07:
+            return self.steps & 0xFF
+        if reg == 0x08:
+            return (self.steps >> 8) & 0xFF
+        if reg == 0x0E:
+            return (self.steps >> 16) & 0xFF
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg == 0x13 and value == 0xFF:   # STEP_CLR
+            self.steps = 0
+        super().write_reg(reg, value)
+
+
+class Ltr303als(RegisterDevice):
+    '''
+    LTR-303ALS-01环境光传感器(I2C地址0x29)
+    ch0、ch1为两个通道的原始计数
+    '''
+    RESET = {0x85: 0x03, 0x86: 0xA0, 0x87: 0x05, 0x97: 0xFF, 0x98: 0xFF}
+    READ_ONLY = (0x86, 0x87, 0x88, 0x89, 0x8A, 0x8B, 0x8C)
+
+    def __init__(self):
+        super().__init__()
+        self.ch0 = 0
+        self.ch1 = 0
+
+    def read_reg(self, reg):
+        if 0x88 <= reg <= 0x8B:
+            v = self.ch1 if reg < 0x8A else self.ch0
+            return v >> 8 if reg & 1 else v & 0xFF
+        if reg == 0x8C:
+            # 数据有效、有新数据
+            return 0x04 if self.regs[0x80] & 0x01 else 0
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg == 0x80 and value & 0x02:    # SW reset
+            self.reset()
+            return
+        super().write_reg(reg, value)
+
+
+class Mcp23017(RegisterDevice):
+    '''
+    MCP23017 16位I/O扩展(I2C地址0x20~0x27),支持IOCON.BANK两种寄存器布局
+    inputs: 外部输入电平(16位,PORTB在高8位),通过set_inputs修改以产生电平变化中断
+    int_gpio: (INTA, INTB)连接的模组引脚,中断时按IOCON.INTPOL驱动对应引脚
+    '''
+    IODIR, IPOL, GPINTEN, DEFVAL, INTCON, IOCON, GPPU, INTF, INTCAP, GPIO, OLAT = range(11)
+
+    def __init__(self, int_gpio=(None, None)):
+        self.int_gpio = int_gpio
+        self.inputs = 0
+        super().__init__()
+
+    def reset(self):
+        self.r = [[0] * 11, [0] * 11]
+        self.r[0][self.IODIR] = self.r[1][self.IODIR] = 0xFF
+        self.ptr = 0
+
+    def _bank(self):
+        return self.r[0][self.IOCON] & 0x80
+
+    def _map(self, addr):
+        if self._bank():
+            reg, port = addr & 0x0F, (addr >> 4) & 1
+        else:
+            reg, port = addr >> 1, addr & 1
+        return (reg, port) if reg <= self.OLAT else (None, port)
+
+    def next_reg(self, reg):
+        if self.r[0][self.IOCON] & 0x20:    # SEQOP: 地址指针不自增
+            return reg
+        if self._bank():
+            return reg + 1 if (reg & 0x0F) < self.OLAT else reg & 0x10
+        return (reg + 1) % 0x16
+
+    def _pins(self, port):
+        r = self.r[port]
+        level = (self.inputs >> (port * 8)) & 0xFF
+        return ((r[self.OLAT] & ~r[self.IODIR]) | ((level ^ r[self.IPOL]) & r[self.IODIR])) & 0xFF
+
+    def read_reg(self, addr):
+        reg, port = self._map(addr)
+        if reg is None:
+            return 0
+        r = self.r[port]
+        if reg == self.GPIO:
+            r[self.INTF] = 0
+            self._drive_int(port)
+            return self._pins(port)
+        if reg == self.INTCAP:
+            v = r[self.INTCAP]
+            r[self.INTF] = 0
+            self._drive_int(port)
+            return v
+        return r[reg]
+
+    def write_reg(self, addr, value):
+        reg, port = self._map(addr)
+        if reg is None or reg in (self.INTF, self.INTCAP):
+            return
+        if reg == self.IOCON:
+            self.r[0][reg] = self.r[1][reg] = value
+        elif reg == self.GPIO:
+            self.r[port][self.OLAT] = value
+        else:
+            self.r[port][reg] = value
+
+    def set_inputs(self, value):
+        '''
+        修改外部输入电平,使能了电平变化中断的输入引脚产生中断
+        '''
+        old = [self._pins(0), self._pins(1)]
+        self.inputs = value & 0xFFFF
+        for port in (0, 1):
+            r = self.r[port]
+            new = self._pins(port)
+            compare = (r[self.DEFVAL] & r[self.INTCON]) | (old[port] & ~r[self.INTCON])
+            flags = (new ^ compare) & r[self.GPINTEN] & r[self.IODIR]
+            if flags and not r[self.INTF]:
+                r[self.INTF] = flags
+                r[self.INTCAP] = new
+                self._drive_int(port)
+
+    def _drive_int(self, port):
+        mirror = self.r[0][self.IOCON] & 0x40
+        active = bool(self.r[0][self.IOCON] & 0x02)
+        pending = bool(self.r[0][self.INTF] or self.r[1][self.INTF]) if mirror else bool(self.r[port][self.INTF])
+        for p in ((0, 1) if mirror else (port,)):
+            gpio = self.int_gpio[p]
+            if gpio is not None:
+                sim.set_pin(gpio, active if pending else not active)
+
+
+def crc_a(data):
+    '''
+    ISO/IEC 14443-A的CRC_A,返回(低字节, 高字节)
+    '''
+    crc = 0x6363
+    for b in data:
+        b ^= crc & 0xFF
+        b = (b ^ (b << 4)) & 0xFF
+        crc = ((crc >> 8) ^ (b << 8) ^ (b << 3) ^ (b >> 4)) & 0xFFFF
+    return crc & 0xFF, crc >> 8
+
+
+class MifareCard(object):
+    '''
+    Mifare Classic 1K卡: 64块 * 16字节,所有扇区使用同一个A密钥
+    '''
+    def __init__(self, uid=b'\x12\x34\x56\x78', key=b'\xff\xff\xff\xff\xff\xff'):
+        self.uid = bytes(uid)
+        self.key = bytes(key)
+        self.blocks = [bytearray(16) for _ in range(64)]
+
+    def bcc(self):
+        v = 0
+        for b in self.uid:
+            v ^= b
+        return v
+
+
+class Rc522(object):
+    '''
+    MFRC522读卡芯片(SPI)
+    card: 天线范围内的卡(MifareCard),为None时寻卡超时
+    支持驱动用到的命令: 软复位、CalcCRC、Transceive(REQA/WUPA、防冲撞、选卡、读块、写块、休眠)、MFAuthent
+    '''
+    CommandReg = 0x01
+    CommIrqReg = 0x04
+    DivIrqReg = 0x05
+    ErrorReg = 0x06
+    Status2Reg = 0x08
+    FIFODataReg = 0x09
+    FIFOLevelReg = 0x0A
+    ControlReg = 0x0C
+    BitFramingReg = 0x0D
+    CRCResultRegM = 0x21
+    CRCResultRegL = 0x22
+    VersionReg = 0x37
+
+    IDLE, CALCCRC, TRANSCEIVE, AUTHENT, RESET = 0x00, 0x03, 0x0C, 0x0E, 0x0F
+
+    def __init__(self, card=None):
+        self.bus = None
+        self.card = card
+        self.reset()
+
+    def reset(self):
+        self.regs = bytearray(64)
+        self.regs[self.VersionReg] = 0x92
+        self.regs[0x14] = 0x80      # TxControlReg
+        self.fifo = bytearray()
+        self._authed = None
+        self._write_block = None
+        self._halted = False
+
+    def spi_transfer(self, data):
+        out = bytearray(len(data))
+        if not data:
+            return out
+        reg = (data[0] >> 1) & 0x3F
+        if data[0] & 0x80:
+            # 读: 之后每个字节是下一个要读的地址
+            for i in range(1, len(data)):
+                out[i] = self.read_reg(reg)
+                reg = (data[i] >> 1) & 0x3F
+        else:
+            for b in data[1:]:
+                self.write_reg(reg, b)
+        return out
+
+    def read_reg(self, reg):
+        if reg == self.FIFODataReg:
+            return self.fifo.pop(0) if self.fifo else 0
+        if reg == self.FIFOLevelReg:
+            return len(self.fifo)
+        return self.regs[reg]
+
+    def write_reg(self, reg, value):
+        if reg == self.FIFODataReg:
+            self.fifo.append(value)
+        elif reg == self.FIFOLevelReg:
+            if value & 0x80:
+                self.fifo = bytearray()
+        elif reg in (self.CommIrqReg, self.DivIrqReg):
+            # bit7为Set1: 1表示置位其余位中为1的位,0表示清除
+            if value & 0x80:
+                self.regs[reg] |= value & 0x7F
+            else:
+                self.regs[reg] &= ~value & 0x7F
+        elif reg == self.CommandReg:
+            self.regs[reg] = value & 0x3F
+            self._command(value & 0x0F)
+        elif reg == self.BitFramingReg:
+            self.regs[reg] = value
+            if value & 0x80 and self.regs[self.CommandReg] & 0x0F == self.TRANSCEIVE:
+                self._transceive()
+        elif reg != self.VersionReg:
+            self.regs[reg] = value
+
+    def _command(self, cmd):
+        if cmd == self.RESET:
+            self.reset()
+        elif cmd == self.CALCCRC:
+            lo, hi = crc_a(self.fifo)
+            self.fifo = bytearray()
+            self.regs[self.CRCResultRegL] = lo
+            self.regs[self.CRCResultRegM] = hi
+            self.regs[self.DivIrqReg] |= 0x04
+        elif cmd == self.AUTHENT:
+            self._authent()
+
+    def _authent(self):
+        frame = bytes(self.fifo)
+        self.fifo = bytearray()
+        card = self.card
+        if card is not None and len(frame) >= 12 and frame[2:8] == card.key and frame[8:12] == card.uid[:4]:
+            self._authed = frame[1] // 4
+            self.regs[self.Status2Reg] |= 0x08
+            self.regs[self.CommIrqReg] |= 0x10
+        else:
+            self._authed = None
+            self.regs[self.CommIrqReg] |= 0x01      # 超时
+
+    def _reply(self, data, last_bits=0):
+        self.fifo = bytearray(data)
+        self.regs[self.ControlReg] = (self.regs[self.ControlReg] & ~0x07) | last_bits
+        self.regs[self.ErrorReg] = 0
+        self.regs[self.CommIrqReg] |= 0x30          # RxIRq | IdleIRq
+
+    def _transceive(self):
+        frame = bytes(self.fifo)
+        self.fifo = bytearray()
+        card = self.card
+        reply = None
+        if card is not None and frame:
+            reply = self._picc(card, frame)
+        if reply is None:
+            self.regs[self.CommIrqReg] |= 0x01      # TimerIRq: 卡无应答
+            return
+        self._reply(*reply)
+
+    def _picc(self, card, frame):
+        cmd = frame[0]
+        if self._write_block is not None:
+            block, self._write_block = self._write_block, None
+            if len(frame) >= 16:
+                card.blocks[block][:] = frame[:16]
+                return (b'\x0a', 4)
+            return (b'\x04', 4)
+        if cmd in (0x26, 0x52):                     # REQA / WUPA
+            if self._halted and cmd == 0x26:
+                return None
+            self._halted = False
+            return (b'\x04\x00', 0)
+        if self._halted:
+            return None
+        if cmd in (0x93, 0x95) and len(frame) == 2:  # 防冲撞
+            return (card.uid[:4] + bytes((card.bcc(),)), 0)
+        if cmd in (0x93, 0x95) and len(frame) >= 7:  # 选卡
+            sak = b'\x08'
+            return (sak + bytes(crc_a(sak)), 0)
+        if cmd == 0x30 and len(frame) >= 2:         # 读块
+            block = frame[1] & 0x3F
+            if self._authed != block // 4:
+                return (b'\x04', 4)
+            data = bytes(card.blocks[block])
+            return (data + bytes(crc_a(data)), 0)
+        if cmd == 0xA0 and len(frame) >= 2:         # 写块第一步
+            block = frame[1] & 0x3F
+            if self._authed != block // 4:
+                return (b'\x04', 4)
+            self._write_block = block
+            return (b'\x0a', 4)
+        if cmd == 0x50:                             # 休眠
+            self._halted = True
+            self._authed = None
+            return None
+        return None
+
+
+class Bl0939(object):
+    '''
+    BL0939电能计量芯片(SPI)
+    ia_rms、ib_rms、v_rms等为24位寄存器原始值;读帧0x55 reg,写帧0xA5 reg h m l 校验
+    写入需先向USR_WRPROT(0x1A)写0x55;向SOFT_RESET(0x19)写0x5A5A5A复位用户寄存器
+    '''
+    IA_RMS = 0x04
+    IB_RMS = 0x05
+    V_RMS = 0x06
+    A_WATT = 0x08
+    B_WATT = 0x09
+    SOFT_RESET = 0x19
+    USR_WRPROT = 0x1A
+
+    def __init__(self):
+        self.bus = None
+        self.regs = {}
+        self.checksum_errors = 0
+        self.reset()
+
+    def reset(self):
+        self.regs = {0x18: 0, self.USR_WRPROT: 0, 0x1B: 0x07FF}
+
+    @property
+    def ia_rms(self):
+        return self.regs.get(self.IA_RMS, 0)
+
+    @ia_rms.setter
+    def ia_rms(self, v):
+        self.regs[self.IA_RMS] = v & 0xFFFFFF
+
+    @property
+    def ib_rms(self):
+        return self.regs.get(self.IB_RMS, 0)
+
+    @ib_rms.setter
+    def ib_rms(self, v):
+        self.regs[self.IB_RMS] = v & 0xFFFFFF
+
+    @property
+    def v_rms(self):
+        return self.regs.get(self.V_RMS, 0)
+
+    @v_rms.setter
+    def v_rms(self, v):
+        self.regs[self.V_RMS] = v & 0xFFFFFF
+
+    def spi_transfer(self, data):
+        out = bytearray(len(data))
+        if len(data) >= 2 and data[0] == 0x55:
+            reg = data[1]
+            v = self.regs.get(reg, 0)
+            reply = bytes((v >> 16, (v >> 8) & 0xFF, v & 0xFF))
+            check = ~(0x55 + reg + sum(reply)) & 0xFF
+            reply += bytes((check,))
+            out[2:2 + len(reply)] = reply[:len(data) - 2]
+        elif len(data) >= 6 and data[0] == 0xA5:
+            reg, h, m, l, check = data[1:6]
+            if check != ~(0xA5 + reg + h + m + l) & 0xFF:
+                self.checksum_errors += 1
+                return out
+            v = (h << 16) | (m << 8) | l
+            if reg == self.SOFT_RESET:
+                if v == 0x5A5A5A:
+                    self.reset()
+            elif reg == self.USR_WRPROT:
+                self.regs[reg] = v
+            elif reg >= 0x10 and self.regs.get(self.USR_WRPROT) == 0x55:
+                self.regs[reg] = v
+        return out
+
+
+class Hlw8110(object):
+    '''
+    HLW8110电能计量芯片(UART,9600bps偶校验)
+    读: 发送0xA5 reg,应答数据及校验;写: 0xA5 reg|0x80 d1 d2 校验,需要先发送写使能命令
+    特殊命令0xA5 0xEA xx 校验: 0xE5写使能、0xDC写关闭、0x96复位
+    regs为{寄存器: 数值},按SIZES中的字节数应答(默认2字节)
+    '''
+    SIZES = {0x22: 2, 0x23: 2, 0x24: 3, 0x25: 3, 0x26: 3, 0x28: 4, 0x29: 4, 0x2A: 3, 0x2B: 3,
+             0x2E: 4, 0x2F: 3, 0x30: 3, 0x31: 3, 0x32: 3, 0x33: 3, 0x34: 3, 0x35: 3, 0x3C: 4, 0x3D: 4}
+    RESET = {0x00: 0x0A04, 0x01: 0x0001, 0x13: 0x0000, 0x40: 0x8000,
+             0x70: 0x3B1D, 0x72: 0xD4A4, 0x73: 0xBDCE, 0x75: 0xE1B2, 0x23: 8949}
+
+    def __init__(self):
+        self.bus = None
+        self.rx = bytearray()
+        self.checksum_errors = 0
+        self.reset()
+
+    def reset(self):
+        self.regs = dict(self.RESET)
+        self.write_enable = False
+
+    def _frame_len(self):
+        if len(self.rx) < 2:
+            return None
+        if self.rx[1] == 0xEA:
+            return 4
+        return 5 if self.rx[1] & 0x80 else 2
+
+    def uart_receive(self, data):
+        self.rx.extend(data)
+        reply = bytearray()
+        while self.rx:
+            if self.rx[0] != 0xA5:
+                del self.rx[0]
+                continue
+            n = self._frame_len()
+            if n is None or len(self.rx) < n:
+                break
+            frame = bytes(self.rx[:n])
+            del self.rx[:n]
+            reply += self._frame(frame)
+        return bytes(reply)
+
+    def _frame(self, frame):
+        if len(frame) == 2:
+            reg = frame[1]
+            size = self.SIZES.get(reg, 2)
+            v = self.regs.get(reg, 0)
+            data = bytes((v >> (8 * i)) & 0xFF for i in reversed(range(size)))
+            return data + bytes((~(0xA5 + reg + sum(data)) & 0xFF,))
+        if ~sum(frame[:-1]) & 0xFF != frame[-1]:
+            self.checksum_errors += 1
+            return b''
+        if frame[1] == 0xEA:
+            if frame[2] == 0xE5:
+                self.write_enable = True
+            elif frame[2] == 0xDC:
+                self.write_enable = False
+            elif frame[2] == 0x96:
+                self.reset()
+            return b''
+        if self.write_enable:
+            self.regs[frame[1] & 0x7F] = (frame[2] << 8) | frame[3]
+        return b''
@@ -0,0 +1,240 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+外设驱动基准测试,在CPython上运行: python driver_benchmark.py [-n 次数]
+
+驱动通过模拟的machine模块访问chips.py中的芯片模型,对每个用例:
+    1. 新建总线和芯片模型,创建驱动对象(初始化过程不计入统计)
+    2. 执行一次,检查驱动返回的数值与模型设置的值是否一致
+    3. 重复执行n次,统计每次操作的耗时、总线传输次数、字节数和虚拟总线时间
+传输次数超过阈值或数值校验失败时该项判为FAIL,退出码为1。
+阈值按当前实现的传输量设置,驱动改动导致传输变多时需要先确认原因再调整阈值。
+'''
+
+import os
+import sys
+import time
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import sim
+import chips
+from machine import I2C, Pin
+
+from usr.LIS2DH12 import lis2dh12
+from usr.bmp280 import BMP280
+from usr.hdc2080 import Hdc2080
+from usr.aht20 import Aht20
+from usr.mcp23017 import Mcp23017
+from usr.mfrc522 import Mfrc522_spi
+from usr.hlw8110 import Hlw8110_uart
+from usr.bl0939 import Bl0939
+from usr.qma7981 import qma7981
+from usr.Itr_303als import itl_303als
+from usr import busmgr
+from usr.bustrace import BusTracer, TracedI2C
+
+
+def _close(a, b, tol):
+    return all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+def _lis2dh12():
+    model = sim.i2c_bus(1).attach(chips.Lis2dh12(), 0x19)
+    model.accel = (0.25, -0.5, 1.0)
+    drv = lis2dh12(I2C(I2C.I2C1, I2C.FAST_MODE), Pin.GPIO1)
+    return sim.i2c_bus(1), lambda: drv.read_acceleration, lambda r: _close(r, model.accel, 0.01)
+
+
+def _bmp280():
+    model = sim.i2c_bus(0).attach(chips.Bmp280(), 0x76)
+    model.set(23.5, 100800)
+    drv = BMP280(I2C(I2C.I2C0, I2C.STANDARD_MODE), 0x76)
+    drv.init()
+    return sim.i2c_bus(0), drv.read_data, lambda r: _close(r, (23.5, 1008.0), 0.05)
+
+
+def _hdc2080():
+    model = sim.i2c_bus(1).attach(chips.Hdc2080(), 0x40)
+    model.temperature = 21.0
+    model.humidity = 40.0
+    drv = Hdc2080(I2C(I2C.I2C1, I2C.FAST_MODE))
+    return sim.i2c_bus(1), drv.read, lambda r: _close(r, (40.0, 21.0), 0.05)
+
+
+def _aht20():
+    model = sim.i2c_bus(1).attach(chips.Aht20(), 0x38)
+    model.temperature = 26.0
+    model.humidity = 55.0
+    drv = Aht20()
+    return sim.i2c_bus(1), drv.read, lambda r: _close(r, (55.0, 26.0), 0.01)
+
+
+def _mcp23017(cache):
+    def setup():
+        model = sim.i2c_bus(1).attach(chips.Mcp23017(), 0x20)
+        drv = Mcp23017(I2C(I2C.I2C1, I2C.FAST_MODE), 0x20, cache=cache)
+
+        def op():
+            for p in range(8):
+                drv.pin(p, mode=0, value=p & 1)
+            for p in range(8, 16):
+                drv.pin(p, mode=1, pullup=True)
+            return model.r[0][model.OLAT], model.r[1][model.GPPU]
+        return sim.i2c_bus(1), op, lambda r: r == (0xAA, 0xFF)
+    return setup
+
+
+def _rc522():
+    card = chips.MifareCard(b'\xde\xad\xbe\xef')
+    sim.spi_bus(1).attach(chips.Rc522(card))
+    drv = Mfrc522_spi(pin_rst=Pin.GPIO12)
+    uid = int.from_bytes(card.uid + bytes((card.bcc(),)), 'big')
+    return sim.spi_bus(1), drv.read_id, lambda r: r == uid
+
+
+def _hlw8110():
+    model = sim.uart_bus(2).attach(chips.Hlw8110())
+    model.regs[0x24] = 0x123456
+    model.regs[0x26] = 0x345678
+    drv = Hlw8110_uart(2)
+
+    def op():
+        return drv.read_i() + drv.read_u()
+    return sim.uart_bus(2), op, lambda r: r == (0x123456, 0x3B1D, 0x345678, 0xD4A4)
+
+
+def _bl0939():
+    model = sim.spi_bus(1).attach(chips.Bl0939())
+    drv = Bl0939(port=1)
+    model.ia_rms, model.ib_rms, model.v_rms = 0x010203, 0x040506, 0x070809
+    return sim.spi_bus(1), drv.read, lambda r: r == (0x010203, 0x040506, 0x070809) and not model.checksum_errors
+
+
+def _shared_i2c0(traced):
+    '''
+    qma7981和ltr303als共用busmgr管理的I2C0,在两个线程中同时读取,并模拟ltr303als的中断服务
+    traced为True时各驱动使用自己的TracedI2C,两个驱动仍须得到同一个BusArbiter
+    '''
+    def setup():
+        busmgr.reset()
+        acc = sim.i2c_bus(0).attach(chips.Qma7981(), 0x12)
+        als = sim.i2c_bus(0).attach(chips.Ltr303als(), 0x29)
+        acc.accel = (100.0, -200.0, 1000.0)
+        acc.steps = 0x012345
+        als.ch0, als.ch1 = 1234, 567
+        if traced:
+            tracer = BusTracer(enabled=True)
+            i2c = busmgr.get_i2c(I2C.I2C0)
+            qma = qma7981(lambda event, data: None, i2c=TracedI2C(i2c, 'qma7981', tracer))
+            ltr = itl_303als(Pin.GPIO32, 100, lambda light: None, intr_output_mode=1,
+                             i2c=TracedI2C(i2c, 'ltr303als', tracer))
+        else:
+            qma = qma7981(lambda event, data: None)
+            ltr = itl_303als(Pin.GPIO32, 100, lambda light: None, intr_output_mode=1)
+
+        def op():
+            errors = []
+
+            def read_qma():
+                for _ in range(4):
+                    if not _close(qma.readacc(), acc.accel, 2) or qma.readstep() != acc.steps:
+                        errors.append('qma7981')
+
+            def read_ltr():
+                for _ in range(4):
+                    if ltr.read() != [als.ch1, als.ch0]:
+                        errors.append('ltr303als')
+                    ltr.ext_cb(None)
+
+            threads = [threading.Thread(target=fn) for fn in (read_qma, read_ltr)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            return errors
+        return sim.i2c_bus(0), op, lambda r: not r and qma._i2c._arb is ltr._i2c._arb
+    return setup
+
+
+# (名称, 创建模型和驱动的函数, 每次操作最多传输次数)
+# hdc2080.read不延时直接轮询DRDY,传输次数取决于转换时间内能完成几次读取
+CASES = (
+    ('lis2dh12 read_acceleration', _lis2dh12, 3),
+    ('bmp280 read_data', _bmp280, 2),
+    ('hdc2080 read', _hdc2080, 16),
+    ('aht20 read', _aht20, 2),
+    ('mcp23017 pin x16', _mcp23017(False), 72),
+    ('mcp23017 pin x16 cache', _mcp23017(True), 8),
+    ('rc522 read_id', _rc522, 42),
+    ('hlw8110 read_i + read_u', _hlw8110, 12),
+    ('bl0939 read', _bl0939, 3),
+    ('qma7981 + ltr303als threads', _shared_i2c0(False), 28),
+    ('traced qma7981 + ltr303als', _shared_i2c0(True), 28),
+)
+
+
+def _quiet(fn, *args):
+    '''
+    驱动初始化时会print,执行期间屏蔽标准输出
+    '''
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        return fn(*args)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def run(repeat=20, out=sys.stdout):
+    '''
+    执行全部用例,返回[(名称, 每次耗时ms, 每次传输次数, 每次字节数, 每次总线时间us, 是否通过), ...]
+    '''
+    results = []
+    for name, setup, max_trans in CASES:
+        sim.reset()
+        bus, op, check = _quiet(setup)
+        ok = check(_quiet(op))
+        bus.reset_stats()
+        t = time.perf_counter()
+        for _ in range(repeat):
+            _quiet(op)
+        ms = (time.perf_counter() - t) * 1000 / repeat
+        stats = bus.stats()
+        trans = stats['transactions'] / repeat
+        nbytes = stats['bytes'] / repeat
+        busy = stats['busy_us'] / repeat
+        ok = ok and trans <= max_trans
+        results.append((name, ms, trans, nbytes, busy, ok))
+        out.write('{:<28}{:>9.3f}{:>8g}{:>6}{:>9g}{:>12g}  {}\n'.format(
+            name, ms, trans, '/' + str(max_trans), nbytes, busy, 'ok' if ok else 'FAIL'))
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Peripheral driver benchmark on simulated buses and chip models')
+    parser.add_argument('-n', '--repeat', type=int, default=20, help='iterations per case')
+    args = parser.parse_args()
+    print('{:<28}{:>9}{:>14}{:>9}{:>12}'.format('case', 'ms/op', 'xfers/op', 'bytes/op', 'bus us/op'))
+    results = run(args.repeat)
+    failed = [r[0] for r in results if not r[5]]
+    if failed:
+        print('FAILED: ' + ', '.join(failed))
+        sys.exit(1)
+    print('all {} cases passed'.format(len(results)))
@@ -0,0 +1,198 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+LCD渲染基准测试,在CPython上运行: python lcd_benchmark.py [-n 次数]
+
+使用模拟的machine.LCD驱动St7789(240x320),对每种绘制操作:
+    1. 清空显存后执行一次,检查显存内容是否正确
+    2. 重复执行n次,统计每次操作的耗时、lcd_write次数和发送字节数
+单色屏Ssd1306(128x64)和Uc1628(128x160)的用例局部修改页帧缓冲后flush(),检查屏幕显存与帧缓冲一致。
+lcd_write次数或字节数超过阈值、或显存校验失败时该项判为FAIL,退出码为1。
+阈值按当前实现的传输量设置,渲染路径改动导致传输变多时需要先确认原因再调整阈值。
+'''
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from usr.st7789 import St7789
+from usr.ssd1306 import Ssd1306
+from usr.uc1628_128160 import Uc1628
+from usr.LCDImage import write_raw
+
+WIDTH = 240
+HEIGHT = 320
+BLACK = 0x0000
+WHITE = 0xFFFF
+RED = 0xF800
+BLUE = 0x001F
+
+IMG_W = 120
+IMG_H = 80
+IMG_STEP = 16   # lcd_show_image_file的分段高度
+
+
+def _region_colors(sim, x0, y0, x1, y1):
+    colors = set()
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
+            colors.add(sim.pixel(x, y))
+    return colors
+
+
+def _image_data():
+    data = bytearray(IMG_W * IMG_H * 2)
+    for y in range(IMG_H):
+        for x in range(IMG_W):
+            c = ((x * 31 // IMG_W) << 11) | ((y * 63 // IMG_H) << 5)
+            i = (y * IMG_W + x) * 2
+            data[i] = c & 0xFF
+            data[i + 1] = c >> 8
+    return data
+
+
+def _check_image(sim, x, y, data):
+    for r in (0, IMG_H // 2, IMG_H - 1):
+        for c in (0, IMG_W // 2, IMG_W - 1):
+            i = (r * IMG_W + c) * 2
+            if sim.pixel(x + c, y + r) != data[i] | (data[i + 1] << 8):
+                return False
+    return True
+
+
+def _make_images(tmp):
+    data = _image_data()
+    raw = os.path.join(tmp, 'image.bin')
+    write_raw(raw, IMG_W, IMG_H, data)
+    txt = os.path.join(tmp, 'image.txt')
+    with open(txt, 'w') as f:
+        for i in range(0, len(data), IMG_W * 2):
+            f.write(','.join(str(v) for v in data[i:i + IMG_W * 2]) + ',\n')
+    return data, raw, txt
+
+
+def _cases(data, raw, txt):
+    '''
+    (名称, 操作, 每次操作最多lcd_write次数, 每次操作最多字节数, 显存校验, 是否使用帧缓冲)
+    '''
+    def fb_circle(lcd):
+        lcd.DrawCircle(120, 160, 50, WHITE)
+        lcd.flush()
+
+    return (
+        ('Fill 240x320', lambda lcd: lcd.Fill(0, 0, WIDTH - 1, HEIGHT - 1, RED), 40, WIDTH * HEIGHT * 2,
+         lambda sim: _region_colors(sim, 0, 0, WIDTH - 1, HEIGHT - 1) == {RED}, False),
+        ('Fill 40x40', lambda lcd: lcd.Fill(100, 100, 139, 139, BLUE), 1, 40 * 40 * 2,
+         lambda sim: sim.pixel(100, 100) == BLUE and sim.pixel(139, 139) == BLUE and sim.pixel(140, 140) == BLACK, False),
+        ('DrawLine horizontal', lambda lcd: lcd.DrawLine(0, 10, WIDTH - 1, 10, WHITE), 1, WIDTH * 2,
+         lambda sim: _region_colors(sim, 0, 10, WIDTH - 1, 10) == {WHITE}, False),
+        ('DrawLine vertical', lambda lcd: lcd.DrawLine(10, 0, 10, HEIGHT - 1, WHITE), 1, HEIGHT * 2,
+         lambda sim: _region_colors(sim, 10, 0, 10, HEIGHT - 1) == {WHITE}, False),
+        ('DrawLine diagonal', lambda lcd: lcd.DrawLine(0, 0, WIDTH - 1, HEIGHT - 1, WHITE), 240, 640,
+         lambda sim: sim.pixel(0, 0) == WHITE and sim.pixel(WIDTH - 1, HEIGHT - 1) == WHITE, False),
+        ('DrawCircle r=50', lambda lcd: lcd.DrawCircle(120, 160, 50, WHITE), 288, 576,
+         lambda sim: sim.pixel(170, 160) == WHITE and sim.pixel(120, 110) == WHITE and sim.pixel(120, 160) == BLACK, False),
+        ('DrawCircle r=50 frame buffer', fb_circle, 6, 101 * 101 * 2,
+         lambda sim: sim.pixel(170, 160) == WHITE and sim.pixel(70, 160) == WHITE and sim.pixel(120, 160) == BLACK, True),
+        ('ShowAsciiStr 8x16 x20', lambda lcd: lcd.ShowAsciiStr(0, 0, 8, 16, 'Quectel QuecPython 1', WHITE, BLACK), 1, 20 * 8 * 16 * 2,
+         lambda sim: _region_colors(sim, 0, 0, 159, 15) == {WHITE, BLACK}, False),
+        ('ShowAsciiStr 16x24 x10', lambda lcd: lcd.ShowAsciiStr(0, 0, 16, 24, 'QuecPython', WHITE, BLACK), 1, 10 * 16 * 24 * 2,
+         lambda sim: _region_colors(sim, 0, 0, 159, 23) == {WHITE, BLACK}, False),
+        ('lcd_show_chinese_str 16x16 x4', lambda lcd: lcd.lcd_show_chinese_str(0, 0, 16, 16, '移远通信', WHITE, BLACK), 1, 4 * 16 * 16 * 2,
+         lambda sim: _region_colors(sim, 0, 0, 63, 15) == {WHITE, BLACK}, False),
+        ('lcd_show_chinese_str 24x24 x4', lambda lcd: lcd.lcd_show_chinese_str(0, 0, 24, 24, '移远通信', WHITE, BLACK), 1, 4 * 24 * 24 * 2,
+         lambda sim: _region_colors(sim, 0, 0, 95, 23) == {WHITE, BLACK}, False),
+        ('lcd_show_image_file raw 120x80', lambda lcd: lcd.lcd_show_image_file(raw, 60, 100, IMG_W, IMG_H, IMG_STEP),
+         IMG_H // IMG_STEP, IMG_W * IMG_H * 2, lambda sim: _check_image(sim, 60, 100, data), False),
+        ('lcd_show_image_file txt 120x80', lambda lcd: lcd.lcd_show_image_file(txt, 60, 100, IMG_W, IMG_H, IMG_STEP),
+         IMG_H // IMG_STEP, IMG_W * IMG_H * 2, lambda sim: _check_image(sim, 60, 100, data), False),
+    )
+
+
+def _mono_cases():
+    '''
+    (名称, 创建屏幕, 操作, 每次操作最多lcd_write次数, 每次操作最多字节数)
+    '''
+    def text(lcd):
+        lcd.ShowAsciiStr(8, 24, 8, 16, 'QUECTEL', WHITE, BLACK)
+        lcd.flush()
+
+    return (
+        ('Ssd1306 ShowAsciiStr + flush', lambda: Ssd1306(128, 64, 6500), text, 1, 7 * 8 * 2),
+        ('Uc1628 ShowAsciiStr + flush', lambda: Uc1628(None, 128, 160, 13000), text, 1, 128 * 160 // 8),
+    )
+
+
+def _measure(sim, op, repeat):
+    sim.reset_stats()
+    t = time.perf_counter()
+    for _ in range(repeat):
+        op()
+    return (time.perf_counter() - t) * 1000 / repeat, sim.writes / repeat, sim.bytes / repeat
+
+
+def _report(out, name, ms, writes, max_writes, nbytes, max_bytes, ok):
+    out.write('{:<34}{:>9.3f}{:>8g}{:>6}{:>10g}{:>8}  {}\n'.format(
+        name, ms, writes, '/' + str(max_writes), nbytes, '/' + str(max_bytes), 'ok' if ok else 'FAIL'))
+
+
+def run(repeat=20, out=sys.stdout):
+    '''
+    执行全部用例,返回[(名称, 每次耗时ms, 每次lcd_write次数, 每次字节数, 是否通过), ...]
+    '''
+    lcd = St7789(width=WIDTH, height=HEIGHT)
+    sim = lcd._lcd
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, op, max_writes, max_bytes, check, fb in _cases(*_make_images(tmp)):
+            sim.mem[:] = bytes(len(sim.mem))
+            if fb:
+                lcd.EnableFrameBuffer()
+            op(lcd)
+            ok = check(sim)
+            ms, writes, nbytes = _measure(sim, lambda: op(lcd), repeat)
+            if fb:
+                lcd.DisableFrameBuffer()
+            ok = ok and writes <= max_writes and nbytes <= max_bytes
+            results.append((name, ms, writes, nbytes, ok))
+            _report(out, name, ms, writes, max_writes, nbytes, max_bytes, ok)
+    for name, make, op, max_writes, max_bytes in _mono_cases():
+        mono = make()
+        sim = mono._lcd
+        mono.Clear(BLACK)
+        op(mono)
+        ok = sim.mem == mono._buf and sim.pixel(8, 24) == BLACK and WHITE in _region_colors(sim, 8, 24, 63, 39)
+        ms, writes, nbytes = _measure(sim, lambda: op(mono), repeat)
+        ok = ok and writes <= max_writes and nbytes <= max_bytes
+        results.append((name, ms, writes, nbytes, ok))
+        _report(out, name, ms, writes, max_writes, nbytes, max_bytes, ok)
+    return results
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='LCD rendering benchmark on a simulated machine.LCD')
+    parser.add_argument('-n', '--repeat', type=int, default=20, help='iterations per case')
+    args = parser.parse_args()
+    print('{:<34}{:>9}{:>14}{:>18}'.format('case', 'ms/op', 'writes/op', 'bytes/op'))
+    results = run(args.repeat)
+    failed = [r[0] for r in results if not r[4]]
+    if failed:
+        print('FAILED: ' + ', '.join(failed))
+        sys.exit(1)
+    print('all {} cases passed'.format(len(results)))
@@ -0,0 +1,395 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+QuecPython machine模块的主机端替身,用于在CPython上运行驱动
+
+I2C/SPI/UART: 传输交给挂在同一编号总线上的芯片模型(见sim.py、chips.py),记录传输并推进虚拟时钟
+Pin/ExtInt: 引脚电平保存在sim.pins中,sim.set_pin产生的边沿触发ExtInt回调
+LCD: 记录lcd_write调用次数、发送的字节数和窗口设置次数,并在内存中保存RGB565显存用于校验
+'''
+
+import sim
+
+_GPIO_COUNT = 60
+
+
+def _gpio_consts(cls):
+    for n in range(1, _GPIO_COUNT + 1):
+        setattr(cls, 'GPIO{}'.format(n), n)
+    return cls
+
+
+class I2C(object):
+    '''
+    模拟的I2C,从机地址上没有挂模型时读写返回-1(相当于NACK)
+    '''
+    I2C0 = 0
+    I2C1 = 1
+    I2C2 = 2
+    STANDARD_MODE = 0
+    FAST_MODE = 1
+    _FREQ = (100000, 400000)
+
+    def __init__(self, bus_id, mode=STANDARD_MODE):
+        self._bus = sim.i2c_bus(bus_id)
+        self._freq = self._FREQ[1 if mode else 0]
+
+    def _us(self, nbytes):
+        # 每字节8位数据加1位ACK,另加起始和停止位
+        return (nbytes * 9 + 2) * 1000000 // self._freq
+
+    def read(self, slaveaddress, addr, addr_len, r_data, datalen, delay=0):
+        reg = bytes(addr[:addr_len]) if addr_len else b''
+        dev = self._bus.devices.get(slaveaddress)
+        if dev is None:
+            self._bus.record('r', slaveaddress, reg, b'', -1, self._us(1))
+            return -1
+        us = self._us(1 + datalen)
+        if reg:
+            # 写寄存器地址后等待delay毫秒再读
+            us += self._us(1 + addr_len)
+            sim.clock.advance(delay * 1000)
+        data = bytes(dev.i2c_read(reg, datalen))
+        r_data[:datalen] = data[:datalen]
+        self._bus.record('r', slaveaddress, reg, data[:datalen], 0, us)
+        return 0
+
+    def write(self, slaveaddress, addr, addr_len, data, datalen):
+        reg = bytes(addr[:addr_len]) if addr_len else b''
+        payload = bytes(data[:datalen])
+        dev = self._bus.devices.get(slaveaddress)
+        ret = -1 if dev is None else 0
+        if dev is not None:
+            dev.i2c_write(reg, payload)
+        self._bus.record('w', slaveaddress, reg, payload, ret, self._us(1 + addr_len + datalen))
+        return ret
+
+
+class SPI(object):
+    '''
+    模拟的SPI,每个端口挂一个模型,模型的spi_transfer返回与发送等长的数据
+    '''
+    # clk参数对应的时钟频率
+    _FREQ = (812500, 1625000, 3250000, 6500000, 13000000, 26000000, 52000000)
+
+    def __init__(self, port, mode=0, clk=0):
+        self._bus = sim.spi_bus(port)
+        self._freq = self._FREQ[clk] if 0 <= clk < len(self._FREQ) else self._FREQ[0]
+
+    def _transfer(self, w_data, datalen):
+        out = bytes(w_data[:datalen])
+        dev = self._bus.devices.get(0)
+        if dev is None:
+            self._bus.record('x', 0, b'', out, -1, 0)
+            return None
+        r = dev.spi_transfer(out)
+        self._bus.record('x', 0, b'', out, 0, datalen * 8 * 1000000 // self._freq)
+        return r
+
+    def write(self, data, datalen):
+        return 0 if self._transfer(data, datalen) is not None else -1
+
+    def read(self, recv_data, datalen):
+        r = self._transfer(bytes(datalen), datalen)
+        if r is None:
+            return -1
+        recv_data[:datalen] = r[:datalen]
+        return 0
+
+    def write_read(self, r_data, data, datalen):
+        r = self._transfer(data, datalen)
+        if r is None:
+            return -1
+        r_data[:datalen] = r[:datalen]
+        return 0
+
+
+class UART(object):
+    '''
+    模拟的UART,写入的数据交给模型的uart_receive,返回的应答放入接收缓冲
+    '''
+    UART0 = 0
+    UART1 = 1
+    UART2 = 2
+    UART3 = 3
+
+    def __init__(self, uartn, buadrate=115200, databits=8, parity=0, stopbit=1, flowctl=0):
+        self._bus = sim.uart_bus(uartn)
+        self._port = uartn
+        # 起始位 + 数据位 + 校验位 + 停止位
+        self._char_us = (1 + databits + (1 if parity else 0) + stopbit) * 1000000 // buadrate
+        self._rx = bytearray()
+        self._callback = None
+
+    def write(self, data):
+        data = bytes(data)
+        dev = self._bus.devices.get(0)
+        reply = dev.uart_receive(data) if dev is not None else b''
+        self._bus.record('w', 0, b'', data, 0, len(data) * self._char_us)
+        if reply:
+            self._bus.record('r', 0, b'', reply, 0, len(reply) * self._char_us)
+            self._rx.extend(reply)
+            if self._callback is not None:
+                self._callback([0, self._port, len(self._rx)])
+        return len(data)
+
+    def any(self):
+        return len(self._rx)
+
+    def read(self, nbytes=None):
+        if nbytes is None or nbytes > len(self._rx):
+            nbytes = len(self._rx)
+        data = bytes(self._rx[:nbytes])
+        del self._rx[:nbytes]
+        return data
+
+    def readline(self):
+        i = self._rx.find(b'\n')
+        return self.read(len(self._rx) if i < 0 else i + 1)
+
+    def set_callback(self, fun):
+        self._callback = fun
+        return 0
+
+    def close(self):
+        return 0
+
+
+@_gpio_consts
+class Pin(object):
+    IN = 0
+    OUT = 1
+    PULL_DISABLE = 0
+    PULL_PU = 1
+    PULL_PD = 2
+
+    def __init__(self, gpio, direction=IN, pull=PULL_DISABLE, level=0):
+        self._gpio = gpio
+        self._dir = direction
+        if direction == self.OUT:
+            sim.set_pin(gpio, level)
+        elif gpio not in sim.pins:
+            sim.pins[gpio] = 1 if pull == self.PULL_PU else 0
+
+    def write(self, value):
+        if self._dir != self.OUT:
+            return -1
+        sim.set_pin(self._gpio, value)
+        return 0
+
+    def read(self):
+        return sim.pins.get(self._gpio, 0)
+
+    def set_dir(self, direction):
+        self._dir = direction
+        return 0
+
+    def get_dir(self):
+        return self._dir
+
+
+@_gpio_consts
+class ExtInt(object):
+    '''
+    模拟的外部中断,回调在sim.set_pin的调用线程中执行,参数为[gpio, 边沿],边沿0为上升沿、1为下降沿
+    '''
+    IRQ_RISING = 0
+    IRQ_FALLING = 1
+    IRQ_RISING_FALLING = 2
+    PULL_DISABLE = 0
+    PULL_PU = 1
+    PULL_PD = 2
+
+    def __init__(self, gpio, mode, pull, callback):
+        self._gpio = gpio
+        self._mode = mode
+        self._callback = callback
+        self._count = [0, 0]
+        if gpio not in sim.pins:
+            sim.pins[gpio] = 1 if pull == self.PULL_PU else 0
+
+    def _edge(self, level):
+        edge = 0 if level else 1
+        if self._mode != self.IRQ_RISING_FALLING and self._mode != edge:
+            return
+        self._count[edge] += 1
+        if self._callback is not None:
+            self._callback([self._gpio, edge])
+
+    def enable(self):
+        sim._irqs[self._gpio] = self
+        return 0
+
+    def disable(self):
+        if sim._irqs.get(self._gpio) is self:
+            del sim._irqs[self._gpio]
+        return 0
+
+    def line(self):
+        return self._gpio
+
+    def read_level(self):
+        return sim.pins.get(self._gpio, 0)
+
+    def read_count(self, is_reset=0):
+        count = list(self._count)
+        if is_reset:
+            self._count = [0, 0]
+        return count
+
+    def count_reset(self):
+        self._count = [0, 0]
+        return 0
+
+
+_WINDOW_PLACEHOLDERS = (0xF0, 0xF1, 0xE0, 0xE1, 0xF2, 0xF3, 0xE2, 0xE3, 0xD0, 0xD1, 0xD2, 0xD3)    # LCDPublic中的窗口占位符
+
+
+class LCD(object):
+    '''
+    模拟的LCD,接口与machine.LCD相同,支持RGB565屏和按页寻址的单色屏(lcd_type为1)
+    单色屏的显存按页存放(宽 * 页数字节),窗口为(起始列, 起始页, 结束列, 结束页);
+    刷新命令(invalid_data)中没有窗口占位符时,与真实屏一样每次都从原点开始写入
+    strict为True时窗口越界或数据长度与窗口不符会抛出ValueError,便于发现驱动的错误
+    '''
+    strict = True
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.mem = bytearray(0)     # RGB565显存,低字节在前
+        self.writes = 0             # lcd_write调用次数
+        self.bytes = 0              # 发送的像素数据字节数
+        self.windows = 0            # 窗口设置次数(lcd_write和lcd_clear各一次)
+        self.cmds = []              # lcd_write_cmd/lcd_write_data的记录: [('cmd'|'data', value, len), ...]
+        self.display_on = False
+        self.brightness = None
+        self.mono = False           # 按页寻址的单色屏
+        self.windowed = True        # 刷新命令是否带窗口占位符
+
+    def lcd_init(self, init_data, width, height, clk=13000, data_line=1, line_num=4, lcd_type=0,
+                 invalid_data=None, display_on=None, display_off=None, set_brightness=None):
+        self.width = width
+        self.height = height
+        self.mono = lcd_type == 1
+        self.windowed = invalid_data is None or any(
+            invalid_data[i] != 2 and invalid_data[i + 2] in _WINDOW_PLACEHOLDERS
+            for i in range(0, len(invalid_data) - 2, 3))
+        if self.mono:
+            self.mem = bytearray(width * ((height + 7) >> 3))
+        else:
+            self.mem = bytearray(width * height * 2)
+        self.display_on = True
+        return 0
+
+    def mipi_init(self, initbuf=None, width=480, hight=854, **kwargs):
+        return self.lcd_init(initbuf, width, hight)
+
+    def lcd_deinit(self):
+        self.display_on = False
+        return 0
+
+    def lcd_write(self, buf, xs, ys, xe, ye):
+        if self.mono:
+            return self._mono_write(buf, xs, ys, xe, ye)
+        w = xe - xs + 1
+        h = ye - ys + 1
+        if self.strict:
+            if not (0 <= xs <= xe < self.width and 0 <= ys <= ye < self.height):
+                raise ValueError('window ({}, {}, {}, {}) out of {}x{}'.format(xs, ys, xe, ye, self.width, self.height))
+            if len(buf) != w * h * 2:
+                raise ValueError('window ({}, {}, {}, {}) needs {} bytes, got {}'.format(xs, ys, xe, ye, w * h * 2, len(buf)))
+        self.writes += 1
+        self.windows += 1
+        self.bytes += len(buf)
+        src = memoryview(buf) if isinstance(buf, (bytes, bytearray, memoryview)) else memoryview(bytes(buf))
+        row = w * 2
+        for r in range(min(h, self.height - ys)):
+            d = ((ys + r) * self.width + xs) * 2
+            n = min(row, (self.width - xs) * 2)
+            self.mem[d:d + n] = src[r * row:r * row + n]
+        return 0
+
+    def _mono_write(self, buf, xs, ys, xe, ye):
+        w = xe - xs + 1
+        pages = len(self.mem) // self.width
+        if self.strict:
+            if not (0 <= xs <= xe < self.width and 0 <= ys <= ye < pages):
+                raise ValueError('window ({}, {}, {}, {}) out of {}x{} pages'.format(xs, ys, xe, ye, self.width, pages))
+            if len(buf) != w * (ye - ys + 1):
+                raise ValueError('window ({}, {}, {}, {}) needs {} bytes, got {}'.format(xs, ys, xe, ye, w * (ye - ys + 1), len(buf)))
+        self.writes += 1
+        self.windows += 1
+        self.bytes += len(buf)
+        src = memoryview(buf) if isinstance(buf, (bytes, bytearray, memoryview)) else memoryview(bytes(buf))
+        if not self.windowed:
+            n = min(len(src), len(self.mem))
+            self.mem[:n] = src[:n]
+            return 0
+        for p in range(ye - ys + 1):
+            d = (ys + p) * self.width + xs
+            self.mem[d:d + w] = src[p * w:p * w + w]
+        return 0
+
+    def lcd_clear(self, color):
+        self.windows += 1
+        if self.mono:
+            self.bytes += len(self.mem)
+            self.mem[:] = (b'\xff' if color & 0xFFFF else b'\x00') * len(self.mem)
+            return 0
+        self.bytes += self.width * self.height * 2
+        self.mem[:] = (color & 0xFFFF).to_bytes(2, 'little') * (self.width * self.height)
+        return 0
+
+    def lcd_write_cmd(self, value, length):
+        self.cmds.append(('cmd', value, length))
+        return 0
+
+    def lcd_write_data(self, value, length):
+        self.cmds.append(('data', value, length))
+        return 0
+
+    def lcd_brightness(self, level):
+        self.brightness = level
+        return 0
+
+    def lcd_display_on(self):
+        self.display_on = True
+        return 0
+
+    def lcd_display_off(self):
+        self.display_on = False
+        return 0
+
+    def lcd_show_jpg(self, name, x, y):
+        return 0
+
+    def pixel(self, x, y):
+        '''
+        读取显存中(x, y)处的RGB565颜色,单色屏点亮为0xFFFF,熄灭为0x0000
+        '''
+        if self.mono:
+            return 0xFFFF if self.mem[(y >> 3) * self.width + x] & (1 << (y & 7)) else 0x0000
+        i = (y * self.width + x) * 2
+        return self.mem[i] | (self.mem[i + 1] << 8)
+
+    def stats(self):
+        return {'writes': self.writes, 'bytes': self.bytes, 'windows': self.windows, 'cmds': len(self.cmds)}
+
+    def reset_stats(self):
+        self.writes = 0
+        self.bytes = 0
+        self.windows = 0
+        self.cmds = []
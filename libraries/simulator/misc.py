@@ -0,0 +1,78 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+QuecPython misc模块的主机端替身: ADC、Power、USB,读数由测试代码设置
+'''
+
+
+class ADC(object):
+    '''
+    values: {通道: 电压mV},由测试代码设置
+    '''
+    ADC0 = 0
+    ADC1 = 1
+    ADC2 = 2
+    ADC3 = 3
+    values = {}
+
+    def open(self):
+        return 0
+
+    def read(self, ADCn):
+        return ADC.values.get(ADCn, 0)
+
+    def close(self):
+        return 0
+
+
+class Power(object):
+    vbatt = 3800            # 电池电压mV
+    power_on_reason = 1
+    down_reason = 0
+
+    @staticmethod
+    def getVbatt():
+        return Power.vbatt
+
+    @staticmethod
+    def getPowerOnReason():
+        return Power.power_on_reason
+
+    @staticmethod
+    def powerDownReason():
+        return Power.down_reason
+
+    @staticmethod
+    def powerDown():
+        return 0
+
+    @staticmethod
+    def powerRestart():
+        return 0
+
+
+class USB(object):
+    status = 1              # 1: 已插入, 0: 未插入
+
+    def __init__(self):
+        self._callback = None
+
+    def getStatus(self):
+        return USB.status
+
+    def setCallback(self, usrFun):
+        self._callback = usrFun
+        return 0
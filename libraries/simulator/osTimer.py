@@ -0,0 +1,56 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+QuecPython osTimer模块的主机端替身,定时器挂在虚拟时钟上,随utime.sleep等推进时钟时触发
+'''
+
+import sim
+
+
+class osTimer(object):
+    def __init__(self):
+        self._period = 0
+        self._periodic = False
+        self._callback = None
+        self.due = 0
+
+    def start(self, initialTime, cyclialEn, callback):
+        '''
+        :param initialTime: 定时时长(毫秒)
+        :param cyclialEn: 1为周期定时器,0为单次
+        :param callback: 到期回调,参数为定时器对象
+        '''
+        self._period = max(1, initialTime) * 1000
+        self._periodic = bool(cyclialEn)
+        self._callback = callback
+        self.due = sim.clock.now + self._period
+        sim.clock.add_timer(self)
+        return 0
+
+    def stop(self):
+        sim.clock.remove_timer(self)
+        return 0
+
+    def delete_timer(self):
+        return self.stop()
+
+    def fire(self):
+        if self._periodic:
+            self.due += self._period
+        else:
+            sim.clock.remove_timer(self)
+        if self._callback is not None:
+            self._callback(self)
@@ -0,0 +1,217 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+主机端模拟环境的公共部分: 虚拟时钟、总线、引脚电平
+
+虚拟时钟
+    utime.sleep*、osTimer和总线传输都只推进虚拟时钟,不真正等待,
+    驱动中的延时和轮询因此可以在主机上瞬间完成,且耗时可重复、可比较。
+    总线传输按速率推进时钟(如I2C每字节9位),i2c.read的delay参数按毫秒推进。
+
+总线
+    同一编号的machine.I2C/SPI/UART对象共用一个Bus,与设备上多个驱动共用一条总线的情况一致。
+    芯片模型(chips.py)通过attach挂到总线上;每次传输记录到该总线的log中。
+
+引脚
+    Pin.write与set_pin修改同一份电平表,电平变化时触发对应的ExtInt回调。
+'''
+
+import sys
+import threading
+import collections
+
+_LOG_LEN = 4096     # 每条总线保留的传输记录条数
+
+
+class Clock(object):
+    '''
+    虚拟时钟,单位为微秒
+    '''
+    def __init__(self):
+        self.now = 0
+        self._timers = []
+        self._lock = threading.RLock()
+
+    def advance(self, us):
+        '''
+        推进时钟,并依次触发到期的定时器(定时器回调中可以再次推进时钟)
+        '''
+        with self._lock:
+            end = self.now + max(0, int(us))
+            while True:
+                due = [t for t in self._timers if t.due <= end]
+                if not due:
+                    break
+                t = min(due, key=lambda t: t.due)
+                self.now = max(self.now, t.due)
+                t.fire()
+                end = max(end, self.now)
+            self.now = end
+
+    def add_timer(self, timer):
+        if timer not in self._timers:
+            self._timers.append(timer)
+
+    def remove_timer(self, timer):
+        if timer in self._timers:
+            self._timers.remove(timer)
+
+
+Transaction = collections.namedtuple('Transaction', ('time', 'op', 'addr', 'reg', 'data', 'ret'))
+
+
+class Bus(object):
+    '''
+    一条模拟总线
+    devices: I2C为{从机地址: 模型},SPI、UART只挂一个模型,键为0
+    log: 最近的传输记录,每条为Transaction(时间us, 操作, 从机地址, 寄存器, 数据, 返回值)
+    '''
+    def __init__(self, kind, bus_id):
+        self.kind = kind
+        self.id = bus_id
+        self.devices = {}
+        self.log = collections.deque(maxlen=_LOG_LEN)
+        self.transactions = 0
+        self.bytes = 0
+        self.busy_us = 0
+
+    def attach(self, model, addr=0):
+        self.devices[addr] = model
+        model.bus = self
+        return model
+
+    def detach(self, addr=0):
+        self.devices.pop(addr, None)
+
+    def record(self, op, addr, reg, data, ret, us):
+        '''
+        记录一次传输并按传输耗时推进虚拟时钟
+        '''
+        self.log.append(Transaction(clock.now, op, addr, bytes(reg), bytes(data), ret))
+        self.transactions += 1
+        self.bytes += len(reg) + len(data)
+        self.busy_us += us
+        clock.advance(us)
+
+    def stats(self):
+        return {'transactions': self.transactions, 'bytes': self.bytes, 'busy_us': self.busy_us}
+
+    def reset_stats(self):
+        self.log.clear()
+        self.transactions = 0
+        self.bytes = 0
+        self.busy_us = 0
+
+
+clock = Clock()
+_buses = {}
+pins = {}           # {gpio: 电平}
+_irqs = {}          # {gpio: ExtInt}
+
+
+def bus(kind, bus_id):
+    '''
+    获取编号为bus_id的总线,kind为'i2c'、'spi'或'uart'
+    '''
+    key = (kind, bus_id)
+    if key not in _buses:
+        _buses[key] = Bus(kind, bus_id)
+    return _buses[key]
+
+
+def i2c_bus(bus_id):
+    return bus('i2c', bus_id)
+
+
+def spi_bus(bus_id):
+    return bus('spi', bus_id)
+
+
+def uart_bus(bus_id):
+    return bus('uart', bus_id)
+
+
+def buses():
+    return list(_buses.values())
+
+
+def set_pin(gpio, level):
+    '''
+    设置引脚电平(模拟外部信号),电平变化时触发该引脚上已使能的ExtInt
+    '''
+    old = pins.get(gpio, 0)
+    pins[gpio] = 1 if level else 0
+    irq = _irqs.get(gpio)
+    if irq is not None and old != pins[gpio]:
+        irq._edge(pins[gpio])
+
+
+def reset():
+    '''
+    清空虚拟时钟、总线、引脚和中断,用于在同一进程中运行互不影响的测试
+    '''
+    global clock
+    clock = Clock()
+    _buses.clear()
+    pins.clear()
+    _irqs.clear()
+
+
+class _ThreadModule(object):
+    '''
+    QuecPython的_thread模块: 在CPython的_thread上补齐stack_size的取值范围和stop_thread等接口
+    '''
+    def __init__(self, real):
+        self._real = real
+        self._stack_size = 0
+        self._stopped = set()
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+    def stack_size(self, size=None):
+        old = self._stack_size
+        if size is not None:
+            self._stack_size = size
+        return old
+
+    def start_new_thread(self, function, args, kwargs=None):
+        return self._real.start_new_thread(function, tuple(args), kwargs or {})
+
+    def stop_thread(self, ident):
+        # CPython无法强制结束线程,只记录下来;驱动的线程应在循环中自行检查
+        self._stopped.add(ident)
+        return 0
+
+    def threadIsRunning(self, ident):
+        return ident not in self._stopped
+
+    def get_heap_size(self):
+        return 1 << 20
+
+    def delete_lock(self, lock):
+        return 0
+
+
+def install():
+    '''
+    用QuecPython接口的_thread替换sys.modules中的_thread。
+    _thread是CPython的内置模块,放在sys.path上的同名文件不会生效,因此在usr包导入时调用本函数。
+    '''
+    mod = sys.modules.get('_thread')
+    if not isinstance(mod, _ThreadModule):
+        import _thread
+        sys.modules['_thread'] = _ThreadModule(_thread)
@@ -0,0 +1,37 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''
+设备上的驱动文件都放在/usr下,以usr.X的形式互相导入。
+主机上把libraries下的各驱动目录(及其一级子目录,如LCD/ST7789)加入本包的搜索路径,
+使from usr.LCD import Peripheral_LCD等导入语句无需修改即可运行。
+同时换上QuecPython接口的_thread(见sim.install),驱动在本包之后导入_thread时得到的就是它。
+'''
+
+import os
+import sim
+
+sim.install()
+
+_LIBRARIES = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+for _name in sorted(os.listdir(_LIBRARIES)):
+    _dir = os.path.join(_LIBRARIES, _name)
+    if not os.path.isdir(_dir) or _name == 'simulator':
+        continue
+    __path__.append(_dir)
+    for _sub in sorted(os.listdir(_dir)):
+        _subdir = os.path.join(_dir, _sub)
+        if os.path.isdir(_subdir) and not _sub.startswith('__'):
+            __path__.append(_subdir)
@@ -0,0 +1,77 @@
+# Copyright (c) Quectel Wireless Solution, Co., Ltd.All Rights Reserved.
+#  
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#  
+#     http://www.apache.org/licenses/LICENSE-2.0
+#  
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+'''
+QuecPython utime模块的主机端替身,时间取自虚拟时钟(sim.clock),sleep只推进虚拟时钟不真正等待
+'''
+
+import time as _time
+import sim
+
+_EPOCH = 946684800      # 2000-01-01 00:00:00 UTC,QuecPython的时间起点
+_start = int(_time.time()) - _EPOCH
+
+
+def _sleep_us(us):
+    sim.clock.advance(us)
+    # 让出CPU,使驱动的其他线程有机会运行
+    _time.sleep(0)
+
+
+def sleep(seconds):
+    _sleep_us(seconds * 1000000)
+
+
+def sleep_ms(ms):
+    _sleep_us(ms * 1000)
+
+
+def sleep_us(us):
+    _sleep_us(us)
+
+
+def ticks_us():
+    return sim.clock.now
+
+
+def ticks_ms():
+    return sim.clock.now // 1000
+
+
+def ticks_cpu():
+    return sim.clock.now
+
+
+def ticks_diff(ticks1, ticks2):
+    return ticks1 - ticks2
+
+
+def ticks_add(ticks, delta):
+    return ticks + delta
+
+
+def time():
+    return _start + sim.clock.now // 1000000
+
+
+def localtime(secs=None):
+    if secs is None:
+        secs = time()
+    t = _time.gmtime(secs + _EPOCH)
+    return (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec, t.tm_wday, t.tm_yday)
+
+
+def mktime(date):
+    return int(_time.mktime(tuple(date[:6]) + (0, 0, -1))) - _time.timezone - _EPOCH